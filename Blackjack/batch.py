@@ -0,0 +1,216 @@
+"""
+Batch is a NumPy Monte Carlo engine that plays millions of hands at once under a fixed player strategy. Every hand is a
+row in a set of arrays, and each round of play is a handful of array operations across all of the rows, rather than a
+trip through Game, Player and Dealer for every hand.
+
+The rules are those of Game exactly:
+    The player and the dealer are dealt two cards each
+    Each round the player moves, then the dealer moves. The dealer hits below 17, as in Dealer.take_turn
+    The hand ends when the player busts, the dealer busts, or both stand
+    Hands are scored as in Game._evaluate, where a natural 21 beats a 21 of three or more cards
+The player hits below stand_on, and doubles down on the first move if their total is in double_totals. The bankroll is
+assumed to always cover a double down.
+
+Each shoe is shuffled and cut into fixed blocks of cards, one block per hand, so every hand is a fresh sample from a
+full shoe. No cards carry over from one hand to the next, so unlike a Shoe there is no cut card, and penetration has no
+effect.
+
+The module's external interface shall consist of
+BatchResult - the results of a batch of hands
+simulate_batch() - plays a batch of hands and returns a BatchResult
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .card import DECK
+from .result import Result
+
+# The rank of each card as the engine stores it: aces are 1, everything else is its score
+_RANKS: np.ndarray = np.array(
+    [1 if card.value.score == 0 else card.value.score for card in DECK], dtype=np.int8
+)
+_RESULT_CODES: tuple[Result, ...] = (Result.VICTORY, Result.DEFEAT, Result.PUSH)
+
+
+class BatchResult:
+    """
+    BatchResult holds the result and the net change to the bankroll of every hand in a batch. Results are stored as
+    the integer value of the Result enum.
+    """
+
+    def __init__(self, results: np.ndarray, net_change: np.ndarray):
+        self.results: np.ndarray = results
+        self.net_change: np.ndarray = net_change
+
+    @property
+    def hands(self) -> int:
+        """The number of hands in the batch."""
+        return len(self.results)
+
+    @property
+    def counts(self) -> dict[Result, int]:
+        """The number of hands with each result."""
+        return {result: int(np.count_nonzero(self.results == result.value)) for result in _RESULT_CODES}
+
+    @property
+    def mean(self) -> float:
+        """The mean net change per hand."""
+        return float(self.net_change.mean()) if self.hands else 0.0
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the net change per hand."""
+        return float(self.net_change.var(ddof=1)) if self.hands > 1 else 0.0
+
+
+def _totals(hard: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """
+    _totals applies the ace rule of Hand.get_total to whole arrays: one ace counts as 11 if that does not bust the hand
+    :param hard: the totals with every ace counted as 1
+    :param aces: the number of aces in each hand
+    :return: the totals of the hands
+    """
+    return np.where((aces > 0) & (hard <= 11), hard + 10, hard)
+
+
+def _draw_cards(
+    rng: np.random.Generator, hands: int, cards_needed: int, decks: Optional[int]
+) -> np.ndarray:
+    """
+    _draw_cards deals cards_needed cards for each hand. Shoes are shuffled and cut into as many blocks of cards_needed
+    cards as they hold, and each hand is dealt from its own block
+    :param rng: the random number generator
+    :param hands: the number of hands
+    :param cards_needed: the number of cards to deal for each hand
+    :param decks: the number of decks in each shoe, or None to draw from an infinite deck
+    :return: an array of ranks with one row per hand
+    """
+    if decks is None:
+        return rng.choice(_RANKS, size=(hands, cards_needed))
+    shoe_size = 52 * decks
+    blocks_per_shoe = shoe_size // cards_needed
+    shoes = -(-hands // blocks_per_shoe)
+    shuffled = rng.permuted(np.tile(np.tile(_RANKS, decks), (shoes, 1)), axis=1)
+    blocks = shuffled[:, : blocks_per_shoe * cards_needed]
+    return blocks.reshape(shoes * blocks_per_shoe, cards_needed)[:hands]
+
+
+def _play_chunk(
+    rng: np.random.Generator,
+    hands: int,
+    stand_on: int,
+    double_totals: np.ndarray,
+    decks: Optional[int],
+    bet: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    _play_chunk plays a single chunk of hands to completion
+    :return: a tuple of the result codes and the net changes of the hands
+    """
+    # The player can take at most stand_on cards and the dealer at most 17 before both must stop
+    cards_needed = stand_on + 18
+    if decks is not None:
+        cards_needed = min(cards_needed, 52 * decks)
+    cards = _draw_cards(rng, hands, cards_needed, decks)
+    rows = np.arange(hands)
+
+    player_hard = cards[:, 0].astype(np.int16) + cards[:, 2]
+    player_aces = (cards[:, 0] == 1).astype(np.int16) + (cards[:, 2] == 1)
+    dealer_hard = cards[:, 1].astype(np.int16) + cards[:, 3]
+    dealer_aces = (cards[:, 1] == 1).astype(np.int16) + (cards[:, 3] == 1)
+    player_size = np.full(hands, 2, dtype=np.int16)
+    dealer_size = np.full(hands, 2, dtype=np.int16)
+    next_card = np.full(hands, 4, dtype=np.int16)
+    bets = np.full(hands, bet, dtype=np.int64)
+    player_can_move = np.ones(hands, dtype=bool)
+    running = np.ones(hands, dtype=bool)
+
+    while running.any():
+        # Player's move
+        player_total = _totals(player_hard, player_aces)
+        moving = running & player_can_move
+        doubling = moving & (player_size == 2) & np.isin(player_total, double_totals)
+        hitting = moving & ~doubling & (player_total < stand_on)
+        drawing = doubling | hitting
+        player_stands = running & ~hitting
+        card = cards[rows, np.minimum(next_card, cards_needed - 1)]
+        player_hard = player_hard + np.where(drawing, card, 0)
+        player_aces = player_aces + (drawing & (card == 1))
+        player_size = player_size + drawing
+        next_card = next_card + drawing
+        bets = np.where(doubling, bets * 2, bets)
+        player_can_move = player_can_move & hitting
+        player_busted = drawing & (_totals(player_hard, player_aces) > 21)
+        running = running & ~player_busted
+
+        # Dealer's move
+        dealer_hits = running & (_totals(dealer_hard, dealer_aces) < 17)
+        card = cards[rows, np.minimum(next_card, cards_needed - 1)]
+        dealer_hard = dealer_hard + np.where(dealer_hits, card, 0)
+        dealer_aces = dealer_aces + (dealer_hits & (card == 1))
+        dealer_size = dealer_size + dealer_hits
+        next_card = next_card + dealer_hits
+        dealer_busted = dealer_hits & (_totals(dealer_hard, dealer_aces) > 21)
+        running = running & ~dealer_busted & ~(player_stands & ~dealer_hits)
+
+    player_total = _totals(player_hard, player_aces)
+    dealer_total = _totals(dealer_hard, dealer_aces)
+    player_natural = player_size == 2
+    dealer_natural = dealer_size == 2
+    both_21 = (player_total == 21) & (dealer_total == 21)
+    # The same order of priority as Game._evaluate: a player bust, then a dealer bust, then a natural, then the totals
+    player_busted = player_total > 21
+    dealer_busted = ~player_busted & (dealer_total > 21)
+    contested = ~player_busted & ~dealer_busted
+    victory = dealer_busted | (
+        contested & np.where(both_21, player_natural & ~dealer_natural, player_total > dealer_total)
+    )
+    defeat = player_busted | (
+        contested & np.where(both_21, ~player_natural & dealer_natural, player_total < dealer_total)
+    )
+    results = np.full(hands, Result.PUSH.value, dtype=np.int8)
+    results[victory] = Result.VICTORY.value
+    results[defeat] = Result.DEFEAT.value
+    net_change = np.where(victory, bets, np.where(defeat, -bets, 0))
+    return results, net_change
+
+
+def simulate_batch(
+    hands: int,
+    stand_on: int = 17,
+    double_totals: Iterable[int] = (),
+    decks: Optional[int] = 6,
+    bet: int = 1,
+    rng: Optional[np.random.Generator] = None,
+    chunk_size: int = 65536,
+) -> BatchResult:
+    """
+    simulate_batch plays a number of hands under a fixed strategy, a chunk of hands at a time
+    :param hands: the number of hands to play
+    :param stand_on: the player hits while their total is below this, between 2 and 21
+    :param double_totals: the totals on which the player doubles down on their first move
+    :param decks: the number of decks in each shoe, or None to draw from an infinite deck
+    :param bet: the ante for every hand
+    :param rng: the random number generator. If None, a new unseeded generator is created. This is dependency injection
+    :param chunk_size: the number of hands played at once, which bounds the memory used
+    :return: the results of every hand
+    """
+    if not 2 <= stand_on <= 21:
+        raise ValueError(f"stand_on must be between 2 and 21, got {stand_on}")
+    if decks is not None and decks <= 0:
+        raise ValueError(f"A shoe needs at least one deck, got {decks}")
+    if bet <= 0:
+        raise ValueError(f"bet must be greater than zero, got {bet}")
+    if rng is None:
+        rng = np.random.default_rng()
+    doubles = np.array(sorted(set(double_totals)), dtype=np.int16)
+    results = np.empty(hands, dtype=np.int8)
+    net_change = np.empty(hands, dtype=np.int64)
+    for start in range(0, hands, chunk_size):
+        count = min(chunk_size, hands - start)
+        chunk_results, chunk_net = _play_chunk(rng, count, stand_on, doubles, decks, bet)
+        results[start : start + count] = chunk_results
+        net_change[start : start + count] = chunk_net
+    return BatchResult(results, net_change)
@@ -0,0 +1,247 @@
+"""
+Benchmark measures the speed of the game's hot paths, so that a change that slows one of them down is visible. Each
+benchmark is timed several times and the best time is kept, as the slower runs only measure interference from the rest
+of the machine.
+
+The measurements are compared against a stored baseline, kept alongside this module in benchmark_baseline.json. The
+baseline is only meaningful on the machine that recorded it, so record a fresh one before comparing on a new machine.
+
+To compare against the stored baseline, or to record a new one, run
+python -m Blackjack.benchmark
+python -m Blackjack.benchmark --save
+
+The module's external interface shall consist of
+BENCHMARKS - the name, unit and direction of every benchmark
+Comparison - one benchmark measured against its baseline
+run_benchmarks() - measures every benchmark
+save_baseline(), load_baseline() - write and read a baseline
+compare() - measures against a baseline, flagging regressions
+format_report() - lays out a comparison as a table
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, Optional
+
+from .card import Card
+from .dealer import Dealer
+from .game import Game, generate_deck
+from .hand import Hand
+from .player import Player, load_player, save_player
+from .policy import DealerMimicPolicy
+from .shoe import Shoe
+from .suit import Suit
+from .value import Value
+
+BASELINE_PATH: Path = Path(__file__).with_name("benchmark_baseline.json")
+
+# Each benchmark's unit, and True if a higher measurement is better
+BENCHMARKS: dict[str, tuple[str, bool]] = {
+    "new_hand": ("hands/s", True),
+    "get_total": ("ns/call", False),
+    "generate_deck": ("ns/call", False),
+    "evaluate": ("ns/call", False),
+    "load_player": ("us/call", False),
+    "save_player": ("us/call", False),
+}
+
+_REPEAT: int = 5
+
+
+def _best_time(function: Callable[[], object], number: int) -> float:
+    """
+    _best_time calls a function many times over, several times, and keeps the fastest
+    :param function: the function to time, which takes no arguments
+    :param number: the number of calls in each timing
+    :return: the best time per call, in seconds
+    """
+    return min(timeit.Timer(function).repeat(repeat=_REPEAT, number=number)) / number
+
+
+def _make_hand(*values: Value) -> Hand:
+    hand = Hand()
+    for value in values:
+        hand.add_card(Card(Suit.SPADES, value))
+    return hand
+
+
+def _new_hand(number: int) -> float:
+    player = Player.from_name_bankroll("Benchmark", 1_000_000)
+    game = Game(player, deck=Shoe(rng=random.Random(0)), policy=DealerMimicPolicy())
+
+    def play() -> None:
+        for _ in range(number):
+            game.new_hand()
+
+    return 1 / _best_time(play, 1) * number
+
+
+def _get_total(number: int) -> float:
+    hand = _make_hand(Value.ACE, Value.SEVEN, Value.FIVE)
+    return _best_time(hand.get_total, number) * 1e9
+
+
+def _generate_deck(number: int) -> float:
+    return _best_time(generate_deck, number) * 1e9
+
+
+def _evaluate(number: int) -> float:
+    game = Game(Player.from_name_bankroll("Benchmark", 100), Dealer(), generate_deck())
+    game.player.hand = _make_hand(Value.KING, Value.SEVEN)
+    game.dealer.hand = _make_hand(Value.NINE, Value.NINE)
+    return _best_time(game._evaluate, number) * 1e9
+
+
+def _load_player(number: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.blackjack"
+        save_player(Player.from_name_bankroll("Benchmark", 100), path)
+        return _best_time(lambda: load_player(path), number) * 1e6
+
+
+def _save_player(number: int) -> float:
+    player = Player.from_name_bankroll("Benchmark", 100)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.blackjack"
+        return _best_time(lambda: save_player(player, path), number) * 1e6
+
+
+# Each benchmark's function, and the number of calls it times at a scale of one
+_RUNNERS: dict[str, tuple[Callable[[int], float], int]] = {
+    "new_hand": (_new_hand, 2_000),
+    "get_total": (_get_total, 1_000_000),
+    "generate_deck": (_generate_deck, 20_000),
+    "evaluate": (_evaluate, 200_000),
+    "load_player": (_load_player, 2_000),
+    "save_player": (_save_player, 500),
+}
+
+
+def run_benchmarks(scale: float = 1.0, names: Optional[list[str]] = None) -> dict[str, float]:
+    """
+    run_benchmarks measures each benchmark
+    :param scale: scales the number of calls timed. Lower is quicker but noisier
+    :param names: the benchmarks to run. If None, every benchmark is run
+    :return: a dictionary from benchmark name to measurement, in the units of BENCHMARKS
+    """
+    if scale <= 0:
+        raise ValueError(f"scale must be greater than zero, got {scale}")
+    if names is None:
+        names = list(BENCHMARKS)
+    results = {}
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark {name}")
+        runner, number = _RUNNERS[name]
+        results[name] = runner(max(1, int(number * scale)))
+    return results
+
+
+def save_baseline(results: dict[str, float], path: Path = BASELINE_PATH) -> None:
+    """
+    save_baseline writes measurements to a JSON file, to be compared against later
+    :param results: the measurements, as from run_benchmarks
+    :param path: the filepath to save to
+    """
+    with open(path, "w") as file:
+        json.dump({name: round(value, 1) for name, value in results.items()}, file, indent=4)
+        file.write("\n")
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, float]:
+    """
+    load_baseline reads measurements saved by save_baseline
+    :param path: the filepath to load from
+    :return: a dictionary from benchmark name to measurement
+    """
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+class Comparison:
+    """
+    Comparison holds one benchmark's measurement against its baseline. change is the fractional improvement, positive
+    when the benchmark got faster whichever its unit, and None if there is no baseline to compare against.
+    """
+
+    def __init__(self, name: str, current: float, baseline: Optional[float], tolerance: float):
+        """
+        :param name: the benchmark name, as in BENCHMARKS
+        :param current: the new measurement
+        :param baseline: the baseline measurement, or None if the baseline does not have this benchmark
+        :param tolerance: the fraction the benchmark may slow down by before it counts as a regression
+        """
+        self.name: str = name
+        self.unit: str = BENCHMARKS[name][0]
+        self.current: float = current
+        self.baseline: Optional[float] = baseline
+        self.change: Optional[float] = None
+        if baseline:
+            if BENCHMARKS[name][1]:
+                self.change = current / baseline - 1
+            else:
+                self.change = baseline / current - 1
+        self.regressed: bool = self.change is not None and self.change < -tolerance
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float = 0.1) -> list[Comparison]:
+    """
+    compare matches each measurement to its baseline
+    :param results: the new measurements, as from run_benchmarks
+    :param baseline: the baseline measurements, as from load_baseline
+    :param tolerance: the fraction a benchmark may slow down by before it counts as a regression
+    :return: a comparison for each measurement, in the order of results
+    """
+    if tolerance < 0:
+        raise ValueError(f"tolerance cannot be negative, got {tolerance}")
+    return [Comparison(name, current, baseline.get(name), tolerance) for name, current in results.items()]
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    """
+    format_report lays out comparisons as a table, one benchmark to a line, marking every regression
+    :param comparisons: the comparisons, as from compare
+    :return: the report
+    """
+    lines = [f"{'benchmark':<16}{'baseline':>14}{'current':>14}  {'unit':<9}{'change':>9}"]
+    for comparison in comparisons:
+        baseline = "-" if comparison.baseline is None else f"{comparison.baseline:,.1f}"
+        change = "-" if comparison.change is None else f"{comparison.change:+.1%}"
+        flag = "  REGRESSION" if comparison.regressed else ""
+        lines.append(
+            f"{comparison.name:<16}{baseline:>14}{comparison.current:>14,.1f}  {comparison.unit:<9}{change:>9}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """
+    main runs the benchmarks from the command line, and either saves them as the baseline or reports on them
+    :param arguments: the command line arguments. If None, they are read from sys.argv
+    :return: the exit status: 1 if any benchmark regressed, otherwise 0
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths")
+    parser.add_argument("--save", action="store_true", help="record the measurements as the new baseline")
+    parser.add_argument("--scale", type=float, default=1.0, help="scale the number of calls timed")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="slowdown allowed before a regression")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="the baseline file")
+    options = parser.parse_args(arguments)
+
+    results = run_benchmarks(options.scale)
+    if options.save:
+        save_baseline(results, options.baseline)
+        print(f"Saved baseline to {options.baseline}")
+        return 0
+    baseline = load_baseline(options.baseline) if options.baseline.exists() else {}
+    comparisons = compare(results, baseline, options.tolerance)
+    print(format_report(comparisons))
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Bulk moves every player's stats into or out of a PlayerStore in one pass, for onboarding and auditing many players at
+once. Players are streamed one line at a time and saved in batches, so memory use stays the same however many players
+there are.
+
+Two file formats are supported, chosen by the file's suffix. A .jsonl file holds one JSON object of stats per line, as
+save_player writes them. A .csv file has a header row of STAT_FIELDS and one row per player. Every imported row is
+checked against the stats Player.from_name_bankroll creates before anything is saved from its batch.
+
+To export every player from the menu's store, or import them back, run
+python -m Blackjack.bulk export players.jsonl
+python -m Blackjack.bulk import players.jsonl
+
+The module's external interface shall consist of
+STAT_FIELDS - the stats every player has, in file order
+validate_stats() - checks a player's stats, returning them with any CSV text converted
+TransferReport - the number of players moved, and how quickly
+export_players(), import_players() - stream players out of and into a store
+main() - the command line interface
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional, TextIO
+
+from .main_menu import STORE_PATH
+from .player import Player
+from .player_store import PlayerStore, SQLitePlayerStore
+
+STAT_FIELDS: tuple[str, ...] = ("name", "bankroll", "wins", "losses", "pushes")
+
+_FORMATS: tuple[str, ...] = (".jsonl", ".csv")
+
+
+def validate_stats(stats: dict, from_text: bool = False) -> dict:
+    """
+    validate_stats checks that a player's stats are a dictionary with exactly the fields of STAT_FIELDS, a name that is
+    not blank and counts that are whole numbers no less than zero
+    :param stats: the stats to check
+    :param from_text: if True, the counts may be given as text, as they are read from a CSV file
+    :return: the stats, with counts given as text converted to integers
+    """
+    if not isinstance(stats, dict):
+        raise ValueError(f"A player's stats must be an object of fields, got {stats!r}")
+    if set(stats) != set(STAT_FIELDS):
+        missing = sorted(set(STAT_FIELDS) - set(stats))
+        unknown = sorted(set(stats) - set(STAT_FIELDS))
+        raise ValueError(f"Stats must have the fields {', '.join(STAT_FIELDS)}; missing {missing}, unknown {unknown}")
+    name = stats["name"]
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"A player's name must be text that is not blank, got {name!r}")
+    validated = {"name": name}
+    for field in STAT_FIELDS[1:]:
+        count = stats[field]
+        if from_text and isinstance(count, str) and count.strip().isdigit():
+            count = int(count)
+        if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+            raise ValueError(f"{field} must be a whole number no less than zero, got {count!r}")
+        validated[field] = count
+    return validated
+
+
+class TransferReport:
+    """
+    TransferReport holds the number of players moved by an export or import, and the time it took.
+    """
+
+    def __init__(self, players: int, seconds: float):
+        self.players: int = players
+        self.seconds: float = seconds
+
+    @property
+    def rate(self) -> float:
+        """The number of players moved per second."""
+        return self.players / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self):
+        return f"{self.players:,} players in {self.seconds:.2f}s ({self.rate:,.0f} players/s)"
+
+
+def _file_format(path: Path) -> str:
+    """
+    :param path: a bulk file
+    :return: the file's suffix, once it is checked to be a supported format
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in _FORMATS:
+        raise ValueError(f"Unsupported bulk file {path}; use one of {', '.join(_FORMATS)}")
+    return suffix
+
+
+def _read_rows(file: TextIO, suffix: str) -> Iterator[dict]:
+    """
+    _read_rows yields each player's stats from a bulk file, validated. A row that fails validation raises a ValueError
+    naming its line
+    """
+    if suffix == ".csv":
+        reader = csv.DictReader(file)
+        for row in reader:
+            try:
+                yield validate_stats(row, from_text=True)
+            except ValueError as error:
+                raise ValueError(f"Line {reader.line_num}: {error}") from None
+        return
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield validate_stats(json.loads(line))
+        except ValueError as error:
+            raise ValueError(f"Line {line_number}: {error}") from None
+
+
+def _export_row(player: Player) -> dict:
+    """
+    :param player: a player to export
+    :return: the player's stats in STAT_FIELDS order, with 0 for any stat the player does not have yet
+    """
+    return {field: player.stats.get(field, 0) for field in STAT_FIELDS}
+
+
+def export_players(
+    store: PlayerStore,
+    path: Path,
+    clock: Callable[[], float] = time.perf_counter,
+) -> TransferReport:
+    """
+    export_players writes every player in a store to a bulk file, one player at a time
+    :param store: the store to export from
+    :param path: the file to write, ending in .jsonl or .csv
+    :param clock: returns the current time in seconds, for the report. This is dependency injection
+    :return: a report of the export
+    """
+    suffix = _file_format(path)
+    start = clock()
+    players = 0
+    with open(path, "w", newline="") as file:
+        if suffix == ".csv":
+            writer = csv.DictWriter(file, fieldnames=STAT_FIELDS)
+            writer.writeheader()
+            for player in store.players():
+                writer.writerow(_export_row(player))
+                players += 1
+        else:
+            for player in store.players():
+                file.write(json.dumps(_export_row(player)) + "\n")
+                players += 1
+    return TransferReport(players, clock() - start)
+
+
+def import_players(
+    store: PlayerStore,
+    path: Path,
+    batch_size: int = 1000,
+    clock: Callable[[], float] = time.perf_counter,
+) -> TransferReport:
+    """
+    import_players saves every player in a bulk file to a store, a batch at a time. Players already in the store are
+    replaced. A row that fails validation stops the import with a ValueError naming its line; the batches before it
+    are already saved
+    :param store: the store to import into
+    :param path: the file to read, ending in .jsonl or .csv
+    :param batch_size: the number of players saved together
+    :param clock: returns the current time in seconds, for the report. This is dependency injection
+    :return: a report of the import
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be greater than zero, got {batch_size}")
+    suffix = _file_format(path)
+    start = clock()
+    players = 0
+    batch: list[Player] = []
+    with open(path, "r", newline="") as file:
+        for stats in _read_rows(file, suffix):
+            batch.append(Player(stats))
+            if len(batch) >= batch_size:
+                store.save_many(batch)
+                players += len(batch)
+                batch = []
+    if batch:
+        store.save_many(batch)
+        players += len(batch)
+    return TransferReport(players, clock() - start)
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """
+    main exports or imports players from the command line, and prints a report
+    :param arguments: the command line arguments. If None, they are read from sys.argv
+    :return: the exit status: 1 if the file could not be imported, otherwise 0
+    """
+    parser = argparse.ArgumentParser(description="Export or import every player's stats in bulk")
+    parser.add_argument("command", choices=("export", "import"))
+    parser.add_argument("file", type=Path, help="the bulk file, ending in .jsonl or .csv")
+    parser.add_argument("--store", type=Path, default=STORE_PATH, help="the player database")
+    parser.add_argument("--batch-size", type=int, default=1000, help="players saved together when importing")
+    options = parser.parse_args(arguments)
+
+    with SQLitePlayerStore(options.store) as store:
+        try:
+            if options.command == "export":
+                report = export_players(store, options.file)
+            else:
+                report = import_players(store, options.file, options.batch_size)
+        except ValueError as error:
+            print(error)
+            return 1
+    print(f"{options.command.capitalize()}ed {report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
 """
-Card represents a card in a game of blackjack. It has a suit, and a value. It may be placed face up or face down on the
-table, and may be flipped during play.
+Card represents a card in a game of blackjack. It has a suit, and a value. Cards are immutable and interned: there is
+exactly one Card object for each suit and value, and every deck or shoe holds references to those same 52 objects.
+Whether a card is face up or face down on the table is tracked by the Hand holding it, not by the card.
+
+The module's external interface shall consist of
+Card - the card class
+DECK - a tuple of the 52 canonical cards, in suit then value order
 """
 
 from .suit import Suit
@@ -8,26 +13,47 @@ from .value import Value
 
 
 class Card:
-    def __init__(self, suit: Suit, value: Value):
+    __slots__ = ("suit", "value")
+
+    _interned: dict = {}
+
+    def __new__(cls, suit: Suit, value: Value):
         """
-        __init__ is a method that creates an instance of a class; in this case a card. It's double underscord (dunder) name
-        It takes in two external parameters, suit and value is reserved, no other method may use this name, it always
-        creates and returns a fresh instance
+        __new__ is a method that creates an instance of a class, and runs before __init__. Cards are interned, so rather
+        than always creating a fresh instance, __new__ returns the existing card for this suit and value if there is one
 
         :param suit: An enum parameter representing the suit of the card
         :param value: An enum parameter representing the value of the card
         """
-        self.suit: Suit = suit
-        self.value: Value = value
-        self.face_down: bool = False
+        card = cls._interned.get((suit, value))
+        if card is None:
+            card = super().__new__(cls)
+            object.__setattr__(card, "suit", suit)
+            object.__setattr__(card, "value", value)
+            cls._interned[(suit, value)] = card
+        return card
+
+    def __setattr__(self, name, value):
+        """
+        __setattr__ is called whenever an attribute is assigned. As a card is shared by every deck, it may not be changed
+        :raises AttributeError: always
+        """
+        raise AttributeError("Card objects are immutable")
+
+    def __reduce__(self):
+        """
+        __reduce__ tells pickle and copy how to rebuild the card, so that a copied or unpickled card is still the
+        interned instance
+        """
+        return Card, (self.suit, self.value)
 
     def __str__(self):
         """
         __str__ is a method that returns a string representation of the card. This should take the format value suitIcon
-        or ## if the card is facedown. For instance J♥ for the jack of hearts
+        For instance J♥ for the jack of hearts
         :return: String
         """
-        if not self.face_down:
-            return str(self.value) + str(self.suit)
-        else:
-            return "##"
+        return str(self.value) + str(self.suit)
+
+
+DECK: tuple[Card, ...] = tuple(Card(suit, value) for suit in Suit for value in Value)
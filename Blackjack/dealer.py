@@ -10,7 +10,7 @@ The dealer hits on anything below 17.
 The dealer's external interface should consist of
 
 
-reveal_hand() (flips all cards and prints)
+reveal_hand() (turns all cards face up and prints)
 all methods in game_participant.py
 """
 
@@ -37,9 +37,7 @@ class Dealer(GameParticipant):
         """
         deal_card adds a card to the dealer's hand. It is responsible for managing if the card is face up or face down
         """
-        if self.hand and self.hand.get_size() == 0:
-            card.face_down = True
-        self.hand.add_card(card)
+        self.hand.add_card(card, face_down=self.hand.get_size() == 0)
     
     def take_turn(self, deck: collections.deque) -> Move:
         """
@@ -53,13 +51,15 @@ class Dealer(GameParticipant):
         else:
             return Move.STAND
     
-    def reveal_hand(self):
+    def reveal_hand(self, show: bool = True):
         """
-        reveal_hand take the facedown card of the dealer's hand and flips it face up
+        reveal_hand turns the facedown card of the dealer's hand face up
+        :param show: if True, the revealed hand is printed
         :return: None
         """
-        self.hand[-1].face_down = False
-        print(self.hand)
+        self.hand.reveal()
+        if show:
+            print(self.hand)
 
     
 
@@ -0,0 +1,303 @@
+"""
+Decisions are where a Player's choices come from: how much to ante, and whether to hit, stand or double down. Player
+asks its decision source for each choice and plays it, so the same rules for betting and for playing a move apply
+whether the choice was typed at the console, read from a script, made by a policy or sent over the network.
+
+A DecisionSource answers at once, and is used by Player.ante and Player.take_turn. An AsyncDecisionSource is awaited,
+and is used by Player.ante_async and Player.take_turn_async, which also accept a DecisionSource. While an asynchronous
+source waits on a queue or a socket, the event loop carries on with other players, so a single thread can host many
+players without blocking on any one of them.
+
+A source may return a DOUBLE_DOWN that the player's bankroll cannot cover, which is played as a HIT, but must return a
+bet between 1 and the bankroll.
+
+The module's external interface shall consist of
+DecisionSource - the abstract base class of sources that answer at once
+AsyncDecisionSource - the abstract base class of sources that are awaited
+ConsoleDecisions - prompts at the console with input()
+ScriptedDecisions - plays a fixed list of bets and moves
+PolicyDecisions - asks a Policy
+QueueDecisions - waits for each bet and move to be put on an asyncio queue
+StreamDecisions - asks a client over an asyncio stream, one line at a time
+Decision - the kinds of decision a hand can wait on
+DecisionRequest - a decision a hand is waiting on, as yielded by Game.play_hand
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Iterable, Optional, Union
+
+from .card import Card
+from .hand import Hand
+from .move import Move
+from .policy import Policy
+
+_MOVES: dict[str, Move] = {"HIT": Move.HIT, "STAND": Move.STAND, "DOUBLE": Move.DOUBLE_DOWN}
+
+
+class DecisionSource(ABC):
+    @abstractmethod
+    def bet(self, bankroll: int) -> int:
+        """
+        Choose the ante for a new hand.
+
+        Args:
+            bankroll (int): The player's current bankroll. Always greater than zero.
+
+        Returns:
+            int: The ante, which must be between 1 and bankroll inclusive.
+        """
+        pass
+
+    @abstractmethod
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        """
+        Choose the next move for the player's hand.
+
+        Args:
+            hand (Hand): The player's current hand.
+            dealer_upcard (Optional[Card]): The dealer's face up card, or None if it is not known.
+            can_double (bool): True if the player has enough bankroll to double the current bet.
+
+        Returns:
+            Move: The move to make. A DOUBLE_DOWN returned when can_double is False is played as a HIT.
+        """
+        pass
+
+
+class AsyncDecisionSource(ABC):
+    @abstractmethod
+    async def bet(self, bankroll: int) -> int:
+        """
+        Choose the ante for a new hand, waiting as long as it takes.
+
+        Args:
+            bankroll (int): The player's current bankroll. Always greater than zero.
+
+        Returns:
+            int: The ante, which must be between 1 and bankroll inclusive.
+        """
+        pass
+
+    @abstractmethod
+    async def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        """
+        Choose the next move for the player's hand, waiting as long as it takes.
+
+        Args:
+            hand (Hand): The player's current hand.
+            dealer_upcard (Optional[Card]): The dealer's face up card, or None if it is not known.
+            can_double (bool): True if the player has enough bankroll to double the current bet.
+
+        Returns:
+            Move: The move to make. A DOUBLE_DOWN returned when can_double is False is played as a HIT.
+        """
+        pass
+
+
+class ConsoleDecisions(DecisionSource):
+    """
+    ConsoleDecisions prompts the player at the console with input(), asking again until they give a valid answer.
+    """
+
+    def bet(self, bankroll: int) -> int:
+        bet = None
+        while not bet:
+            try:
+                print(f"Ante up! Your current bankroll is {bankroll}.")
+                bet = int(input(f"Please enter a number between 1 and {bankroll}:\t"))
+                if bet > bankroll or bet <= 0:
+                    bet = None
+            except Exception:
+                print("Please enter an integer greater than zero!")
+        return bet
+
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        print("Please take your turn")
+        while True:
+            move = input("Enter 'Hit', 'Stand' or 'Double Down': ").strip().lower()
+            if move == "hit":
+                return Move.HIT
+            elif move == "stand":
+                return Move.STAND
+            elif move == "double down":
+                if can_double:
+                    return Move.DOUBLE_DOWN
+                print("You don't have enough money to double down.")
+
+
+class ScriptedDecisions(DecisionSource):
+    """
+    ScriptedDecisions plays a fixed list of bets and moves in order, as for replaying a hand or testing.
+    """
+
+    def __init__(self, bets: Iterable[int] = (), moves: Iterable[Move] = ()):
+        """
+        :param bets: the antes, one for each hand
+        :param moves: the moves, one for each turn across every hand
+        """
+        self._bets = iter(bets)
+        self._moves = iter(moves)
+
+    def bet(self, bankroll: int) -> int:
+        try:
+            return next(self._bets)
+        except StopIteration:
+            raise ValueError("The script has no bets left") from None
+
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        try:
+            return next(self._moves)
+        except StopIteration:
+            raise ValueError("The script has no moves left") from None
+
+
+class PolicyDecisions(DecisionSource):
+    """
+    PolicyDecisions asks a Policy for every decision, as a Player given a policy does.
+    """
+
+    def __init__(self, policy: Policy):
+        """
+        :param policy: the policy making the decisions
+        """
+        self.policy: Policy = policy
+
+    def bet(self, bankroll: int) -> int:
+        return self.policy.bet(bankroll)
+
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        return self.policy.decide(hand, dealer_upcard, can_double)
+
+
+class QueueDecisions(AsyncDecisionSource):
+    """
+    QueueDecisions waits for each bet and move to be put on its queues, by any other task.
+    """
+
+    def __init__(self, bets: Optional[asyncio.Queue] = None, moves: Optional[asyncio.Queue] = None):
+        """
+        :param bets: the queue antes are taken from. If None, a new queue is made
+        :param moves: the queue moves are taken from. If None, a new queue is made
+        """
+        self.bets: asyncio.Queue = bets if bets is not None else asyncio.Queue()
+        self.moves: asyncio.Queue = moves if moves is not None else asyncio.Queue()
+
+    async def bet(self, bankroll: int) -> int:
+        return await self.bets.get()
+
+    async def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        return await self.moves.get()
+
+
+class StreamDecisions(AsyncDecisionSource):
+    """
+    StreamDecisions asks a client for each decision over a stream of UTF-8 lines, as the server's protocol does.
+        ANTE <bankroll>                        answered with the bet
+        TURN <total> <can double, 0 or 1>      answered with HIT, STAND or DOUBLE
+    An answer that is not valid is met with ERR <reason> and the question is asked again. If the client disconnects,
+    closed is set and they stand; a bet cannot be made for them, so ante raises a ConnectionError.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        :param reader: the stream answers are read from
+        :param writer: the stream questions are written to
+        """
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+        self.closed: bool = False
+
+    async def _ask(self, question: str) -> Optional[str]:
+        """
+        :param question: the line to send
+        :return: the client's answer, stripped, or None once the client has disconnected
+        """
+        self.writer.write(f"{question}\n".encode())
+        await self.writer.drain()
+        try:
+            line = await self.reader.readline()
+        except (ConnectionError, ValueError):
+            line = b""
+        if not line:
+            self.closed = True
+            return None
+        return line.decode(errors="replace").strip()
+
+    async def bet(self, bankroll: int) -> int:
+        while not self.closed:
+            answer = await self._ask(f"ANTE {bankroll}")
+            if answer is not None and answer.isdigit() and 0 < int(answer) <= bankroll:
+                return int(answer)
+            if answer is not None:
+                self.writer.write(f"ERR bet must be between 1 and {bankroll}\n".encode())
+        raise ConnectionError("The client disconnected before betting")
+
+    async def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        while not self.closed:
+            answer = await self._ask(f"TURN {hand.get_total()} {int(can_double)}")
+            if answer is None:
+                break
+            move = _MOVES.get(answer.upper())
+            if move is not None:
+                return move
+            self.writer.write(b"ERR expected HIT, STAND or DOUBLE\n")
+        return Move.STAND
+
+
+class Decision(Enum):
+    BET = 0
+    MOVE = 1
+
+
+class DecisionRequest:
+    """
+    DecisionRequest describes a decision a hand is waiting on: a bet for the given bankroll, or a move for the given
+    hand. It can be answered by any decision source with ask or ask_async, or by any other means.
+    """
+
+    def __init__(
+        self,
+        decision: Decision,
+        bankroll: int,
+        hand: Optional[Hand] = None,
+        dealer_upcard: Optional[Card] = None,
+        can_double: bool = False,
+    ):
+        """
+        :param decision: whether a bet or a move is wanted
+        :param bankroll: the player's bankroll
+        :param hand: the player's hand, for a move
+        :param dealer_upcard: the dealer's face up card, for a move
+        :param can_double: True if the player has enough bankroll to double the current bet, for a move
+        """
+        self.decision: Decision = decision
+        self.bankroll: int = bankroll
+        self.hand: Optional[Hand] = hand
+        self.dealer_upcard: Optional[Card] = dealer_upcard
+        self.can_double: bool = can_double
+
+    def ask(self, source: DecisionSource) -> Union[int, Move]:
+        """
+        :param source: the source to ask
+        :return: the source's bet or move
+        """
+        if self.decision == Decision.BET:
+            return source.bet(self.bankroll)
+        return source.decide(self.hand, self.dealer_upcard, self.can_double)
+
+    async def ask_async(self, source: Union[DecisionSource, AsyncDecisionSource]) -> Union[int, Move]:
+        """
+        :param source: the source to ask, which is awaited if it is asynchronous
+        :return: the source's bet or move
+        """
+        answer = self.ask(source)
+        if isinstance(source, AsyncDecisionSource):
+            answer = await answer
+        return answer
+
+    def __repr__(self):
+        if self.decision == Decision.BET:
+            return f"DecisionRequest(BET, bankroll={self.bankroll})"
+        return f"DecisionRequest(MOVE, total={self.hand.get_total()}, can_double={self.can_double})"
@@ -0,0 +1,457 @@
+"""
+Expected value computes the exact expected value of each player move under the game's actual rules, for a bet of one.
+
+The rules followed are those of Game. The player and dealer take turns: each round the player moves, then the dealer
+hits below 17 or stands. The hand ends when the player busts, when the dealer busts, or when both stand, so a dealer who
+busts while the player is still hitting loses straight away. The player may double down at any point in their turn,
+provided the bankroll covers it, and then takes exactly one card. Hands are scored as in Game._evaluate.
+
+The dealer's hole card is never seen, but the dealer's moves give it away in part: a dealer who hits has less than 17,
+and a dealer who stands has 17 or more. The calculation keeps track of which hole cards are still possible, and the
+player's later choices are made on that knowledge, just as a player at the table could.
+
+Cards are handled by rank, and the shoe by composition, as described in probability. The composition always counts the
+dealer's hole card as unseen. Every position is memoized on the compact key of its composition, and the parts of a
+position that do not depend on the player's hand, such as how the dealer's turn may go, are memoized separately so that
+hands facing the same dealer share them.
+
+Drawing without replacement from a finite shoe is exact, but every card drawn changes the composition, so a hand that
+may take many cards reaches a great many positions. Drawing with replacement keeps the composition fixed for the whole
+hand, which is quick enough to analyze every decision of a shoe as it is played.
+
+The module's external interface shall consist of
+PlayerState, DealerState - compact descriptions of the two hands
+move_values() - the expected value of standing, hitting and doubling down
+analyze() - move_values for a hand in play, from the player's Hand and the dealer's Cards
+"""
+
+import operator
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+
+from .card import Card
+from .hand import Hand
+from .move import Move
+from .probability import (
+    NATURAL,
+    OUTCOMES,
+    RANKS,
+    Composition,
+    CompositionKey,
+    card_rank,
+    composition_key,
+    dealer_key_outcomes,
+    hand_total,
+    key_composition,
+    key_draw_probabilities,
+    key_replaces,
+    remove_key_rank,
+)
+
+_CACHE_SIZE: int = 1 << 20
+_ALL_HOLE_CARDS: int = (1 << len(RANKS)) - 1
+
+
+class PlayerState(NamedTuple):
+    """
+    The player's hand. hard is the total with every ace counted as 1, and two_cards is True for an unhit hand, the only
+    kind that can be a natural.
+    """
+
+    hard: int
+    has_ace: bool
+    two_cards: bool
+
+    @property
+    def total(self) -> int:
+        return hand_total(self.hard, self.has_ace)
+
+    def add(self, rank: int) -> "PlayerState":
+        return PlayerState(self.hard + rank, self.has_ace or rank == 1, False)
+
+
+class DealerState(NamedTuple):
+    """
+    The dealer's face up cards: the upcard and any cards taken since. hard is their total with every ace counted as 1,
+    and upcard_only is True until the dealer takes a card.
+    """
+
+    hard: int
+    has_ace: bool
+    upcard_only: bool
+
+    def with_hole(self, hole: int) -> tuple[int, bool]:
+        return self.hard + hole, self.has_ace or hole == 1
+
+    def add(self, rank: int) -> "DealerState":
+        return DealerState(self.hard + rank, self.has_ace or rank == 1, False)
+
+
+@lru_cache(maxsize=None)
+def _player_draws(player: PlayerState) -> tuple[tuple[int, Optional[PlayerState]], ...]:
+    """
+    _player_draws works out, once for each hand, where each card the player might take leads
+    :param player: the player's hand
+    :return: each rank paired with the hand it makes, or with None if it busts the hand
+    """
+    draws = []
+    for rank in RANKS:
+        after = player.add(rank)
+        draws.append((rank, None if after.total > 21 else after))
+    return tuple(draws)
+
+
+@lru_cache(maxsize=None)
+def _bits(mask: int) -> tuple[int, ...]:
+    """
+    :param mask: a bit mask of ranks, bit 0 being an ace
+    :return: the index of every bit set in the mask
+    """
+    return tuple(index for index in range(len(RANKS)) if mask >> index & 1)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _dealer_split(dealer: DealerState, possible: int) -> tuple[int, tuple[tuple[int, int, int], ...]]:
+    """
+    _dealer_split sorts the possible hole cards by the dealer's next move. It depends only on the cards, so it is worked
+    out once for each position whatever the composition
+    :param dealer: the dealer's face up cards
+    :param possible: a bit mask of the hole card ranks still possible, bit 0 being an ace
+    :return: the mask of hole cards the dealer stands on, and for each card the dealer might take on the others, that
+    card with the mask of hole cards it busts and the mask it does not
+    """
+    stands = 0
+    hits = []
+    for index in _bits(possible):
+        hard, has_ace = dealer.with_hole(RANKS[index])
+        if hand_total(hard, has_ace) >= 17:
+            stands |= 1 << index
+        else:
+            hits.append((index, hard, has_ace))
+    draws = []
+    if hits:
+        for drawn in RANKS:
+            busts = 0
+            survives = 0
+            for index, hard, has_ace in hits:
+                if hand_total(hard + drawn, has_ace or drawn == 1) > 21:
+                    busts |= 1 << index
+                else:
+                    survives |= 1 << index
+            draws.append((drawn, busts, survives))
+    return stands, tuple(draws)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _hole_weights(key: CompositionKey, possible: int) -> tuple[float, ...]:
+    """
+    _hole_weights gives the probability of each rank being the hole card. The hole card is equally likely to be any
+    unseen card, except those ruled out by the dealer's moves
+    :param key: the key of the unseen cards, including the hole card
+    :param possible: a bit mask of the hole card ranks still possible, bit 0 being an ace
+    :return: the probability of each rank
+    """
+    weights = [
+        probability if possible >> index & 1 else 0.0
+        for index, probability in enumerate(key_draw_probabilities(key))
+    ]
+    total = sum(weights)
+    return tuple(weight / total for weight in weights)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _next_card_probabilities(key: CompositionKey, possible: int) -> tuple[float, ...]:
+    """
+    _next_card_probabilities gives the probability of each rank being the next card dealt from the shoe, which does not
+    hold the hole card
+    :param key: the key of the unseen cards, including the hole card
+    :param possible: a bit mask of the hole card ranks still possible, bit 0 being an ace
+    :return: the probability of each rank
+    """
+    if key_replaces(key):
+        return key_draw_probabilities(key)
+    composition = key_composition(key)
+    remaining = sum(composition) - 1
+    return tuple(
+        (count - weight) / remaining for count, weight in zip(composition, _hole_weights(key, possible))
+    )
+
+
+@lru_cache(maxsize=None)
+def _payoff(total: int, natural: bool) -> tuple[float, ...]:
+    """
+    _payoff scores a player's finished hand against each dealer outcome, as in Game._evaluate
+    :param total: the player's total, which has not busted
+    :param natural: True if the player's hand is a natural
+    :return: the result for a bet of one against each outcome, in the order of probability.OUTCOMES
+    """
+    scores = [float((total > dealer_total) - (total < dealer_total)) for dealer_total in range(17, 22)]
+    if total == 21 and natural:
+        scores[-1] = 1.0
+    return tuple(scores) + (1.0, 0.0 if natural else -1.0)
+
+
+def _stand_value(player: PlayerState, dealer: DealerState, possible: int, key: CompositionKey) -> float:
+    """
+    _stand_value is the expected value of the player standing, with the dealer then playing out their hand
+    """
+    total = player.total
+    scores = _payoff(total, player.two_cards and total == 21)
+    return sum(map(operator.mul, scores, _dealer_final(dealer, possible, key)))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _dealer_final(dealer: DealerState, possible: int, key: CompositionKey) -> tuple[float, ...]:
+    """
+    _dealer_final gives the probability of each dealer outcome once the dealer plays out their hand. It does not depend
+    on the player's hand, so every standing hand against the same dealer shares it
+    :return: the probability of each outcome, in the order of probability.OUTCOMES
+    """
+    table = [0.0] * len(OUTCOMES)
+    for hole, weight in zip(RANKS, _hole_weights(key, possible)):
+        if weight == 0:
+            continue
+        hard, has_ace = dealer.with_hole(hole)
+        if dealer.upcard_only and hand_total(hard, has_ace) == 21:
+            table[NATURAL] += weight
+            continue
+        for index, outcome in enumerate(dealer_key_outcomes(hard, has_ace, remove_key_rank(key, hole))):
+            table[index] += weight * outcome
+    return tuple(table)
+
+
+def _double_value(player: PlayerState, dealer: DealerState, possible: int, key: CompositionKey) -> float:
+    """
+    _double_value is the expected value of the player doubling down, taking one card and then standing
+    """
+    value = 0.0
+    for (rank, after), probability in zip(_player_draws(player), _next_card_probabilities(key, possible)):
+        if probability == 0:
+            continue
+        if after is None:
+            value -= probability
+        else:
+            value += probability * _stand_value(after, dealer, possible, remove_key_rank(key, rank))
+    return 2 * value
+
+
+def _dealer_turn_value(
+    player: PlayerState,
+    dealer: DealerState,
+    dealer_stood: bool,
+    possible: int,
+    key: CompositionKey,
+    can_double: bool,
+) -> float:
+    """
+    _dealer_turn_value is the expected value after the player has hit without busting, and it is the dealer's turn
+    """
+    if dealer_stood:
+        return _best_value(player, dealer, True, possible, key, can_double)
+    stand_weight, stands, draws = _dealer_moves(dealer, possible, key)
+    value = 0.0
+    if stand_weight > 0:
+        value += stand_weight * _best_value(player, dealer, True, stands, key, can_double)
+    for after, survives, bust_weight, survive_weight, remaining in draws:
+        value += bust_weight
+        if survive_weight > 0:
+            value += survive_weight * _best_value(player, after, False, survives, remaining, can_double)
+    return value
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _dealer_moves(
+    dealer: DealerState, possible: int, key: CompositionKey
+) -> tuple[float, int, tuple[tuple[DealerState, int, float, float, CompositionKey], ...]]:
+    """
+    _dealer_moves weighs up the dealer's turn. It does not depend on the player's hand, so it is shared by every hand
+    facing the same dealer
+    :param dealer: the dealer's face up cards
+    :param possible: a bit mask of the hole card ranks still possible, bit 0 being an ace
+    :param key: the key of the unseen cards, including the hole card
+    :return: the probability the dealer stands and the mask of hole cards that stands on, then for each card the dealer
+    might take, the dealer's cards after it, the mask of hole cards it does not bust, the probabilities that it busts
+    and that it does not, and the key of the cards left
+    """
+    hole = _hole_weights(key, possible)
+    stands, split = _dealer_split(dealer, possible)
+    stand_weight = sum(hole[index] for index in _bits(stands))
+    replaces = key_replaces(key)
+    composition = key_composition(key)
+    remaining = None if replaces else sum(composition) - 1
+    draw = key_draw_probabilities(key)
+    draws = []
+    for drawn, busts, survives in split:
+        index = drawn - 1
+        if draw[index] == 0:
+            continue
+        bust_weight = sum(hole[hit] for hit in _bits(busts))
+        survive_weight = sum(hole[hit] for hit in _bits(survives))
+        if replaces:
+            bust_weight *= draw[index]
+            survive_weight *= draw[index]
+        else:
+            # The hole card and the drawn card cannot be the same card
+            count = composition[index]
+            bust_weight = (bust_weight * count - (hole[index] if busts >> index & 1 else 0.0)) / remaining
+            survive_weight = (survive_weight * count - (hole[index] if survives >> index & 1 else 0.0)) / remaining
+        draws.append((dealer.add(drawn), survives, bust_weight, survive_weight, remove_key_rank(key, drawn)))
+    return stand_weight, stands, tuple(draws)
+
+
+def _hit_value(
+    player: PlayerState,
+    dealer: DealerState,
+    dealer_stood: bool,
+    possible: int,
+    key: CompositionKey,
+    can_double: bool,
+) -> float:
+    """
+    _hit_value is the expected value of the player hitting, and then playing on as well as possible
+    """
+    value = 0.0
+    for (rank, after), probability in zip(_player_draws(player), _next_card_probabilities(key, possible)):
+        if probability == 0:
+            continue
+        if after is None:
+            value -= probability
+        else:
+            value += probability * _dealer_turn_value(
+                after, dealer, dealer_stood, possible, remove_key_rank(key, rank), can_double
+            )
+    return value
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _best_value(
+    player: PlayerState,
+    dealer: DealerState,
+    dealer_stood: bool,
+    possible: int,
+    key: CompositionKey,
+    can_double: bool,
+) -> float:
+    """
+    _best_value is the expected value of the player's best move
+    """
+    value = max(
+        _stand_value(player, dealer, possible, key),
+        _hit_value(player, dealer, dealer_stood, possible, key, can_double),
+    )
+    if can_double:
+        value = max(value, _double_value(player, dealer, possible, key))
+    return value
+
+
+def _move_values(
+    player: PlayerState,
+    dealer: DealerState,
+    dealer_stood: bool,
+    possible: int,
+    key: CompositionKey,
+    can_double: bool,
+) -> dict[Move, float]:
+    values = {
+        Move.STAND: _stand_value(player, dealer, possible, key),
+        Move.HIT: _hit_value(player, dealer, dealer_stood, possible, key, can_double),
+    }
+    if can_double:
+        values[Move.DOUBLE_DOWN] = _double_value(player, dealer, possible, key)
+    return values
+
+
+def move_values(
+    player: PlayerState,
+    upcard: int,
+    composition: Composition = None,
+    can_double: bool = True,
+    dealer: Optional[DealerState] = None,
+    dealer_stood: bool = False,
+    possible: int = _ALL_HOLE_CARDS,
+    replacement: bool = False,
+) -> dict[Move, float]:
+    """
+    move_values gives the exact expected value, for a bet of one, of each move the player can make, assuming the
+    player plays as well as possible afterwards
+    :param player: the player's hand
+    :param upcard: the rank of the dealer's upcard
+    :param composition: the unseen cards, including the dealer's hole card, or None for an infinite deck
+    :param can_double: True if the bankroll covers a double down, as checked by Player.double_down
+    :param dealer: the dealer's face up cards, if the dealer has taken cards since the deal. If None, the dealer shows
+    only the upcard
+    :param dealer_stood: True if the dealer has already stood
+    :param possible: a bit mask of the hole card ranks the dealer's moves have not ruled out, bit 0 being an ace
+    :param replacement: if True, every card is drawn from the composition with replacement. This is not exact, but the
+    error is small for a shoe of several decks, and it is far quicker, since the composition no longer changes as cards
+    are drawn
+    :return: a dictionary from each allowed move to its expected value. DOUBLE_DOWN is left out if can_double is False
+    """
+    if dealer is None:
+        dealer = DealerState(upcard, upcard == 1, True)
+    return _move_values(player, dealer, dealer_stood, possible, composition_key(composition, replacement), can_double)
+
+
+def analyze(
+    hand: Hand,
+    dealer_upcard: Card,
+    composition: Composition,
+    can_double: bool = True,
+    dealer_cards: Iterable[Card] = (),
+    dealer_stood: bool = False,
+    replacement: bool = False,
+) -> dict[Move, float]:
+    """
+    analyze gives the exact expected value of each move for a hand in play, from the cards left unseen. Every position
+    reached is memoized on its compact composition key, so once a hand has been analyzed, the later decisions in the
+    same hand are lookups
+    :param hand: the player's hand, which has not busted
+    :param dealer_upcard: the dealer's face up card
+    :param composition: the unseen cards, including the dealer's hole card, or None for an infinite deck. In a game
+    dealt from a Shoe, this is Shoe.composition with the hole card added back
+    :param can_double: True if the bankroll covers a double down, as checked by Player.double_down
+    :param dealer_cards: the cards the dealer has taken since the deal, in the order taken
+    :param dealer_stood: True if the dealer has already stood
+    :param replacement: if True, cards are drawn with replacement, as described in move_values
+    :return: a dictionary from each allowed move to its expected value for a bet of one
+    """
+    player = _player_state(hand.cards, hand.get_size() == 2)
+    if player.total > 21:
+        raise ValueError(f"Cannot analyze a hand that has busted, with a total of {player.total}")
+    upcard = card_rank(dealer_upcard)
+    dealer = DealerState(upcard, upcard == 1, True)
+    # Each time the dealer hit, the hole card left them under 17. If they stood, it took them to 17 or more, and if not,
+    # it did not bust them, or the hand would be over
+    possible = 0
+    for index, hole in enumerate(RANKS):
+        hard, has_ace = dealer.with_hole(hole)
+        consistent = True
+        for card in dealer_cards:
+            if hand_total(hard, has_ace) >= 17:
+                consistent = False
+                break
+            rank = card_rank(card)
+            hard, has_ace = hard + rank, has_ace or rank == 1
+        total = hand_total(hard, has_ace)
+        if consistent and total <= 21 and (total >= 17 or not dealer_stood):
+            possible |= 1 << index
+    for card in dealer_cards:
+        dealer = dealer.add(card_rank(card))
+    if possible == 0:
+        raise ValueError("No hole card is consistent with the dealer's moves")
+    return move_values(player, upcard, composition, can_double, dealer, dealer_stood, possible, replacement)
+
+
+def _player_state(cards: Iterable[Card], two_cards: bool) -> PlayerState:
+    """
+    :param cards: the cards in the player's hand
+    :param two_cards: True if the hand has not been hit
+    :return: the hand as a PlayerState
+    """
+    hard = 0
+    has_ace = False
+    for card in cards:
+        rank = card_rank(card)
+        hard += rank
+        has_ace = has_ace or rank == 1
+    return PlayerState(hard, has_ace, two_cards)
@@ -2,34 +2,37 @@
 Game handles the flow of play, including running generating decks, running hands, and evaluating win/loss status
 
 The external interface of game should consist of
-Functions: generate_deck
+Functions: generate_deck, evaluate
 Class Methods: Game.new_hand: plays a hand
+               Game.play_hand: plays a hand as a generator, yielding whenever the player has to decide
+               Game.new_hand_async: plays a hand, awaiting the player's decisions
 """
 
 import collections
 import random
-from typing import Optional
+from typing import TYPE_CHECKING, Generator, Optional, Union
 
-from .card import Card
+from .card import DECK, Card
 from .dealer import Dealer
+from .decisions import Decision, DecisionRequest
 from .hand import Hand
 from .move import Move
 from .player import Player
+from .policy import Policy
 from .result import Result
-from .suit import Suit
-from .value import Value
+from .shoe import Shoe
+
+if TYPE_CHECKING:
+    # The hand history is written with NumPy, which is only needed by those who keep one
+    from .hand_history import HandHistoryWriter
 
 
 def generate_deck() -> collections.deque:
     """
-    generate deck generates a deck of 52 card objects, adds them to a deque, and shuffles them
+    generate deck adds the 52 shared card objects to a deque, and shuffles them
     :return: the generated deque object
     """
-    deck: collections.deque[Card] = collections.deque()
-    for suit in Suit:
-        for value in Value:
-            card = Card(suit, value)
-            deck.append(card)
+    deck: collections.deque[Card] = collections.deque(DECK)
     random.shuffle(deck)
     return deck
 
@@ -43,22 +46,37 @@ class Game:
         self,
         player: Player,
         dealer: Optional[Dealer] = None,
-        deck: Optional[collections.deque] = None,
+        deck: Optional[Union[collections.deque, Shoe]] = None,
+        policy: Optional[Policy] = None,
+        history: Optional["HandHistoryWriter"] = None,
+        headless: Optional[bool] = None,
     ):
         """
         __init__ creates a new Game instance, and sets up the class for play.
 
         :param player: the player object that will play in the game
         :param dealer: the dealer object that will play in the game
+        :param deck: the deck or shoe to deal from. If None, a fresh shuffled deck is generated. A shoe is reshuffled
+        at the start of any hand once its cut card has been reached, so it can be kept across many hands
+        :param policy: if given, the player's decisions are made by this policy and the game runs headless, without
+        printing anything or reading from the console
+        :param history: if given, every hand is recorded to this hand history as it finishes. This is dependency
+        injection
+        :param headless: if True, nothing is printed. If None, the game is headless exactly when a policy is given
         """
         if dealer is None:
             dealer = Dealer()
         if deck is None:
             deck = generate_deck()
-        self.deck: collections.deque[Card] = deck
+        self.deck: Union[collections.deque[Card], Shoe] = deck
         self.dealer: Dealer = dealer
         self.player: Player = player
+        self.headless: bool = policy is not None if headless is None else headless
+        if policy is not None:
+            self.player.policy = policy
+        self.history: Optional["HandHistoryWriter"] = history
         self._can_player_move: bool = True
+        self._moves: list[Move] = []
 
     def _deal(self) -> None:
         """
@@ -69,8 +87,25 @@ class Game:
         suggested
         :return: None
         """
-        self._can_player_move = True
+        self._start_hand()
         self.player.ante()
+        self._deal_cards()
+
+    def _start_hand(self) -> None:
+        """
+        _start_hand resets the hand's state, and readies a shoe for the hand, reshuffling it at the cut card
+        :return: None
+        """
+        self._can_player_move = True
+        self._moves.clear()
+        if isinstance(self.deck, Shoe):
+            self.deck.start_hand()
+
+    def _deal_cards(self) -> None:
+        """
+        _deal_cards deals 2 cards to the player and 2 to the dealer, alternating, once the ante is placed
+        :return: None
+        """
         if self.player.hand is None:
             self.player.hand = Hand()
         if self.dealer.hand is None:
@@ -93,8 +128,20 @@ class Game:
 
         :return: boolean, true if another round is warranted
         """
+        player_turn: Optional[Move] = None
         if self._can_player_move:
-            player_turn = self.player.take_turn(self.deck)
+            player_turn = self.player.take_turn(self.deck, self.dealer.hand[-2])
+        return self._end_round(player_turn)
+
+    def _end_round(self, player_turn: Optional[Move]) -> bool:
+        """
+        _end_round finishes a round once the player has moved: it checks whether the player busted or stopped, then
+        plays the dealer's turn
+        :param player_turn: the move the player made this round, or None if they could no longer move
+        :return: boolean, true if another round is warranted
+        """
+        if player_turn is not None:
+            self._moves.append(player_turn)
             if self.player.has_busted():
                 self._can_player_move = False
                 return False
@@ -127,27 +174,84 @@ class Game:
                 Accept dealer move
             Dealer reveals hidden card
             Resolve the hand
+        In headless mode none of the hands or the result are printed.
         :return:
         """
         self._deal()
-        print("Dealer's Hand")
-        print(str(self.dealer.hand))
-        print(f"{self.player.name}'s Hand")
-        print(str(self.player.hand))
+        self._show_hands("Dealer's Hand", f"{self.player.name}'s Hand")
 
         while self._play_round():
-            print("Dealer's Hand")
-            print(str(self.dealer.hand))
-            print(f"{self.player.name}'s Hand")
+            self._show_hands("Dealer's Hand", f"{self.player.name}'s Hand")
+        return self._finish_hand()
+
+    def play_hand(self) -> Generator[DecisionRequest, Union[int, Move], tuple[Result, int]]:
+        """
+        play_hand plays a hand exactly as new_hand does, as a generator that stops wherever the player has to decide.
+        Each time the hand needs a bet or a move it yields a DecisionRequest, and waits to be resumed with send() and
+        the answer. Nothing is asked of the player's own decision source, so whoever drives the generator may answer
+        from anywhere, and may drive any number of hands in turn on one thread. new_hand_async drives it as
+            hand = game.play_hand()
+            request = next(hand)
+            while True:
+                try:
+                    request = hand.send(await request.ask_async(game.player.decisions))
+                except StopIteration as finished:
+                    result, net_change = finished.value
+                    break
+        :return: a generator which, once finished, returns the result and the net change to the bankroll
+        """
+        self._start_hand()
+        self.player.check_bankroll()
+        bet = yield DecisionRequest(Decision.BET, self.player.bankroll)
+        self.player.place_bet(bet)
+        self._deal_cards()
+        self._show_hands("Dealer's Hand", f"{self.player.name}'s Hand")
+
+        while True:
+            player_turn: Optional[Move] = None
+            if self._can_player_move:
+                move = yield DecisionRequest(
+                    Decision.MOVE,
+                    self.player.bankroll,
+                    self.player.hand,
+                    self.dealer.hand[-2],
+                    self.player.bet <= self.player.bankroll / 2,
+                )
+                player_turn = self.player.play_move(move, self.deck)
+            if not self._end_round(player_turn):
+                break
+            self._show_hands("Dealer's Hand", f"{self.player.name}'s Hand")
+        return self._finish_hand()
+
+    async def new_hand_async(self) -> tuple[Result, int]:
+        """
+        new_hand_async plays a hand through play_hand, answering each request from the player's decision source and
+        awaiting it if it is asynchronous. While it waits, the event loop is free to play other hands
+        :return: the result of the hand and the net change to the bankroll
+        """
+        hand = self.play_hand()
+        request = next(hand)
+        while True:
+            answer = await request.ask_async(self.player.decisions)
+            try:
+                request = hand.send(answer)
+            except StopIteration as finished:
+                return finished.value
+
+    def _finish_hand(self) -> tuple[Result, int]:
+        """
+        _finish_hand reveals the dealer's hand, scores the hand and clears both hands for the next one
+        :return: the result of the hand and the net change to the bankroll
+        """
+        if not self.headless:
+            print("Dealer's Hand after reveal")
+        self.dealer.reveal_hand(not self.headless)
+        if not self.headless:
+            print(f"{self.player.name}'s final hand")
             print(str(self.player.hand))
-        print("Dealer's Hand after reveal")
-        self.dealer.reveal_hand()
-        print(f"{self.player.name}'s final hand")
-        print(str(self.player.hand))
         result = self._evaluate()
-        print(result.name)
-        self.player.hand = None
-        self.dealer.hand = None
+        if not self.headless:
+            print(result.name)
         net_change: int = 0
         if result == Result.VICTORY:
             net_change = self.player.bet
@@ -155,8 +259,26 @@ class Game:
             net_change = -self.player.bet
         else:
             net_change = 0
+        if self.history is not None:
+            self.history.record(
+                self.player.hand, self.dealer.hand, self._moves, result, self.player.bet, net_change
+            )
+        self.player.hand = None
+        self.dealer.hand = None
         return result, net_change
 
+    def _show_hands(self, dealer_title: str, player_title: str) -> None:
+        """
+        _show_hands prints the dealer's and the player's hands under the given titles, unless the game is headless
+        :return: None
+        """
+        if self.headless:
+            return
+        print(dealer_title)
+        print(str(self.dealer.hand))
+        print(player_title)
+        print(str(self.player.hand))
+
     def _evaluate(self) -> Result:
         """
         Blackjack scoring:
@@ -176,26 +298,36 @@ class Game:
         in pytest to avoid running these irrelevant tests
         :return: a Result enum reflecting the result of the hand
         """
-        player_hand:Optional [Hand] = self.player.hand
-        dealer_hand: Optional [Hand] = self.dealer.hand
+        player_hand: Optional[Hand] = self.player.hand
+        dealer_hand: Optional[Hand] = self.dealer.hand
         if player_hand is None or dealer_hand is None:
             raise Exception("Hand is None")
-        if player_hand.get_total() > 21:
-            return Result.DEFEAT
-        elif dealer_hand.get_total() > 21:
+        return evaluate(player_hand, dealer_hand)
+
+
+def evaluate(player_hand: Hand, dealer_hand: Hand) -> Result:
+    """
+    evaluate scores a finished hand against the dealer's, by the rules described in Game._evaluate
+    :param player_hand: the player's final hand
+    :param dealer_hand: the dealer's final hand
+    :return: a Result enum reflecting the result of the hand
+    """
+    player_total = player_hand.get_total()
+    dealer_total = dealer_hand.get_total()
+    if player_total > 21:
+        return Result.DEFEAT
+    elif dealer_total > 21:
+        return Result.VICTORY
+    elif player_total == 21 and dealer_total == 21:
+        player_size = player_hand.get_size()
+        dealer_size = dealer_hand.get_size()
+        if player_size == 2 and dealer_size > 2:
             return Result.VICTORY
-        elif player_hand.get_total() == 21 and dealer_hand.get_total() == 21:
-            if player_hand.get_size() == 2 and dealer_hand.get_size() > 2:
-                return Result.VICTORY
-            elif player_hand.get_size() > 2 and dealer_hand.get_size() == 2:
-                return Result.DEFEAT
-            else:
-                return Result.PUSH
-        elif player_hand.get_total() == dealer_hand.get_total():
-            return Result.PUSH
+        elif player_size > 2 and dealer_size == 2:
+            return Result.DEFEAT
         else:
-            return (
-                Result.VICTORY
-                if player_hand.get_total() > dealer_hand.get_total()
-                else Result.DEFEAT
-            )
+            return Result.PUSH
+    elif player_total == dealer_total:
+        return Result.PUSH
+    else:
+        return Result.VICTORY if player_total > dealer_total else Result.DEFEAT
@@ -4,34 +4,53 @@ from .card import Card
 from .value import Value
 
 
-def _handle_aces(subtotal: int, aces: int) -> int:
-    """
-    Handles the point value of aces, which are counted as 11, unless it would cause the player to bust, in which case
-    they are, one by one, converted to ones.
-    Being a private method, this does not have to be implemented by the student, though it's implementation is suggested
-    :param subtotal: the total value excluding aces
-    :param aces: The number of aces in the hand
-    :return: the final total of the hand
-    """
-    if aces + subtotal <= 11 and aces > 0:
-        return subtotal + 10 + aces
-    else:
-        return subtotal + aces
-
-
 class Hand:
     def __init__(self):
         """
         __init__ creates a new hand
         """
         self.cards = collections.deque()
+        self._face_down: set[int] = set()
+        self._hard_total: int = 0
+        self._aces: int = 0
+        self._total: int = 0
+        self._soft: bool = False
 
-    def add_card(self, card: Card) -> None:
+    def add_card(self, card: Card, face_down: bool = False) -> None:
         """
         :param card: the card to add to the collection
+        :param face_down: if True, the card is placed face down, and is shown as ## until the hand is revealed
         :return:
         """
+        if face_down:
+            self._face_down.add(len(self.cards))
         self.cards.appendleft(card)
+        value = card.value
+        if value is Value.ACE:
+            self._aces += 1
+            self._hard_total += 1
+        else:
+            self._hard_total += value.score
+        # At most one ace can ever count as 11, and only while that keeps the hand at 21 or under
+        self._soft = self._aces > 0 and self._hard_total <= 11
+        self._total = self._hard_total + 10 if self._soft else self._hard_total
+
+    def reveal(self) -> None:
+        """
+        reveal turns every card in the hand face up
+        :return: None
+        """
+        self._face_down.clear()
+
+    def is_face_down(self, index: int) -> bool:
+        """
+        :param index: the index of the card, as used by __getitem__
+        :return: True if the card at that index is face down
+        """
+        size = len(self.cards)
+        if index < 0:
+            index += size
+        return size - 1 - index in self._face_down
 
     def get_size(self) -> int:
         """
@@ -41,28 +60,40 @@ class Hand:
 
     def get_total(self) -> int:
         """
-        Get total calculates the point value of the hand as follows
+        Get total returns the point value of the hand as follows
         Numbered cards: The value of their number
         Face cards (jack king queen): Ten
         Aces: 11, unless 11 would cause you to bust, in which case 1.
+        The total is kept up to date by add_card, so this does not walk the cards
         :return: the point value of the hand
         """
-        total: int = 0
-        aces: int = 0
+        return self._total
 
-        for card in self.cards:
-            card_value = card.value
-            if not card_value == Value.ACE:
-                total += card_value.score
-            else:
-                aces += 1
+    def is_soft(self) -> bool:
+        """
+        :return: True if the hand holds an ace that is being counted as 11
+        """
+        return self._soft
 
-        total = _handle_aces(total, aces)
+    def is_blackjack(self) -> bool:
+        """
+        :return: True if the hand is a natural 21, an ace and a ten-value card and nothing else
+        """
+        return self._total == 21 and len(self.cards) == 2
 
-        return total
+    def is_bust(self) -> bool:
+        """
+        :return: True if the hand's total is over 21
+        """
+        return self._total > 21
 
     def __str__(self):
-        return "\n".join(str(card) for card in self.cards)
+        if not self._face_down:
+            return "\n".join(str(card) for card in self.cards)
+        return "\n".join(
+            "##" if self.is_face_down(index) else str(card)
+            for index, card in enumerate(self.cards)
+        )
 
     def __getitem__(self, index):
         return self.cards[index]
@@ -0,0 +1,228 @@
+"""
+Hand history keeps a record of every hand played in a compact binary file, for audit and analysis. Each hand is one
+fixed-width record holding both hands' cards in the order they were dealt, the player's moves, the result, the bet and
+the net change to the bankroll, so a billion hands take a known, bounded amount of space and any hand can be found by
+its index alone.
+
+The file is a short header followed by the records, packed back to back with no padding. A reader maps the file into
+memory and views it as a NumPy structured array of HAND_RECORD, so nothing is parsed or copied until it is used. A
+record left half written by a crash can only be the last one, and is ignored.
+
+Cards are stored as a rank byte and a suit byte. Ranks run from 1 for an ace to 13 for a king, and 0 marks an unused
+slot. Suits are Suit.index. Moves are Move.value and the result is Result.value.
+
+A game records to a history when it is given one, as in
+Game(player, history=HandHistoryWriter(path))
+
+The module's external interface shall consist of
+HAND_RECORD - the NumPy dtype of a record
+MAX_CARDS, MAX_MOVES - the number of cards in each hand and of moves a record has room for
+HandHistoryWriter - appends records to a history file
+read_hand_history() - maps a history file as an array of records
+record_cards() - turns a record's rank and suit bytes back into cards
+"""
+
+import struct
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .card import Card
+from .hand import Hand
+from .move import Move
+from .result import Result
+from .suit import Suit
+from .value import Value
+
+MAX_CARDS: int = 16
+MAX_MOVES: int = 16
+
+HAND_RECORD: np.dtype = np.dtype(
+    [
+        ("player_ranks", np.uint8, (MAX_CARDS,)),
+        ("player_suits", np.uint8, (MAX_CARDS,)),
+        ("dealer_ranks", np.uint8, (MAX_CARDS,)),
+        ("dealer_suits", np.uint8, (MAX_CARDS,)),
+        ("moves", np.uint8, (MAX_MOVES,)),
+        ("player_cards", np.uint8),
+        ("dealer_cards", np.uint8),
+        ("move_count", np.uint8),
+        ("result", np.uint8),
+        ("bet", "<i8"),
+        ("net_change", "<i8"),
+    ]
+)
+
+_MAGIC: bytes = b"BJHH"
+_VERSION: int = 1
+# The magic number, the format version and the size of a record, padded to 16 bytes
+_HEADER: struct.Struct = struct.Struct("<4sHH8x")
+# Packs a record field by field, in the same layout as HAND_RECORD
+_RECORD: struct.Struct = struct.Struct(f"<{4 * MAX_CARDS}B{MAX_MOVES}B4Bqq")
+assert _RECORD.size == HAND_RECORD.itemsize
+
+# The rank byte of each card value, and the value of each rank byte
+_VALUE_RANKS: dict[Value, int] = {value: rank for rank, value in enumerate((Value.ACE, *list(Value)[:-1]), 1)}
+_RANK_VALUES: dict[int, Value] = {rank: value for value, rank in _VALUE_RANKS.items()}
+_INDEX_SUITS: dict[int, Suit] = {suit.index: suit for suit in Suit}
+
+
+def _card_bytes(hand: Hand) -> tuple[list[int], list[int]]:
+    """
+    _card_bytes gives the rank and suit bytes of a hand's cards, in the order they were dealt, padded to MAX_CARDS
+    :param hand: the hand
+    :return: the rank bytes and the suit bytes
+    """
+    if hand.get_size() > MAX_CARDS:
+        raise ValueError(f"A hand of {hand.get_size()} cards does not fit in a record of {MAX_CARDS}")
+    padding = [0] * (MAX_CARDS - hand.get_size())
+    # Cards are added to the left of a hand, so the first card dealt is the last
+    cards = list(reversed(hand.cards))
+    return [_VALUE_RANKS[card.value] for card in cards] + padding, [card.suit.index for card in cards] + padding
+
+
+def _read_header(file) -> None:
+    """
+    _read_header checks that a file starts with a hand history header of this version
+    :param file: the file, opened in binary mode at its start
+    :return: None
+    """
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("The file is too short to be a hand history")
+    magic, version, record_size = _HEADER.unpack(header)
+    if magic != _MAGIC:
+        raise ValueError("The file is not a hand history")
+    if version != _VERSION or record_size != HAND_RECORD.itemsize:
+        raise ValueError(f"Unsupported hand history version {version}")
+
+
+class HandHistoryWriter:
+    """
+    HandHistoryWriter appends hand records to a history file. Records are packed into a buffer and written out in
+    batches, so recording a hand costs no system call. Buffered records are written when the buffer fills, on flush and
+    on close.
+    """
+
+    def __init__(self, path: Path, buffer_records: int = 1024):
+        """
+        __init__ opens a history file for appending, creating it if it does not exist
+
+        :param path: the history file
+        :param buffer_records: the number of records held before they are written out
+        """
+        if buffer_records <= 0:
+            raise ValueError(f"buffer_records must be greater than zero, got {buffer_records}")
+        self.path: Path = Path(path)
+        self.buffer_records: int = buffer_records
+        self._buffer: bytearray = bytearray()
+        self._buffered: int = 0
+        self._file = open(self.path, "ab+")
+        self._file.seek(0)
+        if self._file.read(1):
+            self._file.seek(0)
+            _read_header(self._file)
+            size = self._file.seek(0, 2)
+            # A partial record left by a crash is cut off, so that new records are not appended after it
+            self._file.truncate(size - (size - _HEADER.size) % HAND_RECORD.itemsize)
+        else:
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION, HAND_RECORD.itemsize))
+            self._file.flush()
+
+    def record(
+        self,
+        player_hand: Hand,
+        dealer_hand: Hand,
+        moves: Iterable[Move],
+        result: Result,
+        bet: int,
+        net_change: int,
+    ) -> None:
+        """
+        record adds a finished hand to the history
+        :param player_hand: the player's final hand
+        :param dealer_hand: the dealer's final hand
+        :param moves: the player's moves, in the order they were made
+        :param result: the result of the hand
+        :param bet: the bet at the end of the hand
+        :param net_change: the change to the player's bankroll
+        :return: None
+        """
+        move_bytes = [move.value for move in moves]
+        if len(move_bytes) > MAX_MOVES:
+            raise ValueError(f"{len(move_bytes)} moves do not fit in a record of {MAX_MOVES}")
+        player_ranks, player_suits = _card_bytes(player_hand)
+        dealer_ranks, dealer_suits = _card_bytes(dealer_hand)
+        self._buffer += _RECORD.pack(
+            *player_ranks,
+            *player_suits,
+            *dealer_ranks,
+            *dealer_suits,
+            *move_bytes,
+            *[0] * (MAX_MOVES - len(move_bytes)),
+            player_hand.get_size(),
+            dealer_hand.get_size(),
+            len(move_bytes),
+            result.value,
+            bet,
+            net_change,
+        )
+        self._buffered += 1
+        if self._buffered >= self.buffer_records:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        flush writes every buffered record to the file
+        :return: None
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        close writes every buffered record and closes the file
+        :return: None
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "HandHistoryWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def read_hand_history(path: Path) -> np.ndarray:
+    """
+    read_hand_history maps a history file into memory, read only, without reading or copying the records
+    :param path: the history file
+    :return: a structured array of HAND_RECORD, one row per recorded hand
+    """
+    with open(path, "rb") as file:
+        _read_header(file)
+        size = file.seek(0, 2)
+    count = (size - _HEADER.size) // HAND_RECORD.itemsize
+    if count == 0:
+        # An empty file cannot be mapped
+        return np.empty(0, dtype=HAND_RECORD)
+    return np.memmap(path, dtype=HAND_RECORD, mode="r", offset=_HEADER.size, shape=(count,))
+
+
+def record_cards(ranks: np.ndarray, suits: np.ndarray, count: Optional[int] = None) -> list[Card]:
+    """
+    record_cards turns the rank and suit bytes of one hand in a record back into cards
+    :param ranks: the hand's rank bytes, such as record["player_ranks"]
+    :param suits: the hand's suit bytes, such as record["player_suits"]
+    :param count: the number of cards in the hand. If None, every used slot is read
+    :return: the cards, in the order they were dealt
+    """
+    if count is None:
+        count = int(np.count_nonzero(ranks))
+    return [Card(_INDEX_SUITS[int(suit)], _RANK_VALUES[int(rank)]) for rank, suit in zip(ranks[:count], suits[:count])]
@@ -0,0 +1,165 @@
+"""
+A hand journal records every hand a player finishes as one short line appended to a file, so recording a hand costs a
+single small write however large the player's stats grow.
+
+Every so often the journal is compacted: the file is replaced by a single snapshot of the player's stats, and the hands
+before it are dropped. A player's current stats are rebuilt by taking the last snapshot and replaying the hands after
+it, which Player.attach_journal does. A line left half written by a crash can only be the last one, and is ignored.
+
+A journal given on_records hands its records over at each snapshot instead, for example to be saved to a PlayerStore,
+and once they are saved the file is removed. Records that could not be saved are kept, and handed over again with the
+next snapshot's. A journal with nothing left in it is removed when it is closed.
+
+Each line is a JSON object, either {"snapshot": stats} or {"result": name, "bet": bet, "net": net_change}.
+
+The module's external interface shall consist of
+HandRecord - one finished hand
+HandJournal - the journal class
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Mapping, NamedTuple, Optional
+
+from .result import Result
+
+
+class HandRecord(NamedTuple):
+    """
+    A finished hand: its result, the bet at the end of the hand and the net change to the bankroll.
+    """
+
+    result: Result
+    bet: int
+    net_change: int
+
+
+class HandJournal:
+    def __init__(
+        self,
+        path: Path,
+        snapshot_every: int = 100,
+        on_snapshot: Optional[Callable[[Mapping], None]] = None,
+        on_records: Optional[Callable[[list[HandRecord]], bool]] = None,
+    ):
+        """
+        __init__ opens a journal, creating the file if it does not exist
+
+        :param path: the journal file
+        :param snapshot_every: the number of hands recorded between snapshots
+        :param on_snapshot: called with the stats each time a snapshot is taken, for example to save them to a
+        PlayerStore as well. This is dependency injection
+        :param on_records: called with the hands recorded since the last snapshot each time a snapshot is taken. It
+        returns True once the hands are saved elsewhere, and the journal file is removed rather than compacted, or
+        False to keep them in the journal until the next snapshot. This is dependency injection
+        """
+        if snapshot_every <= 0:
+            raise ValueError(f"snapshot_every must be greater than zero, got {snapshot_every}")
+        self.path: Path = Path(path)
+        self.snapshot_every: int = snapshot_every
+        self.on_snapshot: Optional[Callable[[Mapping], None]] = on_snapshot
+        self.on_records: Optional[Callable[[list[HandRecord]], bool]] = on_records
+        self.pending: int = len(self.read()[1])
+        self._drop_partial_line()
+        self._file = open(self.path, "a")
+
+    def _drop_partial_line(self) -> None:
+        """
+        _drop_partial_line cuts off a last line left half written, so that new lines are not appended to it
+        :return: None
+        """
+        try:
+            with open(self.path, "rb+") as file:
+                content = file.read()
+                if content and not content.endswith(b"\n"):
+                    file.truncate(content.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            pass
+
+    def read(self) -> tuple[Optional[dict], list[HandRecord]]:
+        """
+        read reads the journal back
+        :return: the stats in the last snapshot, or None if there is no snapshot, and the hands recorded after it
+        """
+        snapshot = None
+        records = []
+        try:
+            with open(self.path, "r") as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return None, []
+        for index, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                if index == len(lines) - 1:
+                    break
+                raise
+            if "snapshot" in entry:
+                snapshot = entry["snapshot"]
+                records = []
+            else:
+                records.append(HandRecord(Result[entry["result"]], entry["bet"], entry["net"]))
+        return snapshot, records
+
+    def record(self, result: Result, bet: int, net_change: int, stats: Mapping) -> None:
+        """
+        record appends a finished hand to the journal, and takes a snapshot if one is due
+        :param result: the result of the hand
+        :param bet: the bet at the end of the hand
+        :param net_change: the change to the player's bankroll
+        :param stats: the player's stats after the hand, for the snapshot
+        :return: None
+        """
+        self._file.write(json.dumps({"result": result.name, "bet": bet, "net": net_change}) + "\n")
+        self._file.flush()
+        self.pending += 1
+        if self.pending >= self.snapshot_every:
+            self.snapshot(stats)
+
+    def snapshot(self, stats: Mapping) -> None:
+        """
+        snapshot compacts the journal down to a single snapshot of the stats. The new file is written beside the old
+        one and then renamed over it, so the journal is never left without its history. If the journal has on_records,
+        the hands are handed to it instead, and once it has saved them the file is removed and started afresh
+        :param stats: the player's current stats
+        :return: None
+        """
+        if self.on_records is not None:
+            if self.on_records(self.read()[1]):
+                self._file.close()
+                self.path.unlink(missing_ok=True)
+                self._file = open(self.path, "a")
+            self.pending = 0
+            if self.on_snapshot is not None:
+                self.on_snapshot(stats)
+            return
+        self._file.close()
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        with open(temporary, "w") as file:
+            file.write(json.dumps({"snapshot": dict(stats)}) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "a")
+        self.pending = 0
+        if self.on_snapshot is not None:
+            self.on_snapshot(stats)
+
+    def close(self) -> None:
+        """
+        close closes the journal file. Recorded hands are already on disk, so no snapshot is taken. An empty journal
+        file is removed
+        :return: None
+        """
+        empty = self._file.tell() == 0
+        self._file.close()
+        if empty:
+            self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "HandJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,123 @@
+"""
+Leaderboard keeps every player ranked by a stat, such as bankroll or win rate, so the top players and any player's rank
+can be found without loading every player. The ranking is a sorted list searched by bisection, so a rank lookup takes
+logarithmic time. It is kept up to date one player at a time as their stats change, without a rebuild, but moving a
+player inserts into and deletes from the list, which shifts the entries after them and so takes linear time. The
+shift is a single memory move, cheap even for many thousands of players.
+
+A player attached to a leaderboard with Player.attach_leaderboard updates it each time update_stats changes their stats.
+A leaderboard is rebuilt from a store in one pass, as in
+leaderboard.rebuild(player.stats for player in store.players())
+
+Players with the same score share a rank, and are listed in order of normalized name.
+
+The module's external interface shall consist of
+METRICS - the stats a leaderboard can rank by
+Leaderboard - the leaderboard class
+"""
+
+import bisect
+from typing import Callable, Iterable, Mapping
+
+from .player_store import normalize_name
+
+
+def _win_rate(stats: Mapping) -> float:
+    """
+    :param stats: a player's stats
+    :return: the fraction of the player's hands that were won, or 0 if they have not played
+    """
+    hands = stats.get("wins", 0) + stats.get("losses", 0) + stats.get("pushes", 0)
+    return stats.get("wins", 0) / hands if hands else 0.0
+
+
+METRICS: dict[str, Callable[[Mapping], float]] = {
+    "bankroll": lambda stats: stats["bankroll"],
+    "win_rate": _win_rate,
+}
+
+
+class Leaderboard:
+    def __init__(self, metric: str = "bankroll"):
+        """
+        :param metric: the stat players are ranked by, one of METRICS
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric}; use one of {', '.join(METRICS)}")
+        self.metric: str = metric
+        self._score: Callable[[Mapping], float] = METRICS[metric]
+        # Sorted ascending, so the negated score puts the best player first
+        self._keys: list[tuple[float, str]] = []
+        # Each normalized name maps to the player's key in _keys, and their name as entered
+        self._entries: dict[str, tuple[tuple[float, str], str]] = {}
+
+    def update(self, stats: Mapping) -> None:
+        """
+        update adds a player to the leaderboard, or moves them to the rank of their new stats. The position is found
+        in logarithmic time, but inserting there takes linear time
+        :param stats: the player's stats
+        :return: None
+        """
+        normalized = normalize_name(stats["name"])
+        key = (-self._score(stats), normalized)
+        entry = self._entries.get(normalized)
+        if entry is not None:
+            if entry[0] == key:
+                return
+            self._discard(entry[0])
+        bisect.insort(self._keys, key)
+        self._entries[normalized] = key, stats["name"]
+
+    def remove(self, name: str) -> None:
+        """
+        remove takes a player off the leaderboard, in linear time
+        :param name: the player's name
+        :return: None
+        """
+        key, _ = self._entries.pop(normalize_name(name))
+        self._discard(key)
+
+    def _discard(self, key: tuple[float, str]) -> None:
+        del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def rebuild(self, players: Iterable[Mapping]) -> None:
+        """
+        rebuild replaces the leaderboard with one of the given players, sorting them once rather than inserting each
+        :param players: every player's stats, such as from a PlayerStore's players()
+        :return: None
+        """
+        self._entries = {}
+        for stats in players:
+            normalized = normalize_name(stats["name"])
+            self._entries[normalized] = (-self._score(stats), normalized), stats["name"]
+        self._keys = sorted(key for key, _ in self._entries.values())
+
+    def top(self, count: int) -> list[tuple[str, float]]:
+        """
+        :param count: the number of players wanted
+        :return: the name and score of up to count players, best first
+        """
+        if count < 0:
+            raise ValueError(f"count cannot be negative, got {count}")
+        return [(self._entries[normalized][1], -score) for score, normalized in self._keys[:count]]
+
+    def rank(self, name: str) -> int:
+        """
+        :param name: a player's name
+        :return: the player's rank, where 1 is best. It is one more than the number of players with a better score
+        """
+        key, _ = self._entries[normalize_name(name)]
+        return bisect.bisect_left(self._keys, (key[0],)) + 1
+
+    def score(self, name: str) -> float:
+        """
+        :param name: a player's name
+        :return: the player's score on this leaderboard
+        """
+        return -self._entries[normalize_name(name)][0][0]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._entries
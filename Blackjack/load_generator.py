@@ -0,0 +1,370 @@
+"""
+Load generator plays many bot clients against the table server at once, to find how many concurrent seats a machine
+holds. Each bot speaks the server's line protocol: it creates a player, sits at a table of its own and plays hands,
+pausing for a think time before each bet and move as a person would. Think times are drawn from an exponential
+distribution around the mean given, so the bots do not move in lockstep. The round trip of every decision, from the bot
+sending it to the server's first line in reply, is timed.
+
+By default a server is started on a free localhost port, in a process of its own with a temporary player store, so its
+CPU time can be measured apart from the bots' and divided among the hands played. Where /proc is available, only the
+CPU time spent once the server is listening is counted; elsewhere on Unix the server's start up is counted too, and on
+Windows the CPU time is not known. Against a server that is already running, given by its port, it is not known either.
+
+To run 200 bots playing 20 hands each, pausing 50ms on average before each decision, run
+python -m Blackjack.load_generator --clients 200 --hands 20 --think 0.05
+
+The module's external interface shall consist of
+percentile() - the nearest rank percentile of some measurements
+LoadReport - the hands played, decision round trips and server CPU time of a run
+generate_load() - plays bots against a running server
+run_load() - starts a server on localhost, plays bots against it and stops it
+main() - the command line interface
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import re
+import secrets
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    import resource
+except ImportError:
+    # Only Unix has getrusage, so elsewhere the server's CPU time is not measured
+    resource = None
+
+from .server import PROTOCOL_VERSION
+
+_BANKROLL: int = 1_000_000
+_BET: int = 1
+_STARTUP_TIMEOUT: float = 30.0
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    :param values: the measurements, in any order
+    :param percent: the percentile wanted, between 0 and 100
+    :return: the smallest measurement that at least percent of the measurements are no greater than
+    """
+    if not values:
+        raise ValueError("There are no measurements to take a percentile of")
+    if not 0 <= percent <= 100:
+        raise ValueError(f"percent must be between 0 and 100, got {percent}")
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class LoadReport:
+    """
+    LoadReport holds the hands played in a run, the round trip of every decision in seconds, and the CPU time the
+    server spent, if it is known.
+    """
+
+    def __init__(
+        self,
+        clients: int,
+        hands: int,
+        seconds: float,
+        round_trips: list[float],
+        cpu_seconds: Optional[float],
+    ):
+        self.clients: int = clients
+        self.hands: int = hands
+        self.seconds: float = seconds
+        self.round_trips: list[float] = round_trips
+        self.cpu_seconds: Optional[float] = cpu_seconds
+
+    @property
+    def hands_per_second(self) -> float:
+        """The hands played per second, across every bot."""
+        return self.hands / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def cpu_per_hand(self) -> Optional[float]:
+        """The server's CPU seconds per hand played, or None if the server's CPU time is not known."""
+        if self.cpu_seconds is None or self.hands == 0:
+            return None
+        return self.cpu_seconds / self.hands
+
+    def round_trip(self, percent: float) -> float:
+        """
+        :param percent: the percentile wanted, between 0 and 100
+        :return: that percentile of the decision round trips, in seconds
+        """
+        return percentile(self.round_trips, percent)
+
+    def __str__(self):
+        lines = [
+            f"{self.clients:,} clients played {self.hands:,} hands in {self.seconds:.2f}s "
+            f"({self.hands_per_second:,.1f} hands/s)",
+        ]
+        if self.round_trips:
+            trips = ", ".join(f"p{percent} {self.round_trip(percent) * 1000:.2f}ms" for percent in (50, 95, 99))
+            lines.append(f"{len(self.round_trips):,} decisions, round trip {trips}")
+        if self.cpu_per_hand is not None:
+            lines.append(f"server CPU {self.cpu_seconds:.2f}s, {self.cpu_per_hand * 1e6:,.0f}µs per hand")
+        else:
+            lines.append("server CPU not measured")
+        return "\n".join(lines)
+
+
+class _Bot:
+    """
+    _Bot is one client of the server, playing hands at a table of its own. It hits below 17 and stands otherwise.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        think_time: float,
+        rng: random.Random,
+        clock: Callable[[], float],
+        round_trips: list[float],
+    ):
+        """
+        :param name: the name of the bot's player and of its table
+        :param think_time: the mean pause before each decision, in seconds. If 0, the bot never pauses
+        :param rng: draws the think times. This is dependency injection
+        :param clock: returns the current time in seconds, for timing round trips. This is dependency injection
+        :param round_trips: the list every round trip is added to, shared by every bot of a run
+        """
+        self.name: str = name
+        self.think_time: float = think_time
+        self.rng: random.Random = rng
+        self.clock: Callable[[], float] = clock
+        self.round_trips: list[float] = round_trips
+        self.hands: int = 0
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def receive(self) -> str:
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError(f"The server closed {self.name}'s connection")
+        return line.decode(errors="replace").strip()
+
+    async def command(self, line: str) -> None:
+        """
+        command sends a command that must be answered with OK
+        :param line: the command
+        :return: None
+        """
+        self.writer.write(f"{line}\n".encode())
+        await self.writer.drain()
+        reply = await self.receive()
+        if reply != "OK":
+            raise RuntimeError(f"{self.name} sent {line} and was answered {reply}")
+
+    async def decide(self, line: str) -> str:
+        """
+        decide pauses for a think time, sends a decision and times the wait for the server's reply
+        :param line: the decision
+        :return: the server's reply
+        """
+        if self.think_time > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+        sent = self.clock()
+        self.writer.write(f"{line}\n".encode())
+        await self.writer.drain()
+        reply = await self.receive()
+        self.round_trips.append(self.clock() - sent)
+        return reply
+
+    async def play(self, host: str, port: int, hands: int) -> None:
+        """
+        play connects, sits down and plays the given number of hands, then quits
+        :param host: the server's address
+        :param port: the server's port
+        :param hands: the number of hands to play
+        :return: None
+        """
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        try:
+            welcome = await self.receive()
+            if welcome != f"WELCOME blackjack {PROTOCOL_VERSION}":
+                raise RuntimeError(f"{self.name} was welcomed with {welcome}")
+            await self.command(f"NEW {_BANKROLL} {self.name}")
+            await self.command(f"SIT {self.name}")
+            for _ in range(hands):
+                line = await self.decide(f"BET {_BET}")
+                while not line.startswith("RESULT"):
+                    if line.startswith("TURN"):
+                        total = int(line.split()[1])
+                        line = await self.decide("HIT" if total < 17 else "STAND")
+                    elif line.startswith("HAND"):
+                        line = await self.receive()
+                    else:
+                        raise RuntimeError(f"{self.name} was sent {line} during a hand")
+                self.hands += 1
+            await self.command("QUIT")
+        finally:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def generate_load(
+    host: str,
+    port: int,
+    clients: int,
+    hands: int,
+    think_time: float = 0.0,
+    ramp_up: float = 0.0,
+    rng: Optional[random.Random] = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> LoadReport:
+    """
+    generate_load plays bots against a running server until every bot has played its hands. Each bot makes a player
+    of its own, with a name unique to the run, so the server's store gains a player for every bot
+    :param host: the server's address
+    :param port: the server's port
+    :param clients: the number of bots
+    :param hands: the number of hands each bot plays
+    :param think_time: the mean pause before each decision, in seconds
+    :param ramp_up: the time over which the bots connect, evenly spaced, in seconds, so the server is not sent every
+    connection at once
+    :param rng: draws the think times. If None, a new unseeded generator is used. This is dependency injection
+    :param clock: returns the current time in seconds. This is dependency injection
+    :return: a report of the run, without the server's CPU time
+    """
+    if clients <= 0:
+        raise ValueError(f"clients must be greater than zero, got {clients}")
+    if hands <= 0:
+        raise ValueError(f"hands must be greater than zero, got {hands}")
+    if think_time < 0 or ramp_up < 0:
+        raise ValueError(f"think_time and ramp_up cannot be negative, got {think_time} and {ramp_up}")
+    if rng is None:
+        rng = random.Random()
+    run = secrets.token_hex(4)
+    round_trips: list[float] = []
+    bots = [_Bot(f"load {run} {index}", think_time, rng, clock, round_trips) for index in range(clients)]
+
+    async def start(index: int, bot: _Bot) -> None:
+        if ramp_up > 0:
+            await asyncio.sleep(ramp_up * index / clients)
+        await bot.play(host, port, hands)
+
+    started = clock()
+    await asyncio.gather(*(start(index, bot) for index, bot in enumerate(bots)))
+    return LoadReport(clients, sum(bot.hands for bot in bots), clock() - started, round_trips, None)
+
+
+def _children_cpu_seconds() -> Optional[float]:
+    """
+    :return: the user and system CPU time of every child process that has finished, or None if it cannot be measured
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _process_cpu_seconds(pid: int) -> Optional[float]:
+    """
+    :param pid: a running process
+    :return: the user and system CPU time of the process so far, or None where /proc is not available
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "r") as file:
+            # The command name may hold spaces, so the fields are counted from the parenthesis that ends it
+            fields = file.read().rpartition(")")[2].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+async def _run_load(
+    clients: int,
+    hands: int,
+    think_time: float,
+    ramp_up: float,
+    rng: Optional[random.Random],
+) -> LoadReport:
+    with tempfile.TemporaryDirectory() as directory:
+        children_before = _children_cpu_seconds()
+        server = await asyncio.create_subprocess_exec(
+            sys.executable, "-u", "-m", "Blackjack.server", "--port", "0", "--store", str(Path(directory) / "load.db"),
+            stdout=asyncio.subprocess.PIPE,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        try:
+            line = await asyncio.wait_for(server.stdout.readline(), _STARTUP_TIMEOUT)
+            match = re.search(r", (\d+)\)", line.decode())
+            if match is None:
+                raise RuntimeError(f"The server did not start: {line.decode().strip() or 'no output'}")
+            started = _process_cpu_seconds(server.pid)
+            report = await generate_load("127.0.0.1", int(match.group(1)), clients, hands, think_time, ramp_up, rng)
+            finished = _process_cpu_seconds(server.pid)
+        finally:
+            if server.returncode is None:
+                server.terminate()
+            await server.wait()
+        children_after = _children_cpu_seconds()
+    if started is not None and finished is not None:
+        report.cpu_seconds = finished - started
+    elif children_before is not None and children_after is not None:
+        # Without /proc, the server's whole life is measured, including starting up
+        report.cpu_seconds = children_after - children_before
+    return report
+
+
+def run_load(
+    clients: int,
+    hands: int,
+    think_time: float = 0.0,
+    ramp_up: float = 0.0,
+    rng: Optional[random.Random] = None,
+) -> LoadReport:
+    """
+    run_load starts a server on a free localhost port, in a process of its own with a temporary player store, plays
+    bots against it as generate_load does, and stops it
+    :param clients: the number of bots
+    :param hands: the number of hands each bot plays
+    :param think_time: the mean pause before each decision, in seconds
+    :param ramp_up: the time over which the bots connect, in seconds
+    :param rng: draws the think times. If None, a new unseeded generator is used. This is dependency injection
+    :return: a report of the run, with the server's CPU time if it can be measured
+    """
+    return asyncio.run(_run_load(clients, hands, think_time, ramp_up, rng))
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """
+    main runs bots from the command line and prints a report
+    :param arguments: the command line arguments. If None, they are read from sys.argv
+    :return: the exit status
+    """
+    parser = argparse.ArgumentParser(description="Play bot clients against the table server and report on them")
+    parser.add_argument("--clients", type=int, default=100, help="the number of bots playing at once")
+    parser.add_argument("--hands", type=int, default=20, help="the number of hands each bot plays")
+    parser.add_argument("--think", type=float, default=0.0, help="the mean pause before each decision, in seconds")
+    parser.add_argument("--ramp-up", type=float, default=1.0, help="the time over which the bots connect, in seconds")
+    parser.add_argument("--host", default="127.0.0.1", help="the address of a running server, used with --port")
+    parser.add_argument("--port", type=int, default=None, help="play against a running server instead of starting one")
+    parser.add_argument("--seed", type=int, default=None, help="seeds the think times")
+    options = parser.parse_args(arguments)
+
+    rng = random.Random(options.seed)
+    if options.port is None:
+        report = run_load(options.clients, options.hands, options.think, options.ramp_up, rng)
+    else:
+        report = asyncio.run(
+            generate_load(
+                options.host, options.port, options.clients, options.hands, options.think, options.ramp_up, rng
+            )
+        )
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
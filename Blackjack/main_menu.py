@@ -3,6 +3,12 @@ Main menu generates the menu system for the game.
 
 It is implemented as a series of functions, rather than a class. It is also the main file for the application
 
+Players are kept in a SQLite player store at STORE_PATH. A player saved by an older version as a <name>.blackjack file
+in the working directory is imported into the store the first time they are loaded. Each hand played is appended to the
+player's hand journal in JOURNAL_DIRECTORY. Each time the journal takes a snapshot, its hands are replayed onto the
+stored player through the store's update, so hands the store has taken from anywhere else meanwhile are kept, and the
+journal file is removed.
+
 The module's external interface shall consist of
 main_menu() - displays the main menu, performs input validation and selects between three options, playing a new game,
 creating a player, showing stats
@@ -15,7 +21,75 @@ from pathlib import Path
 from typing import Optional
 
 from Blackjack.game import Game
-from Blackjack.player import Player, load_player, save_player
+from Blackjack.journal import HandJournal, HandRecord
+from Blackjack.player import Player
+from Blackjack.player_store import JsonPlayerStore, PlayerStore, SQLitePlayerStore, normalize_name
+
+STORE_PATH: Path = Path("players.db")
+JOURNAL_DIRECTORY: Path = Path("journals")
+
+
+def open_store() -> PlayerStore:
+    """
+    open_store opens the player store the menu reads and writes
+    :return: the player store
+    """
+    return SQLitePlayerStore(STORE_PATH)
+
+
+def open_journal(store: PlayerStore, name: str) -> HandJournal:
+    """
+    open_journal opens a player's hand journal, which saves its hands to the store at each snapshot
+    :param store: the player store
+    :param name: the player's name
+    :return: the hand journal
+    """
+    JOURNAL_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    path = JOURNAL_DIRECTORY / f"{normalize_name(name)}.journal"
+    return HandJournal(path, on_records=lambda records: _save_records(store, name, records))
+
+
+def _save_records(store: PlayerStore, name: str, records: list[HandRecord]) -> bool:
+    """
+    _save_records replays journalled hands onto the stored player. The store's update applies them to freshly loaded
+    stats, so no result saved by anything else since the player was loaded is overwritten. If the stored bankroll
+    cannot cover one of the hands, none of them are saved, and they are left in the journal
+    :param store: the player store
+    :param name: the player's name
+    :param records: the hands to save
+    :return: True if the hands were saved, or there were none to save
+    """
+    if not records or name not in store:
+        return True
+
+    def replay(player: Player) -> None:
+        for record in records:
+            player.bet = record.bet
+            if not player.update_stats((record.result, record.net_change)):
+                raise ValueError(f"The stored bankroll of {player.bankroll} cannot cover {record}")
+        player.bet = 0
+
+    try:
+        store.update(name, replay)
+    except ValueError as error:
+        print(f"{len(records)} hands could not be saved for {name}, and are kept in their journal: {error}")
+        return False
+    return True
+
+
+def _load(store: PlayerStore, name: str) -> Player:
+    """
+    _load loads a player from the store, importing them from their .blackjack file if they are not in it yet. Older
+    versions named the file with name.lower() rather than the normalized name, so that file is tried as well
+    :param store: the player store
+    :param name: the player's name
+    :return: the player
+    """
+    if name not in store:
+        for legacy in (JsonPlayerStore().path_for(name), Path(f"{name.lower()}.blackjack")):
+            if legacy.exists():
+                return store.import_json(legacy)
+    return store.load(name)
 
 
 def main_menu() -> None:
@@ -55,15 +129,16 @@ def main_menu() -> None:
 
 def new_hand() -> None:
     """
-    New hand runs a game of blackjack, and saves the players stats back to the player file
+    New hand runs a game of blackjack, and records the hand to the player's journal
     :return: None
     """
     playername = input("What player will be playing?")
-    path = Path(f"{playername.lower()}.blackjack")
-    player = load_player(path)
-    game = Game(player)
-    player.update_stats(game.new_hand())
-    save_player(player, path)
+    with open_store() as store:
+        player = _load(store, playername)
+        with open_journal(store, player.name) as journal:
+            player.attach_journal(journal)
+            game = Game(player)
+            player.update_stats(game.new_hand())
 
 
 def new_player() -> None:
@@ -80,7 +155,11 @@ def new_player() -> None:
         except ValueError:
             print("Invalid bankroll; please enter an integer")
     player = Player.from_name_bankroll(name, bankroll)
-    save_player(player, Path(f"{name.lower()}.blackjack"))
+    with open_store() as store:
+        # Hands left in an old journal under the name are saved to the old player first, so the new one starts afresh
+        with open_journal(store, player.name) as journal:
+            journal.snapshot(player.stats)
+        store.save(player)
     return player
 
 
@@ -90,7 +169,10 @@ def show_stats() -> None:
     :return: None
     """
     name = input("What player would you like to see stats for? ")
-    player = load_player(Path(f"{name.lower()}.blackjack"))
+    with open_store() as store:
+        player = _load(store, name)
+        with open_journal(store, player.name) as journal:
+            player.attach_journal(journal)
     print(player.stats)
 
 
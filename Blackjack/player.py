@@ -5,15 +5,29 @@ as well as the hand management of the player.
 
 import collections
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Mapping, Optional, Union
 
 from .card import Card
+from .decisions import AsyncDecisionSource, ConsoleDecisions, DecisionSource, PolicyDecisions
 from .game_participant import GameParticipant
 from .hand import Hand
+from .journal import HandJournal
 from .move import Move
+from .player_stats import PlayerStats
+from .policy import Policy
 from .result import Result
 
+if TYPE_CHECKING:
+    # The leaderboard imports the player store, which imports this module
+    from .leaderboard import Leaderboard
+
+
+# The console keeps no state, so every player prompted at the console shares one source
+_CONSOLE: ConsoleDecisions = ConsoleDecisions()
+
 
 class OutOfMoneyException(Exception):
     def __init__(self, message: str):
@@ -22,12 +36,59 @@ class OutOfMoneyException(Exception):
 
 
 class Player(GameParticipant):
-    def __init__(self, stats: dict):
+    def __init__(
+        self,
+        stats: Mapping,
+        policy: Optional[Policy] = None,
+        decisions: Optional[Union[DecisionSource, AsyncDecisionSource]] = None,
+    ):
+        """
+        :param stats: the player's stats, as created by from_name_bankroll or load_player. A dictionary is copied into a
+        PlayerStats, and a PlayerStats is used as it is
+        :param policy: an optional policy that makes the player's decisions. If None, the player is prompted with
+        input(). This is dependency injection
+        :param decisions: an optional source of the player's decisions, used in place of the policy. An asynchronous
+        source can only be played through ante_async and take_turn_async. This is dependency injection
+        """
         super().__init__()
         self.name: str = stats["name"]
-        self.stats: dict = stats
+        self.stats = stats
         self.bet: int = 0
         self.hand: Optional[Hand] = None
+        self.policy = policy
+        if decisions is not None:
+            self.decisions = decisions
+        self.journal: Optional[HandJournal] = None
+        self.leaderboard: Optional["Leaderboard"] = None
+
+    def attach_journal(self, journal: HandJournal) -> None:
+        """
+        attach_journal brings the player's stats up to date from a hand journal, and then records every hand the player
+        finishes to it. The stats are taken from the journal's last snapshot, if it has one, and the hands recorded
+        after it are replayed through update_stats
+        :param journal: the player's hand journal
+        :return: None
+        """
+        snapshot, records = journal.read()
+        self.journal = None
+        if snapshot is not None:
+            self.stats = dict(snapshot)
+        for record in records:
+            self.bet = record.bet
+            self.update_stats((record.result, record.net_change))
+        self.bet = 0
+        self.journal = journal
+        if self.leaderboard is not None:
+            self.leaderboard.update(self.stats)
+
+    def attach_leaderboard(self, leaderboard: "Leaderboard") -> None:
+        """
+        attach_leaderboard adds the player to a leaderboard, and then moves them on it each time their stats change
+        :param leaderboard: the leaderboard to keep up to date
+        :return: None
+        """
+        self.leaderboard = leaderboard
+        leaderboard.update(self.stats)
 
     @classmethod
     def from_name_bankroll(cls, name: str, bankroll: int):
@@ -50,15 +111,7 @@ class Player(GameParticipant):
                 A new instance of the Player class initialized with the provided
                 attributes.
         """
-        return Player(
-            {
-                "name": name,
-                "bankroll": bankroll,
-                "wins": 0,
-                "losses": 0,
-                "pushes": 0,
-            }
-        )
+        return Player(PlayerStats(name, bankroll))
 
     def deal_card(self, card: Card):
         """
@@ -69,20 +122,46 @@ class Player(GameParticipant):
             self.hand = Hand()
         self.hand.add_card(card)
 
+    @property
+    def stats(self) -> PlayerStats:
+        """The player's stats. They may be assigned a dictionary, which is copied into a PlayerStats."""
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: Mapping) -> None:
+        self._stats: PlayerStats = stats if isinstance(stats, PlayerStats) else PlayerStats.from_dict(stats)
+
+    @property
+    def policy(self) -> Optional[Policy]:
+        """The policy making the player's decisions, or None if they come from another source."""
+        if isinstance(self.decisions, PolicyDecisions):
+            return self.decisions.policy
+        return None
+
+    @policy.setter
+    def policy(self, policy: Optional[Policy]) -> None:
+        """Setting a policy makes it the player's source of decisions. Setting None prompts at the console again."""
+        self.decisions: Union[DecisionSource, AsyncDecisionSource] = (
+            _CONSOLE if policy is None else PolicyDecisions(policy)
+        )
+
     @property
     def bankroll(self) -> int:
-        """Get the current bankroll amount from the stats dictionary."""
-        return self.stats["bankroll"]
+        """Get the current bankroll amount from the stats."""
+        try:
+            return self._stats.bankroll
+        except AttributeError:
+            raise KeyError("bankroll") from None
 
     @bankroll.setter
     def bankroll(self, new_amount: int) -> None:
-        """Set the bankroll amount directly in the stats dictionary."""
+        """Set the bankroll amount directly in the stats."""
         if new_amount < 0:
             raise OutOfMoneyException(
                 f"Bankroll cannot be negative. Attempted to set: {new_amount}"
             )
 
-        self.stats["bankroll"] = new_amount
+        self._stats.bankroll = new_amount
 
     def update_stats(self, result_tuple: tuple) -> bool:
         """
@@ -98,22 +177,39 @@ class Player(GameParticipant):
                                   (e.g., Result.VICTORY, Result.PUSH), and the monetary outcome
                                   is a numeric value representing the gain or loss.
 
+        If the player has a hand journal attached, the hand is recorded to it, and if the player has a leaderboard
+        attached, they are moved to their new rank on it.
+
         Returns:
             bool: True if the stats and bankroll were successfully updated, False otherwise.
         """
+        updated = self._apply_result(result_tuple)
+        if updated and self.journal is not None:
+            self.journal.record(result_tuple[0], self.bet, result_tuple[1], self.stats)
+        if updated and self.leaderboard is not None:
+            self.leaderboard.update(self.stats)
+        return updated
+
+    def _apply_result(self, result_tuple: tuple) -> bool:
+        """
+        _apply_result makes the changes to the stats and bankroll described in update_stats
+        :param result_tuple: the result of the game and its monetary outcome
+        :return: True if the stats and bankroll were updated
+        """
+        stats = self._stats
         if result_tuple[0] == Result.VICTORY:
             if result_tuple[1] > 0:
-                self.stats.update({"wins": self.stats.get("wins",0) + 1})
+                stats.wins = getattr(stats, "wins", 0) + 1
                 self.bankroll += result_tuple[1]
                 return True
             else:
                 return False
         elif result_tuple[0] == Result.PUSH:
-            self.stats.update({"pushes": self.stats.get("pushes",0) + 1})
+            stats.pushes = getattr(stats, "pushes", 0) + 1
             return True
         else:
             if 0 > result_tuple[1] >= -self.bankroll:
-                self.stats.update({"losses": self.stats.get("losses",0) + 1})
+                stats.losses = getattr(stats, "losses", 0) + 1
                 self.bankroll += result_tuple[1]
                 return True
             else:
@@ -124,35 +220,64 @@ class Player(GameParticipant):
         Handles the ante process where the player must place a bet at the beginning of a game round.
 
         Summary:
-        This function asks the player to place a bet (ante) and ensures that the bet is a valid
+        This function asks the player's decision source for a bet (ante) and ensures that the bet is a valid
         integer within the player's available bankroll. If the bankroll is zero, an exception
-        is raised. The betting process continues until the player inputs a valid value.
+        is raised. At the console, the player is asked until they input a valid value.
 
         Raises:
             OutOfMoneyException: Raised if the player's bankroll is zero when the function is called.
+            ValueError: Raised if a decision source other than the console gives a bet outside the bankroll.
 
         Attributes:
             bet (int): Represents the amount the player wagers during the ante process. Must be
             set only after valid input from the player.
 
+        """
+        self.check_bankroll()
+        self.place_bet(self._sync_decisions().bet(self.bankroll))
+
+    async def ante_async(self) -> None:
+        """
+        ante_async places a bet as ante does, awaiting the bet if the player's decision source is asynchronous
+        :return: None
+        """
+        self.check_bankroll()
+        decisions = self.decisions
+        if isinstance(decisions, AsyncDecisionSource):
+            bet = await decisions.bet(self.bankroll)
+        else:
+            bet = decisions.bet(self.bankroll)
+        self.place_bet(bet)
+
+    def check_bankroll(self) -> None:
+        """
+        check_bankroll makes sure the player has money to ante with, before they are asked for a bet
+        :return: None
+        :raises OutOfMoneyException: if the bankroll is zero
         """
         if self.bankroll == 0:
             raise OutOfMoneyException(
                 "You're broke! Please add more money to your bankroll!"
             )
-        bet = None
-        while not bet:
-            try:
-                print(f"Ante up! Your current bankroll is {self.bankroll}.")
-                bet = int(
-                    input(f"Please enter a number between 1 and {self.bankroll}:\t")
-                )
-                if bet > self.bankroll or bet <= 0:
-                    bet = None
-            except Exception:
-                print("Please enter an integer greater than zero!")
+
+    def place_bet(self, bet: int) -> None:
+        """
+        place_bet checks a bet from a decision source and makes it the player's bet
+        :param bet: the bet
+        :return: None
+        """
+        if bet > self.bankroll or bet <= 0:
+            raise ValueError(f"Bet {bet} is not between 1 and {self.bankroll}")
         self.bet = bet
 
+    def _sync_decisions(self) -> DecisionSource:
+        """
+        :return: the player's decision source, once it is checked to answer without being awaited
+        """
+        if isinstance(self.decisions, AsyncDecisionSource):
+            raise TypeError(f"{self.name}'s decisions must be awaited; use ante_async and take_turn_async")
+        return self.decisions
+
     def double_down(self) -> bool:
         """
         Doubles the current bet if there are sufficient funds in the bankroll. The player will recieve exactly one
@@ -171,15 +296,21 @@ class Player(GameParticipant):
         else:
             return False
 
-    def take_turn(self, deck: collections.deque) -> Move:
+    def take_turn(
+        self, deck: collections.deque, dealer_upcard: Optional[Card] = None
+    ) -> Move:
         """
-        Prompts the player to take their turn in a card game and processes their chosen move.
+        Asks the player's decision source for their move in a card game and processes it.
         The player can select one of three moves: 'Hit', 'Stand', or 'Double Down'. Based on
         their choice, the method updates the state of the player's hand as well as processes
         the deck accordingly.
 
+        At the console the player is prompted with input(). Any other source, such as a policy, chooses the move
+        without anything being printed or read from the console.
+
         Parameters:
             deck (collections.deque): The deck of cards used in the game, stored as a deque.
+            dealer_upcard (Optional[Card]): The dealer's face up card, passed on to the decision source.
 
         Returns:
             Move: An enumeration indicating the move chosen by the player:
@@ -190,30 +321,44 @@ class Player(GameParticipant):
         Raises:
             TypeError: If the deck is not a collections.deque.
         """
-        print("Please take your turn")
-        result = None
-        while not result:
-            move = input("Enter 'Hit', 'Stand' or 'Double Down': ")
-            move = move.strip()
-            move = move.lower()
-            if move == "hit":
-                if self.hand is not None:
-                    self.hand.add_card(deck.pop())
-                else:
-                    raise AttributeError("Hand is None")
-                result = Move.HIT
-            elif move == "stand":
-                result = Move.STAND
-            elif move == "double down":
-                if self.double_down():
-                    if self.hand is not None:
-                        self.hand.add_card(deck.pop())
-                    else:
-                        raise AttributeError("Hand is None")
-                    result = Move.DOUBLE_DOWN
-                else:
-                    print("You don't have enough money to double down.")
-        return result
+        move = self._sync_decisions().decide(self.hand, dealer_upcard, self.bet <= self.bankroll / 2)
+        return self.play_move(move, deck)
+
+    async def take_turn_async(
+        self, deck: collections.deque, dealer_upcard: Optional[Card] = None
+    ) -> Move:
+        """
+        take_turn_async plays a move as take_turn does, awaiting the move if the player's decision source is
+        asynchronous
+        :param deck: the deck of cards used in the game
+        :param dealer_upcard: the dealer's face up card, passed on to the decision source
+        :return: the move that was played
+        """
+        decisions = self.decisions
+        can_double = self.bet <= self.bankroll / 2
+        if isinstance(decisions, AsyncDecisionSource):
+            move = await decisions.decide(self.hand, dealer_upcard, can_double)
+        else:
+            move = decisions.decide(self.hand, dealer_upcard, can_double)
+        return self.play_move(move, deck)
+
+    def play_move(self, move: Move, deck: collections.deque) -> Move:
+        """
+        play_move applies a move from a decision source to the hand. A double down that the bankroll cannot cover is
+        played as a hit.
+        :param move: the move chosen by the decision source
+        :param deck: the deck of cards used in the game
+        :return: the move that was played
+        """
+        if move == Move.STAND:
+            return Move.STAND
+        if self.hand is None:
+            raise AttributeError("Hand is None")
+        if move == Move.DOUBLE_DOWN and self.double_down():
+            self.hand.add_card(deck.pop())
+            return Move.DOUBLE_DOWN
+        self.hand.add_card(deck.pop())
+        return Move.HIT
 
     def __eq__(self, other):
         """
@@ -238,11 +383,34 @@ def load_player(path: Path) -> Player:
 def save_player(
     player: Player,
     path: Path,
+    fsync: bool = False,
 ) -> None:
     """
     Save player is a module function that saves a player to a stats file. Note that hand is not saved.
+    The stats are written to a new temporary file beside the target, which is then renamed over it. A crash part way
+    through leaves the old file whole, so a loaded file is never half-written.
     :param player: The player to save
     :param path: The filepath to save to
+    :param fsync: if True, the file is forced to disk before the rename, and the rename after it, so that the save
+    also survives a power failure
     """
-    with open(path, "w") as file:
-        json.dump(player.stats, file)
+    path = Path(path)
+    # Each save gets a temporary file of its own, so saves of the same player at the same time cannot write into one
+    file = tempfile.NamedTemporaryFile("w", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    temporary = Path(file.name)
+    try:
+        with file:
+            json.dump(player.stats.to_dict(), file)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        directory = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
@@ -0,0 +1,74 @@
+"""
+Player cache keeps the stats of recently loaded players in memory, so that loading the same player again does not
+reopen and re-parse their file. Each cached entry remembers the file's modification time and size, and is only used
+while the file still has them, so a file edited or replaced outside the cache is read afresh on the next load.
+
+The cache holds a bounded number of players, evicting the least recently loaded first. Every load returns a new Player
+with its own copy of the stats, so a change made to one loaded player never leaks into the cache or into another.
+
+The module's external interface shall consist of
+PlayerCache - the cache class
+"""
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from .player import Player, load_player
+
+
+class PlayerCache:
+    def __init__(self, capacity: int = 128):
+        """
+        :param capacity: the greatest number of players held at once
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be greater than zero, got {capacity}")
+        self.capacity: int = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        # Each path maps to the file's (modification time, size) when it was read, and the stats read from it
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+
+    def load(self, path: Path) -> Player:
+        """
+        load loads a player as load_player does, from memory if the file has not changed since it was last read
+        :param path: the file to load from
+        :return: a player object
+        """
+        path = Path(path)
+        status = os.stat(path)
+        version = (status.st_mtime_ns, status.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self._entries.move_to_end(path)
+            return Player(dict(entry[1]))
+        self.misses += 1
+        player = load_player(path)
+        self._entries[path] = (version, dict(player.stats))
+        self._entries.move_to_end(path)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return player
+
+    def invalidate(self, path: Path) -> None:
+        """
+        invalidate drops a file from the cache, for when it is rewritten too quickly for its modification time to change
+        :param path: the file to drop
+        :return: None
+        """
+        self._entries.pop(Path(path), None)
+
+    def clear(self) -> None:
+        """
+        clear drops every file from the cache. The hit and miss counts are kept
+        :return: None
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: Path) -> bool:
+        return Path(path) in self._entries
@@ -0,0 +1,108 @@
+"""
+Player stats holds a player's name, bankroll and counts of wins, losses and pushes. The stats are kept in slots rather
+than a dictionary, so each player's stats take a fraction of the memory and a hand's result is recorded with a couple of
+attribute writes rather than dictionary lookups.
+
+PlayerStats still behaves as the dictionary of stats it replaces: it can be read and written by key, compared equal to
+a dictionary with the same items, and turned into one with dict(). Any key other than the five stats is kept alongside
+them, and a stat that was never set is missing, as it would be from a dictionary. A player's file is the JSON of
+to_dict(), exactly as before.
+
+The module's external interface shall consist of
+STAT_NAMES - the stats held in slots, in file order
+PlayerStats - the stats class
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Iterator, Optional
+
+STAT_NAMES: tuple[str, ...] = ("name", "bankroll", "wins", "losses", "pushes")
+
+
+class PlayerStats(MutableMapping):
+    __slots__ = STAT_NAMES + ("_extra",)
+
+    def __init__(self, name: str, bankroll: int, wins: int = 0, losses: int = 0, pushes: int = 0):
+        """
+        :param name: the player's name
+        :param bankroll: the player's bankroll
+        :param wins: the number of hands won
+        :param losses: the number of hands lost
+        :param pushes: the number of hands pushed
+        """
+        self.name = name
+        self.bankroll = bankroll
+        self.wins = wins
+        self.losses = losses
+        self.pushes = pushes
+        # Any other keys, only made when there are some
+        self._extra: Optional[dict] = None
+
+    @classmethod
+    def from_dict(cls, stats: Mapping) -> "PlayerStats":
+        """
+        from_dict makes stats from a dictionary, such as one read from a player's file. Only the keys present are set
+        :param stats: the stats dictionary
+        :return: the stats
+        """
+        result = cls.__new__(cls)
+        result._extra = None
+        for key, value in stats.items():
+            result[key] = value
+        return result
+
+    def to_dict(self) -> dict:
+        """
+        :return: the stats as a dictionary, as written to a player's file
+        """
+        return dict(self.items())
+
+    def __getitem__(self, key: str):
+        if key in STAT_NAMES:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in STAT_NAMES:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in STAT_NAMES:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in STAT_NAMES:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(hasattr(self, key) for key in STAT_NAMES) + (len(self._extra) if self._extra is not None else 0)
+
+    def __contains__(self, key) -> bool:
+        if key in STAT_NAMES:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"PlayerStats({self.to_dict()!r})"
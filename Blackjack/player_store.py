@@ -0,0 +1,403 @@
+"""
+A player store keeps every player's stats in one place, looked up by name. Names are normalized before they are used as
+keys, so "Alice", "alice" and " ALICE " are the same player, as they were when the name was lowercased into a filename.
+
+Two stores are provided. JsonPlayerStore keeps the original layout of one <name>.blackjack file per player in a
+directory. SQLitePlayerStore keeps every player in a single SQLite database, indexed by normalized name and run in
+write-ahead log mode, so a load or save touches one row however many players there are, and any number of saves can be
+batched into a single transaction. The .blackjack files remain the import and export format for every store.
+
+A save replaces a player's stats outright, so of two processes saving the same player, the last one wins. An update
+instead applies a change to the player's latest stats, so that concurrent updates from many processes are all kept.
+JsonPlayerStore holds an advisory lock on the player while it loads, changes and saves them. SQLitePlayerStore keeps a
+version number on each player, bumped by every write, and saves an update only if the version is unchanged since the
+player was loaded, reloading and applying the change again if it was not.
+
+The module's external interface shall consist of
+normalize_name() - the key a player's name is stored under
+PlayerStore - the abstract base class all stores implement
+JsonPlayerStore - one JSON file per player in a directory
+SQLitePlayerStore - every player in a SQLite database
+UpdateConflictError - raised when an update keeps losing to concurrent writers
+"""
+
+import sqlite3
+import unicodedata
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:
+    # Windows has no fcntl, and locks through msvcrt instead
+    fcntl = None
+    import msvcrt
+
+from .player import Player, load_player, save_player
+from .player_cache import PlayerCache
+
+_STAT_COLUMNS: tuple[str, ...] = ("name", "bankroll", "wins", "losses", "pushes")
+
+
+class UpdateConflictError(RuntimeError):
+    """
+    UpdateConflictError is raised when a player changed under every attempt to update them.
+    """
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """
+    _locked holds an exclusive advisory lock on a file, creating it if need be, waiting for any other holder to release
+    it first
+    :param path: the lock file
+    """
+    with open(path, "a+b") as file:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def normalize_name(name: str) -> str:
+    """
+    :param name: a player's name, as typed
+    :return: the name with surrounding whitespace removed, inner whitespace collapsed and case folded
+    """
+    normalized = " ".join(unicodedata.normalize("NFKC", name).split()).casefold()
+    if not normalized:
+        raise ValueError("A player's name cannot be blank")
+    return normalized
+
+
+class PlayerStore(ABC):
+    @abstractmethod
+    def load(self, name: str) -> Player:
+        """
+        Load a player by name.
+
+        Args:
+            name (str): The player's name, in any case.
+
+        Returns:
+            Player: The stored player.
+
+        Raises:
+            KeyError: If there is no player by that name.
+        """
+        pass
+
+    @abstractmethod
+    def save_many(self, players: Iterable[Player]) -> None:
+        """
+        Save a number of players together, adding any that are new and replacing the stats of any that are not.
+
+        Args:
+            players (Iterable[Player]): The players to save.
+        """
+        pass
+
+    @abstractmethod
+    def names(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The name of every stored player, as it was first entered, in order of normalized name.
+        """
+        pass
+
+    def players(self) -> Iterator[Player]:
+        """
+        players yields every stored player, one at a time, so that they need not all be held in memory at once
+        :return: an iterator of players
+        """
+        for name in self.names():
+            yield self.load(name)
+
+    def save(self, player: Player) -> None:
+        """
+        save adds a new player, or replaces the stats of an existing one
+        :param player: the player to save
+        :return: None
+        """
+        self.save_many([player])
+
+    def update(self, name: str, change: Callable[[Player], object]) -> Player:
+        """
+        update loads a player, applies a change to them and saves them. This version is only safe within a single
+        process; stores that can be shared between processes override it, so that no concurrent update is lost
+        :param name: the player's name
+        :param change: changes the player in place. It may be applied more than once, each time to freshly loaded
+        stats, so it should describe a change, such as a hand's result, rather than an outcome
+        :return: the player, as saved
+        """
+        player = self.load(name)
+        change(player)
+        self.save(player)
+        return player
+
+    def apply_result(self, name: str, result_tuple: tuple) -> Player:
+        """
+        apply_result updates a player's stats and bankroll with the result of a hand, as Player.update_stats does,
+        without losing the results of hands other processes are applying at the same time
+        :param name: the player's name
+        :param result_tuple: the result of the hand and the net change to the bankroll
+        :return: the player, as saved
+        """
+        return self.update(name, lambda player: player.update_stats(result_tuple))
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            self.load(name)
+        except KeyError:
+            return False
+        return True
+
+    def import_json(self, path: Path) -> Player:
+        """
+        import_json adds a player from a .blackjack file, as written by save_player
+        :param path: the file to import
+        :return: the imported player
+        """
+        player = load_player(path)
+        self.save(player)
+        return player
+
+    def export_json(self, name: str, path: Path) -> None:
+        """
+        export_json writes a stored player to a .blackjack file, which load_player can read
+        :param name: the player's name
+        :param path: the file to write
+        :return: None
+        """
+        save_player(self.load(name), path)
+
+    def close(self) -> None:
+        """
+        close releases anything the store holds open. The store cannot be used afterwards
+        :return: None
+        """
+        pass
+
+    def __enter__(self) -> "PlayerStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class JsonPlayerStore(PlayerStore):
+    """
+    JsonPlayerStore keeps each player in their own .blackjack file, named for the normalized name. Every save rewrites
+    the whole file, so it suits a handful of players.
+    """
+
+    def __init__(self, directory: Path = Path("."), fsync: bool = False, cache: Optional[PlayerCache] = None):
+        """
+        :param directory: the directory holding the player files
+        :param fsync: if True, every save is forced to disk, as described in save_player
+        :param cache: an optional cache that loads are served from while the player's file is unchanged. This is
+        dependency injection
+        """
+        self.directory: Path = Path(directory)
+        self.fsync: bool = fsync
+        self.cache: Optional[PlayerCache] = cache
+        # Matches every player file, relative to the directory
+        self._pattern: str = "*.blackjack"
+
+    def path_for(self, name: str) -> Path:
+        """
+        :param name: a player's name
+        :return: the file that player is stored in
+        """
+        return self.directory / f"{normalize_name(name)}.blackjack"
+
+    def load(self, name: str) -> Player:
+        path = self.path_for(name)
+        try:
+            if self.cache is not None:
+                return self.cache.load(path)
+            return load_player(path)
+        except FileNotFoundError:
+            raise KeyError(name) from None
+
+    def save_many(self, players: Iterable[Player]) -> None:
+        for player in players:
+            path = self.path_for(player.name)
+            save_player(player, path, self.fsync)
+            if self.cache is not None:
+                self.cache.invalidate(path)
+
+    def update(self, name: str, change: Callable[[Player], object]) -> Player:
+        path = self.path_for(name)
+        # The lock file is only made for a player who has been saved, so names with no player leave nothing behind
+        if not path.is_file():
+            raise KeyError(name)
+        # The lock is held on a file of its own, as a save replaces the player's file rather than writing into it
+        with _locked(path.with_name(f".{path.name}.lock")):
+            # The cache is passed over, as a file rewritten within the same clock tick can look unchanged to it
+            try:
+                player = load_player(path)
+            except FileNotFoundError:
+                raise KeyError(name) from None
+            change(player)
+            self.save(player)
+        return player
+
+    def names(self) -> list[str]:
+        players = (load_player(path) for path in sorted(self.directory.glob(self._pattern)))
+        return [player.name for player in sorted(players, key=lambda player: normalize_name(player.name))]
+
+    def players(self) -> Iterator[Player]:
+        for path in sorted(self.directory.glob(self._pattern)):
+            yield load_player(path)
+
+
+class SQLitePlayerStore(PlayerStore):
+    """
+    SQLitePlayerStore keeps every player in one table of a SQLite database, with the normalized name as its primary key.
+    """
+
+    def __init__(self, path: Union[Path, str] = Path("players.db"), retries: int = 20):
+        """
+        __init__ opens the database, creating it and its table if they do not exist
+
+        :param path: the database file, or ":memory:" for a database that is discarded when the store is closed
+        :param retries: the number of times an update is attempted before it gives up with an UpdateConflictError
+        """
+        if retries <= 0:
+            raise ValueError(f"retries must be greater than zero, got {retries}")
+        self.path: Union[Path, str] = path
+        self.retries: int = retries
+        self._connection: sqlite3.Connection = sqlite3.connect(path)
+        # Readers are not blocked by a writer in WAL mode, and a commit need not wait for a full sync
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS players (
+                    normalized_name TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    bankroll INTEGER NOT NULL,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    losses INTEGER NOT NULL DEFAULT 0,
+                    pushes INTEGER NOT NULL DEFAULT 0,
+                    version INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+                """
+            )
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(players)")]
+            if "version" not in columns:
+                # A database made before players were versioned
+                self._connection.execute("ALTER TABLE players ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    def load(self, name: str) -> Player:
+        row = self._connection.execute(
+            f"SELECT {', '.join(_STAT_COLUMNS)} FROM players WHERE normalized_name = ?",
+            (normalize_name(name),),
+        ).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return Player(dict(zip(_STAT_COLUMNS, row)))
+
+    def save_many(self, players: Iterable[Player]) -> None:
+        rows = (
+            (
+                normalize_name(player.name),
+                player.name,
+                player.bankroll,
+                player.stats.get("wins", 0),
+                player.stats.get("losses", 0),
+                player.stats.get("pushes", 0),
+            )
+            for player in players
+        )
+        # The name a player was first saved under is kept, so a player typed in a different case is not renamed
+        with self._connection:
+            self._connection.executemany(
+                """
+                INSERT INTO players (normalized_name, name, bankroll, wins, losses, pushes)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (normalized_name) DO UPDATE SET
+                    bankroll = excluded.bankroll,
+                    wins = excluded.wins,
+                    losses = excluded.losses,
+                    pushes = excluded.pushes,
+                    version = players.version + 1
+                """,
+                rows,
+            )
+
+    def version(self, name: str) -> int:
+        """
+        :param name: a player's name
+        :return: the player's version, which every write to the player increases
+        """
+        row = self._connection.execute(
+            "SELECT version FROM players WHERE normalized_name = ?", (normalize_name(name),)
+        ).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return row[0]
+
+    def update(self, name: str, change: Callable[[Player], object]) -> Player:
+        normalized = normalize_name(name)
+        for _ in range(self.retries):
+            row = self._connection.execute(
+                f"SELECT {', '.join(_STAT_COLUMNS)}, version FROM players WHERE normalized_name = ?", (normalized,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(name)
+            player = Player(dict(zip(_STAT_COLUMNS, row)))
+            change(player)
+            # The update only lands if nothing else has written the player since they were read
+            with self._connection:
+                cursor = self._connection.execute(
+                    """
+                    UPDATE players SET bankroll = ?, wins = ?, losses = ?, pushes = ?, version = version + 1
+                    WHERE normalized_name = ? AND version = ?
+                    """,
+                    (
+                        player.bankroll,
+                        player.stats.get("wins", 0),
+                        player.stats.get("losses", 0),
+                        player.stats.get("pushes", 0),
+                        normalized,
+                        row[-1],
+                    ),
+                )
+            if cursor.rowcount == 1:
+                return player
+        raise UpdateConflictError(f"{name} was changed by another writer on each of {self.retries} attempts")
+
+    def names(self) -> list[str]:
+        return [name for (name,) in self._connection.execute("SELECT name FROM players ORDER BY normalized_name")]
+
+    def players(self) -> Iterator[Player]:
+        # The rows are fetched as they are iterated, rather than all at once
+        cursor = self._connection.execute(f"SELECT {', '.join(_STAT_COLUMNS)} FROM players ORDER BY normalized_name")
+        for row in cursor:
+            yield Player(dict(zip(_STAT_COLUMNS, row)))
+
+    def __contains__(self, name: str) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM players WHERE normalized_name = ?", (normalize_name(name),)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,66 @@
+"""
+A policy makes the decisions that a human player would otherwise type at the console: how much to ante, and whether to
+hit, stand or double down. Giving a Player a policy lets a Game run headless, with no calls to input() or print().
+
+The module's external interface shall consist of
+Policy - the abstract base class all policies implement
+DealerMimicPolicy - a flat betting policy that plays the player's hand by the dealer's rule
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from .card import Card
+from .hand import Hand
+from .move import Move
+
+
+class Policy(ABC):
+    @abstractmethod
+    def bet(self, bankroll: int) -> int:
+        """
+        Choose the ante for a new hand.
+
+        Args:
+            bankroll (int): The player's current bankroll. Always greater than zero.
+
+        Returns:
+            int: The ante, which must be between 1 and bankroll inclusive.
+        """
+        pass
+
+    @abstractmethod
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        """
+        Choose the next move for the player's hand.
+
+        Args:
+            hand (Hand): The player's current hand.
+            dealer_upcard (Optional[Card]): The dealer's face up card, or None if it is not known.
+            can_double (bool): True if the player has enough bankroll to double the current bet.
+
+        Returns:
+            Move: The move to make. A DOUBLE_DOWN returned when can_double is False is played as a HIT.
+        """
+        pass
+
+
+class DealerMimicPolicy(Policy):
+    """
+    DealerMimicPolicy bets a flat amount and hits below 17, exactly as the dealer does. It never doubles down. It is
+    mainly useful as a baseline when validating the house edge.
+    """
+
+    def __init__(self, bet_size: int = 1):
+        """
+        :param bet_size: the flat ante placed on every hand. It is capped at the player's bankroll.
+        """
+        if bet_size <= 0:
+            raise ValueError(f"bet_size must be greater than zero, got {bet_size}")
+        self.bet_size: int = bet_size
+
+    def bet(self, bankroll: int) -> int:
+        return min(self.bet_size, bankroll)
+
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        return Move.HIT if hand.get_total() < 17 else Move.STAND
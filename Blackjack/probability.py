@@ -0,0 +1,245 @@
+"""
+Probability computes exact probabilities for the dealer's hand. The dealer's play in Dealer.take_turn is fixed, hitting
+below 17 and standing on anything else, so the chance of each final total can be worked out exactly from the upcard and
+the cards left in the shoe rather than simulated.
+
+Cards are handled by rank, from 1 for an ace up to 10 for any ten-value card. A shoe composition is a tuple of ten
+counts, the number of cards of each rank left unseen, aces first. A composition of None is an infinite deck, where each
+rank is always drawn with the same probability as from a fresh deck.
+
+Results are memoized on the composition, so any query after the first for the same upcard and composition is a
+dictionary lookup. The caches are bounded, so a long run through many shoes does not grow them without limit. The
+memoized recursions key the composition by a single integer, with the count of each rank packed into its own bits, so
+that taking out a card is one subtraction and hashing a position does not walk a tuple of counts.
+
+The module's external interface shall consist of
+OUTCOMES, BUST, NATURAL - the order of the outcomes in a probability table, and the indexes of bust and natural
+RANKS, Composition - the ranks in composition order, and the type of a composition
+CompositionKey - the type of a compact composition key
+card_rank() - the rank of a card
+composition_of() - the composition of a collection of cards
+shoe_composition() - the composition of a full shoe
+remove_rank(), draw_probabilities(), hand_total() - helpers for working with compositions and hands by rank
+composition_key(), key_composition(), key_replaces(), remove_key_rank(), key_draw_probabilities() - the same for
+compact keys
+dealer_outcomes(), dealer_key_outcomes() - the probability of each final outcome for the dealer, from any position
+dealer_probabilities() - the probability of each final outcome for the dealer, given an upcard
+dealer_table() - dealer_probabilities for every upcard
+"""
+
+import collections
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from .card import Card
+from .value import Value
+
+# A table lists the probability of the dealer finishing on 17, 18, 19, 20 or 21 with three or more cards, busting, or
+# holding a natural 21 of two cards, in that order
+OUTCOMES: tuple[str, ...] = ("17", "18", "19", "20", "21", "bust", "natural")
+BUST: int = 5
+NATURAL: int = 6
+
+RANKS: tuple[int, ...] = tuple(range(1, 11))
+_INFINITE_PROBABILITIES: tuple[float, ...] = tuple([1 / 13] * 9 + [4 / 13])
+_CACHE_SIZE: int = 1 << 20
+
+# Each rank's count takes this many bits of a composition key, enough for a shoe of over thirty decks
+_KEY_BITS: int = 9
+_KEY_MASK: int = (1 << _KEY_BITS) - 1
+_KEY_UNITS: tuple[int, ...] = tuple(1 << (_KEY_BITS * (rank - 1)) for rank in RANKS)
+
+Composition = Optional[tuple[int, ...]]
+CompositionKey = Optional[int]
+
+
+def card_rank(card: Card) -> int:
+    """
+    :param card: the card
+    :return: the rank of the card: 1 for an ace, otherwise its score
+    """
+    return 1 if card.value is Value.ACE else card.value.score
+
+
+def composition_of(cards: Iterable[Card]) -> tuple[int, ...]:
+    """
+    :param cards: any collection of cards
+    :return: the number of cards of each rank in the collection, aces first
+    """
+    counts = collections.Counter(card_rank(card) for card in cards)
+    return tuple(counts[rank] for rank in RANKS)
+
+
+def shoe_composition(decks: int) -> tuple[int, ...]:
+    """
+    :param decks: the number of decks in the shoe
+    :return: the composition of a full shoe
+    """
+    return tuple([4 * decks] * 9 + [16 * decks])
+
+
+def remove_rank(composition: Composition, rank: int) -> Composition:
+    """
+    :param composition: a shoe composition, or None for an infinite deck
+    :param rank: the rank of the card removed from the shoe
+    :return: the composition with one card of that rank removed
+    """
+    if composition is None:
+        return None
+    counts = list(composition)
+    counts[rank - 1] -= 1
+    return tuple(counts)
+
+
+def draw_probabilities(composition: Composition) -> tuple[float, ...]:
+    """
+    :param composition: a shoe composition, or None for an infinite deck
+    :return: the probability of drawing each rank next
+    """
+    if composition is None:
+        return _INFINITE_PROBABILITIES
+    remaining = sum(composition)
+    if remaining == 0:
+        raise ValueError("Cannot draw from an empty shoe")
+    return tuple(count / remaining for count in composition)
+
+
+def composition_key(composition: Composition, replacement: bool = False) -> CompositionKey:
+    """
+    :param composition: a shoe composition, or None for an infinite deck
+    :param replacement: if True, the key draws from the composition with replacement, so that the odds of each rank
+    stay fixed however many cards are drawn. This is an infinite deck in the proportions of the composition
+    :return: the compact key of the composition, or None for an infinite deck
+    """
+    if composition is None:
+        return None
+    if len(composition) != len(RANKS) or not all(0 <= count <= _KEY_MASK for count in composition):
+        raise ValueError(f"A composition needs {len(RANKS)} counts between 0 and {_KEY_MASK}, got {composition}")
+    key = sum(count * unit for count, unit in zip(composition, _KEY_UNITS))
+    if not replacement:
+        return key
+    if key == 0:
+        raise ValueError("Cannot draw from an empty shoe")
+    # Keys drawn with replacement are negative, so they never share a cache entry with the same cards drawn without
+    return -key
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def key_composition(key: CompositionKey) -> Composition:
+    """
+    :param key: a compact composition key, or None for an infinite deck
+    :return: the composition the key stands for
+    """
+    if key is None:
+        return None
+    key = abs(key)
+    return tuple(key >> (_KEY_BITS * (rank - 1)) & _KEY_MASK for rank in RANKS)
+
+
+def key_replaces(key: CompositionKey) -> bool:
+    """
+    :param key: a compact composition key, or None for an infinite deck
+    :return: True if cards are drawn with replacement, so drawing one does not change the odds of the next
+    """
+    return key is None or key < 0
+
+
+def remove_key_rank(key: CompositionKey, rank: int) -> CompositionKey:
+    """
+    :param key: a compact composition key, or None for an infinite deck
+    :param rank: the rank of the card removed from the shoe, which must be in it
+    :return: the key with one card of that rank removed
+    """
+    return key if key is None or key < 0 else key - _KEY_UNITS[rank - 1]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def key_draw_probabilities(key: CompositionKey) -> tuple[float, ...]:
+    """
+    :param key: a compact composition key, or None for an infinite deck
+    :return: the probability of drawing each rank next
+    """
+    return draw_probabilities(key_composition(key))
+
+
+def hand_total(hard: int, has_ace: bool) -> int:
+    """
+    hand_total applies the ace rule of Hand.get_total: one ace counts as 11 if that does not bust the hand
+    :param hard: the total with every ace counted as 1
+    :param has_ace: True if the hand holds at least one ace
+    :return: the total of the hand
+    """
+    return hard + 10 if has_ace and hard <= 11 else hard
+
+
+def dealer_outcomes(hard: int, has_ace: bool, composition: Composition) -> tuple[float, ...]:
+    """
+    dealer_outcomes plays out the dealer's hand from any position, hitting below 17. A hand reaching 21 here is never
+    counted as a natural; see dealer_probabilities for that
+    :param hard: the dealer's total with every ace counted as 1
+    :param has_ace: True if the dealer holds at least one ace
+    :param composition: the composition the dealer draws from, or None for an infinite deck
+    :return: the probability of each outcome, in the order of OUTCOMES
+    """
+    return dealer_key_outcomes(hard, has_ace, composition_key(composition))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def dealer_key_outcomes(hard: int, has_ace: bool, key: CompositionKey) -> tuple[float, ...]:
+    """
+    dealer_key_outcomes is dealer_outcomes for a compact composition key
+    """
+    total = hand_total(hard, has_ace)
+    table = [0.0] * len(OUTCOMES)
+    if total > 21:
+        table[BUST] = 1.0
+    elif total >= 17:
+        table[total - 17] = 1.0
+    else:
+        for rank, probability in zip(RANKS, key_draw_probabilities(key)):
+            if probability == 0:
+                continue
+            after = dealer_key_outcomes(hard + rank, has_ace or rank == 1, remove_key_rank(key, rank))
+            for index, outcome in enumerate(after):
+                table[index] += probability * outcome
+    return tuple(table)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def dealer_probabilities(upcard: int, composition: Composition = None) -> tuple[float, ...]:
+    """
+    dealer_probabilities gives the chance of each final outcome for a dealer showing the given upcard, with the hole
+    card not yet known
+    :param upcard: the rank of the dealer's face up card
+    :param composition: the composition of the unseen cards, which the upcard has already been removed from, or None
+    for an infinite deck
+    :return: the probability of each outcome, in the order of OUTCOMES
+    """
+    if upcard not in RANKS:
+        raise ValueError(f"upcard must be a rank between 1 and 10, got {upcard}")
+    table = [0.0] * len(OUTCOMES)
+    for hole, probability in zip(RANKS, draw_probabilities(composition)):
+        if probability == 0:
+            continue
+        if {upcard, hole} == {1, 10}:
+            table[NATURAL] += probability
+            continue
+        after = dealer_outcomes(upcard + hole, upcard == 1 or hole == 1, remove_rank(composition, hole))
+        for index, outcome in enumerate(after):
+            table[index] += probability * outcome
+    return tuple(table)
+
+
+def dealer_table(composition: Composition = None) -> dict[int, tuple[float, ...]]:
+    """
+    dealer_table gives dealer_probabilities for every upcard. For a finite shoe, each upcard is first removed from the
+    composition given
+    :param composition: the composition of the unseen cards, including the upcard, or None for an infinite deck
+    :return: a dictionary from upcard rank to the probability of each outcome
+    """
+    table = {}
+    for upcard in RANKS:
+        if composition is not None and composition[upcard - 1] == 0:
+            continue
+        table[upcard] = dealer_probabilities(upcard, remove_rank(composition, upcard))
+    return table
@@ -0,0 +1,371 @@
+"""
+Server hosts many blackjack tables in a single process, for players connecting over TCP or a Unix socket. Every
+connection is served by one asyncio task, which sits idle while it waits on the player, so a single thread can hold
+thousands of mostly idle players. Each table keeps its own dealer and shoe and plays hands through Game exactly as the
+console does. Players are loaded from and saved to a PlayerStore, and each hand's result is applied to the store with
+PlayerStore.apply_result, so a player at several tables, or on several servers, never loses a hand.
+
+The protocol is UTF-8 text, one command or reply to a line. Replies start with a keyword in capitals.
+    WELCOME blackjack 1                    sent once a client connects
+    NEW <bankroll> <name>                  creates a player and plays as them
+    PLAYER <name>                          plays as an existing player
+    SIT <table>                            sits at a table, which is opened if it does not exist
+    BET <amount>                           plays a hand at the table
+    HIT, STAND, DOUBLE                     moves, answered only after TURN
+    STATS                                  STATS <bankroll> <wins> <losses> <pushes>
+    LEAVE                                  stands up from the table
+    QUIT                                   ends the connection
+Every command is answered with OK, ERR <reason>, or for BET, the hand as it is played:
+    HAND <player cards> | <dealer cards>   the cards on the table, with the dealer's hole card as ??
+    TURN <total> <can double, 0 or 1>      the server is waiting for a move
+    RESULT <result> <net change> <bankroll>
+Cards are written as on the console, such as A♠ or 10♥, separated by commas. A player who disconnects part way through
+a hand stands, so the hand can be settled, and a hand's result is saved before it is sent. A table is closed once its
+player stands up or disconnects, so only tables with a player seated are kept.
+
+To serve the menu's player store on a TCP port, or on a Unix socket, run
+python -m Blackjack.server --port 7777
+python -m Blackjack.server --unix /tmp/blackjack.sock
+
+The module's external interface shall consist of
+PROTOCOL_VERSION - the version sent in the WELCOME line
+ServerTable - a table's dealer, shoe and seated player
+GameServer - the server class
+main() - the command line interface
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from .card import Card
+from .dealer import Dealer
+from .decisions import AsyncDecisionSource, StreamDecisions
+from .game import Game
+from .hand import Hand
+from .main_menu import STORE_PATH
+from .move import Move
+from .player import Player
+from .player_store import PlayerStore, SQLitePlayerStore
+from .shoe import Shoe
+
+PROTOCOL_VERSION: int = 1
+
+
+class ServerTable:
+    """
+    ServerTable holds a dealer and a shoe, kept from hand to hand, and the name of the connection sitting at it.
+    """
+
+    def __init__(self, name: str, shoe: Shoe):
+        """
+        :param name: the table's name
+        :param shoe: the shoe the table deals from
+        """
+        self.name: str = name
+        self.dealer: Dealer = Dealer()
+        self.shoe: Shoe = shoe
+        self.seated: Optional[str] = None
+
+
+def _format_hand(hand: Hand) -> str:
+    """
+    :param hand: a hand on the table
+    :return: the hand's cards in the order they were dealt, with any face down card as ??
+    """
+    size = hand.get_size()
+    cards = ["??" if hand.is_face_down(index) else str(hand[index]) for index in range(size)]
+    return ",".join(reversed(cards))
+
+
+class _SessionDecisions(AsyncDecisionSource):
+    """
+    _SessionDecisions answers for a connected player. The bet is the one the client sent with BET, and each move is
+    asked for with TURN, once the client has been shown the hands. The hands last shown are kept, so the client can be
+    shown them again once the dealer's hand is revealed.
+    """
+
+    def __init__(self, session: "_Session"):
+        self.session: _Session = session
+        self.stream: StreamDecisions = StreamDecisions(session.reader, session.writer)
+        self.next_bet: int = 0
+        self.hands: Optional[tuple[Hand, Hand]] = None
+
+    async def bet(self, bankroll: int) -> int:
+        return self.next_bet
+
+    async def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        self.hands = hand, self.session.table.dealer.hand
+        try:
+            await self.session._send_hands(*self.hands)
+        except ConnectionError:
+            # The player has gone, so they stand, and the hand is settled as for any other disconnect
+            self.stream.closed = True
+        move = await self.stream.decide(hand, dealer_upcard, can_double)
+        if self.stream.closed:
+            self.session.closed = True
+        return move
+
+
+class _Session:
+    """
+    _Session serves one connection: it reads the client's commands, and plays hands for the client at their table.
+    """
+
+    def __init__(self, server: "GameServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server: GameServer = server
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+        self.player: Optional[Player] = None
+        self.table: Optional[ServerTable] = None
+        self.closed: bool = False
+        self.decisions: _SessionDecisions = _SessionDecisions(self)
+
+    async def send(self, line: str) -> None:
+        self.writer.write(f"{line}\n".encode())
+        await self.writer.drain()
+
+    async def receive(self) -> Optional[str]:
+        """
+        :return: the next line from the client, stripped, or None once the client has disconnected
+        """
+        try:
+            line = await self.reader.readline()
+        except (ConnectionError, ValueError):
+            line = b""
+        if not line:
+            self.closed = True
+            return None
+        return line.decode(errors="replace").strip()
+
+    async def run(self) -> None:
+        """
+        run answers the client's commands until they quit or disconnect
+        :return: None
+        """
+        await self.send(f"WELCOME blackjack {PROTOCOL_VERSION}")
+        while not self.closed:
+            line = await self.receive()
+            if line is None:
+                break
+            if not line:
+                continue
+            command, _, argument = line.partition(" ")
+            command = command.upper()
+            argument = argument.strip()
+            if command == "QUIT":
+                await self.send("OK")
+                break
+            handler = self._COMMANDS.get(command)
+            if handler is None:
+                await self.send(f"ERR unknown command {command}")
+                continue
+            try:
+                await handler(self, argument)
+            except (ValueError, KeyError) as error:
+                await self.send(f"ERR {error.args[0] if error.args else error}")
+
+    async def _new(self, argument: str) -> None:
+        bankroll, _, name = argument.partition(" ")
+        if not bankroll.isdigit() or int(bankroll) <= 0 or not name.strip():
+            raise ValueError("usage: NEW <bankroll> <name>")
+        if name in self.server.store:
+            raise ValueError(f"a player named {name.strip()} already exists")
+        player = Player.from_name_bankroll(name.strip(), int(bankroll))
+        self.server.store.save(player)
+        self.player = player
+        await self.send("OK")
+
+    async def _player(self, argument: str) -> None:
+        if not argument:
+            raise ValueError("usage: PLAYER <name>")
+        try:
+            self.player = self.server.store.load(argument)
+        except KeyError:
+            raise KeyError(f"no player named {argument}") from None
+        await self.send("OK")
+
+    async def _sit(self, argument: str) -> None:
+        if self.player is None:
+            raise ValueError("choose a player first")
+        if not argument:
+            raise ValueError("usage: SIT <table>")
+        self._stand_up()
+        table = self.server.table(argument)
+        if table.seated is not None:
+            raise ValueError(f"table {argument} is taken")
+        table.seated = self.player.name
+        self.table = table
+        await self.send("OK")
+
+    async def _leave(self, argument: str) -> None:
+        if self.table is None:
+            raise ValueError("not at a table")
+        self._stand_up()
+        await self.send("OK")
+
+    def _stand_up(self) -> None:
+        if self.table is not None:
+            self.table.seated = None
+            self.server.close_table(self.table)
+            self.table = None
+
+    async def _stats(self, argument: str) -> None:
+        if self.player is None:
+            raise ValueError("choose a player first")
+        self.player = self.server.store.load(self.player.name)
+        stats = self.player.stats
+        await self.send(f"STATS {stats.bankroll} {stats.wins} {stats.losses} {stats.pushes}")
+
+    async def _bet(self, argument: str) -> None:
+        if self.table is None or self.player is None:
+            raise ValueError("sit at a table first")
+        if not argument.isdigit():
+            raise ValueError("usage: BET <amount>")
+        # The bankroll is read afresh, as another table may have played the player since
+        self.player.stats = self.server.store.load(self.player.name).stats
+        bet = int(argument)
+        if not 0 < bet <= self.player.bankroll:
+            raise ValueError(f"bet must be between 1 and {self.player.bankroll}")
+        await self._play_hand(bet)
+
+    async def _play_hand(self, bet: int) -> None:
+        """
+        _play_hand plays a hand at the session's table through Game.new_hand_async, asking the client for each move, and
+        saves its result
+        :param bet: the ante
+        :return: None
+        """
+        self.decisions.next_bet = bet
+        self.player.decisions = self.decisions
+        game = Game(self.player, self.table.dealer, self.table.shoe, headless=True)
+        result, net_change = await game.new_hand_async()
+        # The result is saved before anything more is sent, so a client that disconnects now does not lose the hand
+        self.player.stats = self.server.store.apply_result(self.player.name, (result, net_change)).stats
+        # The hands are cleared once the hand is over, but the dealer's hand shown last has since been revealed
+        await self._send_hands(*self.decisions.hands)
+        await self.send(f"RESULT {result.name} {net_change} {self.player.bankroll}")
+
+    async def _send_hands(self, player_hand: Hand, dealer_hand: Hand) -> None:
+        await self.send(f"HAND {_format_hand(player_hand)} | {_format_hand(dealer_hand)}")
+
+    _COMMANDS: dict[str, Callable] = {
+        "NEW": _new,
+        "PLAYER": _player,
+        "SIT": _sit,
+        "LEAVE": _leave,
+        "STATS": _stats,
+        "BET": _bet,
+    }
+
+
+class GameServer:
+    """
+    GameServer accepts connections and serves each one with a _Session, keeping the tables the sessions sit at.
+    """
+
+    def __init__(self, store: PlayerStore, shoe_factory: Callable[[], Shoe] = Shoe):
+        """
+        :param store: the store players are loaded from and saved to
+        :param shoe_factory: makes the shoe for each new table. This is dependency injection
+        """
+        self.store: PlayerStore = store
+        self.shoe_factory: Callable[[], Shoe] = shoe_factory
+        self.tables: dict[str, ServerTable] = {}
+        self.connections: int = 0
+
+    def table(self, name: str) -> ServerTable:
+        """
+        :param name: a table's name
+        :return: the table, opened with a fresh shoe if it did not exist
+        """
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = ServerTable(name, self.shoe_factory())
+        return table
+
+    def close_table(self, table: ServerTable) -> None:
+        """
+        close_table closes a table nobody is seated at, so a server's tables are never more than its players
+        :param table: the table
+        :return: None
+        """
+        if table.seated is None and self.tables.get(table.name) is table:
+            del self.tables[table.name]
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        handle serves one connection until it ends, and is passed to asyncio as the connection callback
+        :param reader: the connection's reader
+        :param writer: the connection's writer
+        :return: None
+        """
+        self.connections += 1
+        session = _Session(self, reader, writer)
+        try:
+            await session.run()
+        except ConnectionError:
+            pass
+        finally:
+            session._stand_up()
+            self.connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """
+        start begins accepting TCP connections
+        :param host: the address to listen on
+        :param port: the port to listen on. If 0, a free port is chosen
+        :return: the listening server
+        """
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def start_unix(self, path: Union[Path, str]) -> asyncio.Server:
+        """
+        start_unix begins accepting connections on a Unix socket
+        :param path: the socket file
+        :return: the listening server
+        """
+        return await asyncio.start_unix_server(self.handle, path)
+
+
+async def _serve(options: argparse.Namespace) -> None:
+    with SQLitePlayerStore(options.store) as store:
+        server = GameServer(store)
+        if options.unix is not None:
+            listener = await server.start_unix(options.unix)
+        else:
+            listener = await server.start(options.host, options.port)
+        addresses = ", ".join(str(socket.getsockname()) for socket in listener.sockets)
+        print(f"Serving blackjack on {addresses}")
+        async with listener:
+            await listener.serve_forever()
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """
+    main runs the server from the command line until it is interrupted
+    :param arguments: the command line arguments. If None, they are read from sys.argv
+    :return: the exit status
+    """
+    parser = argparse.ArgumentParser(description="Serve blackjack tables over a line protocol")
+    parser.add_argument("--host", default="127.0.0.1", help="the address to listen on")
+    parser.add_argument("--port", type=int, default=7777, help="the TCP port to listen on")
+    parser.add_argument("--unix", type=Path, default=None, help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--store", type=Path, default=STORE_PATH, help="the player database")
+    options = parser.parse_args(arguments)
+    try:
+        asyncio.run(_serve(options))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
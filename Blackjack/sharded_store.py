@@ -0,0 +1,201 @@
+"""
+Sharded store keeps one .blackjack file per player, as JsonPlayerStore does, but spreads the files across a tree of
+small directories instead of one flat directory. The directories a player's file sits in are taken from a hash of
+their normalized name, so players are spread evenly, finding a file never lists a directory, and each directory stays
+small however many players there are. With the default depth of two, a million players come to around fifteen files
+in each of 65,536 directories.
+
+A player's file is named for the whole hash, so any name, whatever characters it holds, makes a safe filename. The
+player's name as entered is read from the file itself.
+
+The root directory holds a manifest recording the layout, which is read back whenever the store is opened, so a store
+is always opened with the layout it was written in.
+
+To migrate players from a flat directory of .blackjack files into a sharded store, run
+python -m Blackjack.sharded_store migrate SOURCE TARGET
+
+The module's external interface shall consist of
+MANIFEST_NAME - the name of the manifest file in a store's root directory
+shard_key() - the hash a player's file is named and placed by
+ShardedPlayerStore - the sharded store
+migrate_flat() - copies players from a flat directory into a sharded store
+main() - the command line interface
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .player import Player, load_player
+from .player_cache import PlayerCache
+from .player_store import JsonPlayerStore, normalize_name
+
+MANIFEST_NAME: str = "manifest.json"
+
+_FORMAT: str = "blackjack-sharded"
+_VERSION: int = 1
+_DEFAULT_DEPTH: int = 2
+_MAX_DEPTH: int = 4
+
+
+def shard_key(name: str) -> str:
+    """
+    :param name: a player's name
+    :return: a 32 character hexadecimal hash of the normalized name
+    """
+    return hashlib.blake2b(normalize_name(name).encode(), digest_size=16).hexdigest()
+
+
+class ShardedPlayerStore(JsonPlayerStore):
+    """
+    ShardedPlayerStore keeps each player in their own .blackjack file, in a directory tree laid out by shard_key.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        depth: Optional[int] = None,
+        fsync: bool = False,
+        cache: Optional[PlayerCache] = None,
+    ):
+        """
+        __init__ opens a sharded store, creating its root directory and manifest if they do not exist
+
+        :param directory: the root directory of the store
+        :param depth: the number of directory levels above each file, each named for two hexadecimal digits of the
+        hash. If None, an existing store's depth is used, or the default of 2 for a new store
+        :param fsync: if True, every save is forced to disk, as described in save_player
+        :param cache: an optional cache that loads are served from while the player's file is unchanged. This is
+        dependency injection
+        """
+        super().__init__(directory, fsync, cache)
+        manifest = self.read_manifest()
+        if manifest is None:
+            if depth is None:
+                depth = _DEFAULT_DEPTH
+            if not 1 <= depth <= _MAX_DEPTH:
+                raise ValueError(f"depth must be between 1 and {_MAX_DEPTH}, got {depth}")
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write_manifest({"format": _FORMAT, "version": _VERSION, "depth": depth})
+        else:
+            if manifest.get("format") != _FORMAT or manifest.get("version") != _VERSION:
+                raise ValueError(f"{self.directory} is not a sharded player store of version {_VERSION}")
+            if depth is not None and depth != manifest["depth"]:
+                raise ValueError(f"{self.directory} has a depth of {manifest['depth']}, not {depth}")
+            depth = manifest["depth"]
+        self.depth: int = depth
+        self._pattern = "/".join(["*"] * depth + ["*.blackjack"])
+
+    def read_manifest(self) -> Optional[dict]:
+        """
+        :return: the store's manifest, or None if it does not have one yet
+        """
+        try:
+            with open(self.directory / MANIFEST_NAME, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def _write_manifest(self, manifest: dict) -> None:
+        """
+        _write_manifest writes the manifest beside its final name and renames it into place, so it is never half-written
+        :param manifest: the manifest
+        :return: None
+        """
+        path = self.directory / MANIFEST_NAME
+        temporary = path.with_name(f".{MANIFEST_NAME}.tmp")
+        with open(temporary, "w") as file:
+            json.dump(manifest, file, indent=4)
+        os.replace(temporary, path)
+
+    def path_for(self, name: str) -> Path:
+        key = shard_key(name)
+        shards = [key[2 * level:2 * level + 2] for level in range(self.depth)]
+        return self.directory.joinpath(*shards, f"{key}.blackjack")
+
+    def save_many(self, players: Iterable[Player]) -> None:
+        for player in players:
+            try:
+                super().save_many([player])
+            except FileNotFoundError:
+                # A shard's directory is made the first time a player is saved to it
+                self.path_for(player.name).parent.mkdir(parents=True, exist_ok=True)
+                super().save_many([player])
+
+
+def migrate_flat(
+    source: Path,
+    target: ShardedPlayerStore,
+    batch_size: int = 1000,
+    remove: bool = False,
+) -> int:
+    """
+    migrate_flat copies every .blackjack file in a flat directory into a sharded store, a batch at a time. It can be
+    run again after an interruption, as a player already copied is simply saved again
+    :param source: the flat directory, such as the working directory the menu once saved players to
+    :param target: the sharded store
+    :param batch_size: the number of players saved together
+    :param remove: if True, each source file is deleted once its player is saved to the target
+    :return: the number of players migrated
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be greater than zero, got {batch_size}")
+    migrated = 0
+    batch: list[tuple[Path, Player]] = []
+    # The directory is read as it is migrated, so only a batch of players is held at a time
+    for path in Path(source).glob("*.blackjack"):
+        batch.append((path, load_player(path)))
+        if len(batch) >= batch_size:
+            migrated += _migrate_batch(batch, target, remove)
+            batch = []
+    if batch:
+        migrated += _migrate_batch(batch, target, remove)
+    return migrated
+
+
+def _migrate_batch(batch: list[tuple[Path, Player]], target: ShardedPlayerStore, remove: bool) -> int:
+    """
+    _migrate_batch saves a batch of players read from flat files to a sharded store
+    :param batch: each player, with the file they were read from
+    :param target: the sharded store
+    :param remove: if True, each file is deleted once the batch is saved
+    :return: the number of players saved
+    """
+    target.save_many(player for _, player in batch)
+    if remove:
+        for saved, _ in batch:
+            saved.unlink()
+    return len(batch)
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """
+    main runs a migration from the command line
+    :param arguments: the command line arguments. If None, they are read from sys.argv
+    :return: the exit status: 1 if the target is not a sharded store, otherwise 0
+    """
+    parser = argparse.ArgumentParser(description="Migrate player files from a flat directory into a sharded store")
+    parser.add_argument("command", choices=("migrate",))
+    parser.add_argument("source", type=Path, help="the flat directory of .blackjack files")
+    parser.add_argument("target", type=Path, help="the root directory of the sharded store")
+    parser.add_argument("--depth", type=int, default=None, help="the number of directory levels in a new store")
+    parser.add_argument("--remove", action="store_true", help="delete each source file once it is migrated")
+    options = parser.parse_args(arguments)
+
+    try:
+        target = ShardedPlayerStore(options.target, options.depth)
+    except ValueError as error:
+        print(error)
+        return 1
+    with target:
+        migrated = migrate_flat(options.source, target, remove=options.remove)
+    print(f"Migrated {migrated:,} players to {options.target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
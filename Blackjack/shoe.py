@@ -0,0 +1,119 @@
+"""
+A shoe holds several decks shuffled together, as dealt at a casino table. A cut card is placed part way through the
+shoe; once the deal passes it, the shoe is reshuffled before the next hand starts. Should a hand run the shoe out
+before then, the cards discarded by earlier hands are shuffled and dealt, as a dealer would, so a shoe of any
+penetration and any number of players never runs dry mid-hand.
+
+Cards are dealt by advancing an index through a list of the shared card objects, so dealing never allocates or shifts
+memory, and the same shoe can be kept across any number of hands.
+
+The module's external interface shall consist of
+Shoe - the shoe class
+"""
+
+import random
+from typing import Optional
+
+from .card import DECK, Card
+from .probability import composition_of
+
+
+class Shoe:
+    def __init__(
+        self,
+        decks: int = 6,
+        penetration: float = 0.75,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        __init__ creates a new shoe and shuffles it
+
+        :param decks: the number of 52 card decks in the shoe
+        :param penetration: the fraction of the shoe dealt before the cut card is reached, between 0 and 1
+        :param rng: the random number generator used to shuffle. If None, a new unseeded generator is created. This is
+        dependency injection
+        """
+        if decks <= 0:
+            raise ValueError(f"A shoe needs at least one deck, got {decks}")
+        if not 0 < penetration <= 1:
+            raise ValueError(f"Penetration must be between 0 and 1, got {penetration}")
+        if rng is None:
+            rng = random.Random()
+        self.decks: int = decks
+        self.rng: random.Random = rng
+        self._cards: list[Card] = list(DECK) * decks
+        self._cut: int = int(len(self._cards) * penetration)
+        self._position: int = 0
+        self._discarded: int = 0
+        self.shuffle()
+
+    def shuffle(self) -> None:
+        """
+        shuffle gathers every card back into the shoe and shuffles it
+        :return: None
+        """
+        self.rng.shuffle(self._cards)
+        self._position = 0
+        self._discarded = 0
+
+    def cut_card_reached(self) -> bool:
+        """
+        :return: True if the deal has reached the cut card, and the shoe should be shuffled before the next hand
+        """
+        return self._position >= self._cut
+
+    def start_hand(self) -> None:
+        """
+        start_hand readies the shoe for a new hand. The shoe is shuffled if the cut card has been reached; otherwise
+        the cards dealt so far are discards, which are shuffled back in if the shoe runs out during the hand
+        :return: None
+        """
+        if self.cut_card_reached():
+            self.shuffle()
+        self._discarded = self._position
+
+    def _reshuffle_discards(self) -> None:
+        """
+        _reshuffle_discards shuffles the discards behind the cards still in play, and deals on from them
+        :raises IndexError: if there are no discards, as every card is in play
+        :return: None
+        """
+        if not self._discarded:
+            raise IndexError("deal from an empty shoe")
+        discards = self._cards[: self._discarded]
+        self.rng.shuffle(discards)
+        in_play = self._cards[self._discarded:]
+        self._cards = in_play + discards
+        self._position = len(in_play)
+        self._discarded = 0
+
+    def deal(self) -> Card:
+        """
+        deal removes the next card from the shoe and returns it. A shoe that has run out deals from its reshuffled
+        discards
+        :raises IndexError: if the shoe has no cards left, and no discards to reshuffle
+        :return: the dealt card
+        """
+        position = self._position
+        if position >= len(self._cards):
+            self._reshuffle_discards()
+            position = self._position
+        self._position = position + 1
+        return self._cards[position]
+
+    def composition(self) -> tuple[int, ...]:
+        """
+        composition counts the cards left to deal by rank, in the form used by probability and expected_value
+        :return: the number of cards of each rank left in the shoe, aces first
+        """
+        return composition_of(self._cards[self._position:])
+
+    # The game draws with deque methods; from a shoe, both ends deal the next card
+    pop = deal
+    popleft = deal
+
+    def __len__(self) -> int:
+        """
+        :return: the number of cards left to deal before the discards are needed
+        """
+        return len(self._cards) - self._position
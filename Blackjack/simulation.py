@@ -0,0 +1,169 @@
+"""
+Simulation runs large numbers of headless hands through Game, using a Policy in place of the console, and tallies the
+results. It is intended for validating the house edge of a policy under the game's actual rules.
+
+The module's external interface shall consist of
+SimulationResult - the tallied results of a run of hands
+simulate() - plays a number of headless hands and returns a SimulationResult
+simulate_parallel() - splits a simulation across a pool of processes and merges the results
+"""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from .game import Game
+from .player import Player
+from .policy import Policy
+from .result import Result
+from .shoe import Shoe
+
+if TYPE_CHECKING:
+    # NumPy is only needed to spawn the random streams of a parallel simulation, so it is imported there
+    import numpy as np
+
+
+class SimulationResult:
+    """
+    SimulationResult tallies the outcome of each hand, along with the sum and sum of squares of the net change to the
+    bankroll, so that the mean and variance per hand can be reported without keeping every hand.
+    """
+
+    def __init__(self):
+        self.hands: int = 0
+        self.counts: dict[Result, int] = {result: 0 for result in Result}
+        self.net_total: int = 0
+        self.net_square_total: int = 0
+
+    def record(self, result: Result, net_change: int) -> None:
+        """
+        record adds the outcome of a single hand to the tally
+        :param result: the result of the hand
+        :param net_change: the change to the player's bankroll
+        :return: None
+        """
+        self.hands += 1
+        self.counts[result] += 1
+        self.net_total += net_change
+        self.net_square_total += net_change * net_change
+
+    def merge(self, other: "SimulationResult") -> None:
+        """
+        merge adds another tally into this one. As only counts and sums are kept, the merged mean and variance are
+        exactly those of all the hands together
+        :param other: the tally to add
+        :return: None
+        """
+        self.hands += other.hands
+        for result, count in other.counts.items():
+            self.counts[result] += count
+        self.net_total += other.net_total
+        self.net_square_total += other.net_square_total
+
+    @property
+    def mean(self) -> float:
+        """The mean net change per hand, or 0.0 if no hands have been recorded."""
+        if self.hands == 0:
+            return 0.0
+        return self.net_total / self.hands
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the net change per hand, or 0.0 if fewer than two hands have been recorded."""
+        if self.hands < 2:
+            return 0.0
+        return (self.net_square_total - self.hands * self.mean**2) / (self.hands - 1)
+
+    @property
+    def standard_error(self) -> float:
+        """The standard error of the mean net change per hand."""
+        if self.hands == 0:
+            return 0.0
+        return math.sqrt(self.variance / self.hands)
+
+
+def simulate(
+    policy: Policy,
+    hands: int,
+    bankroll: int = 1_000_000,
+    decks: int = 6,
+    penetration: float = 0.75,
+    rng: Optional[random.Random] = None,
+) -> SimulationResult:
+    """
+    simulate plays a number of headless hands with the given policy from a single shoe, and tallies the results. The
+    player's bankroll is not updated between hands, so every hand is played with the same bankroll and bet limits.
+    :param policy: the policy making the player's decisions
+    :param hands: the number of hands to play
+    :param bankroll: the player's bankroll, which limits the bet and whether a double down is allowed
+    :param decks: the number of decks in the shoe
+    :param penetration: the fraction of the shoe dealt before it is reshuffled
+    :param rng: the random number generator that shuffles the shoe. If None, a new unseeded generator is used
+    :return: the tallied results
+    """
+    player = Player.from_name_bankroll("Simulation", bankroll)
+    game = Game(player, deck=Shoe(decks, penetration, rng), policy=policy)
+    tally = SimulationResult()
+    for _ in range(hands):
+        tally.record(*game.new_hand())
+    return tally
+
+
+def _simulate_worker(
+    policy: Policy,
+    hands: int,
+    bankroll: int,
+    decks: int,
+    penetration: float,
+    seed: "np.random.SeedSequence",
+) -> SimulationResult:
+    """
+    _simulate_worker runs one share of a parallel simulation, in a worker process, from its own random stream
+    :param seed: the seed sequence of this worker's random stream
+    :return: the tallied results of this share
+    """
+    rng = random.Random(int.from_bytes(seed.generate_state(4).tobytes(), "little"))
+    return simulate(policy, hands, bankroll, decks, penetration, rng)
+
+
+def simulate_parallel(
+    policy: Policy,
+    hands: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    bankroll: int = 1_000_000,
+    decks: int = 6,
+    penetration: float = 0.75,
+) -> SimulationResult:
+    """
+    simulate_parallel splits a simulation into one share per worker and plays the shares in a pool of processes. Each
+    share is given a statistically independent random stream spawned from a single seed, so a run with the same seed
+    and number of workers always gives the same result.
+    :param policy: the policy making the player's decisions. It must be picklable
+    :param hands: the total number of hands to play
+    :param workers: the number of worker processes. If None, one per CPU
+    :param seed: the seed all the random streams are spawned from. If None, fresh entropy is used
+    :param bankroll: the player's bankroll, which limits the bet and whether a double down is allowed
+    :param decks: the number of decks in each worker's shoe
+    :param penetration: the fraction of the shoe dealt before it is reshuffled
+    :return: the merged tally of every share
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError(f"workers must be greater than zero, got {workers}")
+    import numpy as np
+
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [hands // workers + (1 if index < hands % workers else 0) for index in range(workers)]
+    tally = SimulationResult()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_simulate_worker, policy, share, bankroll, decks, penetration, share_seed)
+            for share, share_seed in zip(shares, seeds)
+        ]
+        for future in futures:
+            tally.merge(future.result())
+    return tally
@@ -0,0 +1,128 @@
+"""
+Strategy provides a basic strategy policy: a table of the best move for every player total, soft or hard, against every
+dealer upcard, so that each decision is a single dictionary lookup.
+
+The table is generated from the exact expected values in expected_value, for an infinite deck under the game's actual
+rules, and is stored alongside this module in basic_strategy.json. It is read once, the first time it is needed. Each
+entry holds two moves: the best move, and the best move when the bankroll does not cover a double down.
+
+To regenerate the stored table, run
+python -m Blackjack.strategy
+
+The module's external interface shall consist of
+generate_basic_strategy() - works out the table from the expected values
+save_basic_strategy(), load_basic_strategy() - write and read the table
+basic_strategy() - the stored table, read once and then shared
+BasicStrategyPolicy - a flat betting policy that plays by the table
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from .card import Card
+from .expected_value import PlayerState, move_values
+from .hand import Hand
+from .move import Move
+from .policy import Policy
+from .probability import RANKS, card_rank
+
+STRATEGY_PATH: Path = Path(__file__).with_name("basic_strategy.json")
+
+# A table maps (player total, soft, dealer upcard rank) to (best move, best move without doubling down)
+StrategyTable = dict[tuple[int, bool, int], tuple[Move, Move]]
+
+
+def _player_states():
+    """
+    _player_states yields every hard and soft total the player can be asked to move on, along with a hand of that total
+    """
+    for total in range(4, 22):
+        yield total, False, PlayerState(total, False, False)
+    for total in range(12, 22):
+        yield total, True, PlayerState(total - 10, True, False)
+
+
+def generate_basic_strategy() -> StrategyTable:
+    """
+    generate_basic_strategy works out the best moves from the exact expected values. This takes a few seconds
+    :return: the strategy table
+    """
+    table: StrategyTable = {}
+    for upcard in RANKS:
+        for total, soft, player in _player_states():
+            values = move_values(player, upcard)
+            best = max(values, key=values.get)
+            values.pop(Move.DOUBLE_DOWN)
+            table[(total, soft, upcard)] = best, max(values, key=values.get)
+    return table
+
+
+def save_basic_strategy(table: StrategyTable, path: Path = STRATEGY_PATH) -> None:
+    """
+    save_basic_strategy writes a strategy table to a JSON file
+    :param table: the table to save
+    :param path: the filepath to save to
+    """
+    rows = [
+        [total, soft, upcard, best.name, without_double.name]
+        for (total, soft, upcard), (best, without_double) in sorted(table.items())
+    ]
+    with open(path, "w") as file:
+        file.write("[\n" + ",\n".join(json.dumps(row) for row in rows) + "\n]\n")
+
+
+def load_basic_strategy(path: Path = STRATEGY_PATH) -> StrategyTable:
+    """
+    load_basic_strategy reads a strategy table from a JSON file
+    :param path: the filepath to load from
+    :return: the strategy table
+    """
+    with open(path, "r") as file:
+        rows = json.load(file)
+    return {
+        (total, soft, upcard): (Move[best], Move[without_double])
+        for total, soft, upcard, best, without_double in rows
+    }
+
+
+@lru_cache(maxsize=None)
+def basic_strategy() -> StrategyTable:
+    """
+    basic_strategy reads the stored table the first time it is called, and returns the same table every time after
+    :return: the strategy table
+    """
+    return load_basic_strategy()
+
+
+class BasicStrategyPolicy(Policy):
+    """
+    BasicStrategyPolicy bets a flat amount and plays every hand by a strategy table, looking up the player's total and
+    the dealer's upcard.
+    """
+
+    def __init__(self, bet_size: int = 1, table: Optional[StrategyTable] = None):
+        """
+        :param bet_size: the flat ante placed on every hand. It is capped at the player's bankroll.
+        :param table: the strategy table to play by. If None, the stored basic strategy is used
+        """
+        if bet_size <= 0:
+            raise ValueError(f"bet_size must be greater than zero, got {bet_size}")
+        if table is None:
+            table = basic_strategy()
+        self.bet_size: int = bet_size
+        self.table: StrategyTable = table
+
+    def bet(self, bankroll: int) -> int:
+        return min(self.bet_size, bankroll)
+
+    def decide(self, hand: Hand, dealer_upcard: Optional[Card], can_double: bool) -> Move:
+        if dealer_upcard is None:
+            raise ValueError("BasicStrategyPolicy needs the dealer's upcard")
+        best, without_double = self.table[(hand.get_total(), hand.is_soft(), card_rank(dealer_upcard))]
+        return best if can_double else without_double
+
+
+if __name__ == "__main__":
+    save_basic_strategy(generate_basic_strategy())
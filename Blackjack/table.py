@@ -0,0 +1,176 @@
+"""
+Table seats up to seven players against one dealer, dealing every seat from one shoe. Playing each player through a
+Game of their own would shuffle a shoe and play out a dealer's hand for every player; a table does both once a round,
+however many seats are filled.
+
+Each round is played as Game plays a hand, with every seat moving in turn where Game's single player moves:
+    every seat antes
+    Deal a card to each seat from left to right, then to the dealer, twice
+    Until every seat has stood, doubled down or busted:
+        Accept each seat's move, from left to right
+        Accept the dealer's move, unless every seat has busted
+    Dealer reveals hidden card
+    Resolve every seat against the dealer's hand
+A table with one seat plays exactly the hands a Game does from the same shoe.
+
+Tables are headless: every seated player must have a policy, or another DecisionSource that is not the console. A seat
+whose bankroll is empty sits the round out.
+
+The module's external interface shall consist of
+MAX_SEATS - the most players a table seats
+Table - the table class
+"""
+
+import collections
+from typing import TYPE_CHECKING, Optional, Union
+
+from .dealer import Dealer
+from .decisions import ConsoleDecisions, DecisionSource
+from .game import evaluate
+from .hand import Hand
+from .move import Move
+from .player import Player
+from .result import Result
+from .shoe import Shoe
+
+if TYPE_CHECKING:
+    # The hand history is written with NumPy, which is only needed by those who keep one
+    from .hand_history import HandHistoryWriter
+
+MAX_SEATS: int = 7
+
+
+class Table:
+    """
+    Table plays rounds of blackjack for up to MAX_SEATS players, who share one dealer and one shoe.
+    """
+
+    def __init__(
+        self,
+        players: Optional[list[Player]] = None,
+        dealer: Optional[Dealer] = None,
+        deck: Optional[Union[collections.deque, Shoe]] = None,
+        history: Optional["HandHistoryWriter"] = None,
+    ):
+        """
+        __init__ creates a new table and seats the given players, from left to right
+
+        :param players: the players to seat, each of whom must have a policy or another decision source, as for sit
+        :param dealer: the dealer object that will play at the table
+        :param deck: the deck or shoe to deal from. If None, a new six deck shoe is used. A shoe is reshuffled at the
+        start of any round once its cut card has been reached, so it can be kept across many rounds. A single deck is
+        never refreshed, so it suits only a round or two
+        :param history: if given, every seat's hand is recorded to this hand history as the round finishes. This is
+        dependency injection
+        """
+        if dealer is None:
+            dealer = Dealer()
+        if deck is None:
+            deck = Shoe()
+        self.deck: Union[collections.deque, Shoe] = deck
+        self.dealer: Dealer = dealer
+        self.history: Optional["HandHistoryWriter"] = history
+        self.seats: list[Player] = []
+        for player in players or []:
+            self.sit(player)
+
+    def sit(self, player: Player) -> None:
+        """
+        sit seats a player in the rightmost seat
+        :param player: the player, whose decisions must come from a policy or another source that is not the console
+        and is not awaited
+        :return: None
+        """
+        if len(self.seats) >= MAX_SEATS:
+            raise ValueError(f"The table is full; it seats {MAX_SEATS} players")
+        if not isinstance(player.decisions, DecisionSource) or isinstance(player.decisions, ConsoleDecisions):
+            raise ValueError(f"{player.name} must have a policy, or another decision source that answers at once")
+        if any(seated is player for seated in self.seats):
+            raise ValueError(f"{player.name} is already seated")
+        self.seats.append(player)
+
+    def leave(self, player: Player) -> None:
+        """
+        leave stands a player up from the table. The players to their right each move one seat left
+        :param player: the player
+        :return: None
+        """
+        for index, seated in enumerate(self.seats):
+            if seated is player:
+                del self.seats[index]
+                return
+        raise ValueError(f"{player.name} is not seated")
+
+    def play_round(self) -> list[tuple[Player, Result, int]]:
+        """
+        play_round deals a round to every seat with money in their bankroll, plays it, and settles each seat against
+        the dealer. Like Game.new_hand, it leaves updating each player's stats to the caller
+        :return: each playing seat's player, result and net change to their bankroll, from left to right
+        """
+        playing = [player for player in self.seats if player.bankroll > 0]
+        if not playing:
+            return []
+        moves: list[list[Move]] = [[] for _ in playing]
+        self._deal(playing)
+
+        can_move = [True] * len(playing)
+        while self._play_round(playing, can_move, moves):
+            pass
+
+        self.dealer.reveal_hand(False)
+        results: list[tuple[Player, Result, int]] = []
+        for player, seat_moves in zip(playing, moves):
+            result = evaluate(player.hand, self.dealer.hand)
+            net_change: int = 0
+            if result == Result.VICTORY:
+                net_change = player.bet
+            elif result == Result.DEFEAT:
+                net_change = -player.bet
+            if self.history is not None:
+                self.history.record(player.hand, self.dealer.hand, seat_moves, result, player.bet, net_change)
+            player.hand = None
+            results.append((player, result, net_change))
+        self.dealer.hand = None
+        return results
+
+    def _deal(self, playing: list[Player]) -> None:
+        """
+        _deal takes each seat's ante, then deals two cards to each seat and the dealer in casino order
+        :param playing: the seats playing the round, from left to right
+        :return: None
+        """
+        if isinstance(self.deck, Shoe):
+            self.deck.start_hand()
+        for player in playing:
+            player.ante()
+            if player.hand is None:
+                player.hand = Hand()
+        if self.dealer.hand is None:
+            self.dealer.hand = Hand()
+        for _ in range(2):
+            for player in playing:
+                player.deal_card(self.deck.pop())
+            self.dealer.deal_card(self.deck.pop())
+
+    def _play_round(self, playing: list[Player], can_move: list[bool], moves: list[list[Move]]) -> bool:
+        """
+        _play_round asks each seat still in the hand for a move, then the dealer
+        :param playing: the seats playing the round, from left to right
+        :param can_move: whether each seat may still move, updated as seats stand, double down or bust
+        :param moves: each seat's moves so far, added to as seats move
+        :return: boolean, true if another round is warranted
+        """
+        upcard = self.dealer.hand[-2]
+        for index, player in enumerate(playing):
+            if not can_move[index]:
+                continue
+            turn = player.take_turn(self.deck, upcard)
+            moves[index].append(turn)
+            if turn == Move.STAND or turn == Move.DOUBLE_DOWN or player.has_busted():
+                can_move[index] = False
+        if all(player.has_busted() for player in playing):
+            return False
+        dealer_turn = self.dealer.take_turn(self.deck)
+        if self.dealer.has_busted():
+            return False
+        return any(can_move) or dealer_turn != Move.STAND
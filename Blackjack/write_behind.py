@@ -0,0 +1,122 @@
+"""
+Write behind holds players' saved stats in memory and writes them to an underlying PlayerStore in batches, so that a
+player saved after every hand costs one write per batch rather than one per hand.
+
+Saved players are kept as dirty until a flush. A flush happens when enough players are dirty, when the oldest dirty
+save has waited long enough, when the store is closed, and when a store that was never closed is garbage collected or
+the interpreter exits. The thresholds are checked on every save and every read, so nothing is written from a
+background thread, and a store that is only read from still writes its dirty players once they are old enough. A load
+always sees the latest save, flushed or not.
+
+Writes to a JsonPlayerStore go through save_player, which writes each file beside its target and renames it into place,
+so a file is never left half-written by a crash. Pass fsync=True to the JsonPlayerStore to force each flush to disk.
+
+The module's external interface shall consist of
+WriteBehindStore - the buffering store
+"""
+
+import time
+import weakref
+from typing import Callable, Iterable
+
+from .player import Player
+from .player_store import PlayerStore, normalize_name
+
+
+def _flush(store: PlayerStore, dirty: dict[str, dict]) -> None:
+    """
+    _flush writes dirty players to a store in one batch. It is kept apart from WriteBehindStore, so that the finalizer
+    that calls it does not keep the WriteBehindStore alive
+    :param store: the store written to
+    :param dirty: the dirty players' stats, by normalized name, which is emptied
+    :return: None
+    """
+    if not dirty:
+        return
+    store.save_many(Player(stats) for stats in dirty.values())
+    dirty.clear()
+
+
+class WriteBehindStore(PlayerStore):
+    def __init__(
+        self,
+        store: PlayerStore,
+        max_dirty: int = 100,
+        max_delay: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param store: the store written to
+        :param max_dirty: the number of dirty players that triggers a flush
+        :param max_delay: the number of seconds the oldest dirty save may wait before a save or read triggers a flush
+        :param clock: returns the current time in seconds. This is dependency injection
+        """
+        if max_dirty <= 0:
+            raise ValueError(f"max_dirty must be greater than zero, got {max_dirty}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay cannot be negative, got {max_delay}")
+        self.store: PlayerStore = store
+        self.max_dirty: int = max_dirty
+        self.max_delay: float = max_delay
+        self.clock: Callable[[], float] = clock
+        self._dirty: dict[str, dict] = {}
+        self._oldest: float = 0.0
+        self._finalizer = weakref.finalize(self, _flush, store, self._dirty)
+
+    @property
+    def dirty(self) -> int:
+        """The number of players saved but not yet written to the underlying store."""
+        return len(self._dirty)
+
+    def _flush_if_due(self) -> None:
+        """
+        _flush_if_due flushes if enough players are dirty, or if the oldest dirty save has waited long enough
+        :return: None
+        """
+        if self._dirty and (
+            len(self._dirty) >= self.max_dirty or self.clock() - self._oldest >= self.max_delay
+        ):
+            self.flush()
+
+    def load(self, name: str) -> Player:
+        self._flush_if_due()
+        stats = self._dirty.get(normalize_name(name))
+        if stats is not None:
+            return Player(dict(stats))
+        return self.store.load(name)
+
+    def save_many(self, players: Iterable[Player]) -> None:
+        for player in players:
+            if not self._dirty:
+                self._oldest = self.clock()
+            # A copy is kept, so that later changes to the player are not written until they are saved
+            self._dirty[normalize_name(player.name)] = dict(player.stats)
+        self._flush_if_due()
+
+    def names(self) -> list[str]:
+        self._flush_if_due()
+        names = {normalize_name(name): name for name in self.store.names()}
+        for key, stats in self._dirty.items():
+            names.setdefault(key, stats["name"])
+        return [names[key] for key in sorted(names)]
+
+    def __contains__(self, name: str) -> bool:
+        self._flush_if_due()
+        return normalize_name(name) in self._dirty or name in self.store
+
+    def flush(self) -> None:
+        """
+        flush writes every dirty player to the underlying store in one batch
+        :return: None
+        """
+        _flush(self.store, self._dirty)
+
+    def close(self) -> None:
+        """
+        close flushes any dirty players and closes the underlying store. The store is no longer flushed when it is
+        garbage collected or the interpreter exits
+        :return: None
+        """
+        self.flush()
+        self._finalizer.detach()
+        self.store.close()
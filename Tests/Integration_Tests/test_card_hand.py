@@ -33,7 +33,10 @@ class Testtest_card_hand:
     def test_hand_flip_str(self, class_setup, method_setup):
         card1 = card.Card(Suit.SPADES, Value.SEVEN)
         card2 = card.Card(Suit.CLUBS, Value.TEN)
-        card1.face_down = True
-        self.my_hand.add_card(card1)
+        self.my_hand.add_card(card1, face_down=True)
         self.my_hand.add_card(card2)
         assert str(self.my_hand) == "10♣\n##"
+        assert self.my_hand.is_face_down(-1)
+        assert not self.my_hand.is_face_down(0)
+        self.my_hand.reveal()
+        assert str(self.my_hand) == "10♣\n7♠"
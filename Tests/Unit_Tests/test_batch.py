@@ -0,0 +1,96 @@
+"""
+FILENAME: test_batch.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for batch.py, checking the vectorized engine against the rules of Game
+"""
+
+import numpy as np
+import pytest
+
+from Blackjack import batch
+from Blackjack.batch import simulate_batch
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.result import Result
+from Blackjack.simulation import simulate
+
+
+class TestBatch:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.rng = np.random.default_rng(2025)
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def fixed_cards(self, mocker, *rows):
+        """Replace the card draw with fixed rows of ranks, in deal order: player, dealer, player, dealer, then draws"""
+
+        def draw(rng, hands, cards_needed, decks):
+            return np.array(
+                [list(row) + [2] * (cards_needed - len(row)) for row in rows],
+                dtype=np.int8,
+            )
+
+        mocker.patch("Blackjack.batch._draw_cards", side_effect=draw)
+
+    def test_natural_beats_three_card_21(self, class_setup, method_setup, mocker):
+        self.fixed_cards(mocker, [1, 10, 10, 6, 5])
+        result = simulate_batch(1, rng=self.rng)
+        assert result.counts[Result.VICTORY] == 1
+        assert result.net_change.tolist() == [1]
+
+    def test_dealer_bust_ends_player_turn(self, class_setup, method_setup, mocker):
+        # The player hits to 15 and would hit again, but the dealer busts in the same round
+        self.fixed_cards(mocker, [10, 10, 2, 6, 3, 10, 10])
+        result = simulate_batch(1, rng=self.rng)
+        assert result.counts[Result.VICTORY] == 1
+
+    def test_double_down_doubles_net_change(self, class_setup, method_setup, mocker):
+        self.fixed_cards(mocker, [5, 10, 6, 7, 10], [5, 10, 6, 7, 2])
+        result = simulate_batch(2, double_totals=(11,), rng=self.rng)
+        assert result.net_change.tolist() == [2, -2]
+
+    def test_push_on_equal_totals(self, class_setup, method_setup, mocker):
+        self.fixed_cards(mocker, [10, 10, 8, 8])
+        result = simulate_batch(1, rng=self.rng)
+        assert result.counts[Result.PUSH] == 1
+        assert result.net_change.tolist() == [0]
+
+    def test_counts_cover_every_hand(self, class_setup, method_setup):
+        result = simulate_batch(10_000, rng=self.rng, chunk_size=3000)
+        assert result.hands == 10_000
+        assert sum(result.counts.values()) == 10_000
+        assert set(np.unique(result.net_change)) <= {-1, 0, 1}
+
+    def test_seeded_runs_match(self, class_setup, method_setup):
+        first = simulate_batch(5000, rng=np.random.default_rng(3))
+        second = simulate_batch(5000, rng=np.random.default_rng(3))
+        assert np.array_equal(first.net_change, second.net_change)
+
+    @pytest.mark.parametrize("decks", [1, 6, None])
+    def test_agrees_with_game(self, decks, class_setup, method_setup):
+        """The engine and headless Game play the same strategy, so their mean results must agree statistically"""
+        games = simulate(DealerMimicPolicy(), 20_000)
+        batched = simulate_batch(200_000, decks=decks, rng=self.rng)
+        tolerance = 4 * (games.standard_error + np.sqrt(batched.variance / batched.hands))
+        assert abs(games.mean - batched.mean) < tolerance
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [{"stand_on": 1}, {"stand_on": 22}, {"decks": 0}, {"bet": 0}],
+    )
+    def test_invalid_arguments(self, arguments, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            simulate_batch(10, **arguments)
+
+    def test_ranks_match_deck(self, class_setup, method_setup):
+        assert batch._RANKS.sum() == 4 * (1 + 2 + 3 + 4 + 5 + 6 + 7 + 8 + 9 + 10 * 4)
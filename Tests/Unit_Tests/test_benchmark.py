@@ -0,0 +1,78 @@
+"""
+FILENAME: test_benchmark.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for benchmark.py measurements, baselines and the comparison report
+"""
+
+import pytest
+
+from Blackjack import benchmark
+from Blackjack.benchmark import BENCHMARKS, compare, format_report, load_baseline, run_benchmarks, save_baseline
+
+
+class TestBenchmark:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.baseline = {"new_hand": 1000.0, "get_total": 100.0}
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_every_benchmark_runs(self, class_setup, method_setup):
+        results = run_benchmarks(scale=0.001)
+        assert set(results) == set(BENCHMARKS)
+        assert all(value > 0 for value in results.values())
+
+    def test_unknown_benchmark(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            run_benchmarks(names=["deal_faster"])
+
+    def test_invalid_scale(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            run_benchmarks(scale=0)
+
+    def test_baseline_round_trip(self, class_setup, method_setup, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_baseline(self.baseline, path)
+        assert load_baseline(path) == self.baseline
+
+    @pytest.mark.parametrize(
+        "name,current,regressed",
+        [("new_hand", 850.0, True), ("new_hand", 950.0, False), ("get_total", 120.0, True), ("get_total", 80.0, False)],
+    )
+    def test_regressions_follow_direction(self, name, current, regressed, class_setup, method_setup):
+        (comparison,) = compare({name: current}, self.baseline, tolerance=0.1)
+        assert comparison.regressed == regressed
+
+    def test_faster_is_positive_change(self, class_setup, method_setup):
+        comparisons = compare({"new_hand": 2000.0, "get_total": 50.0}, self.baseline)
+        assert [comparison.change for comparison in comparisons] == [pytest.approx(1.0), pytest.approx(1.0)]
+
+    def test_missing_baseline_is_not_a_regression(self, class_setup, method_setup):
+        (comparison,) = compare({"evaluate": 500.0}, self.baseline)
+        assert comparison.change is None
+        assert not comparison.regressed
+
+    def test_report_marks_regressions(self, class_setup, method_setup):
+        report = format_report(compare({"new_hand": 500.0, "get_total": 100.0}, self.baseline))
+        lines = report.splitlines()
+        assert len(lines) == 3
+        assert "REGRESSION" in lines[1]
+        assert "REGRESSION" not in lines[2]
+
+    def test_main_exit_status(self, class_setup, method_setup, tmp_path, mocker):
+        mocker.patch("builtins.print")
+        mocker.patch.object(benchmark, "run_benchmarks", return_value={"new_hand": 500.0})
+        path = tmp_path / "baseline.json"
+        save_baseline(self.baseline, path)
+        assert benchmark.main(["--baseline", str(path)]) == 1
+        assert benchmark.main(["--baseline", str(path), "--tolerance", "0.6"]) == 0
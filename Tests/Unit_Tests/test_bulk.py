@@ -0,0 +1,139 @@
+"""
+FILENAME: test_bulk.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for bulk.py
+"""
+
+import itertools
+import json
+
+import pytest
+
+from Blackjack.bulk import STAT_FIELDS, export_players, import_players, main, validate_stats
+from Blackjack.player import Player
+from Blackjack.player_store import JsonPlayerStore, SQLitePlayerStore
+
+
+class TestBulk:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.tmp_path = tmp_path
+        self.store = SQLitePlayerStore(":memory:")
+        self.players = [Player.from_name_bankroll(f"Player {index}", 100 + index) for index in range(25)]
+        self.players[3].stats["wins"] = 7
+        self.store.save_many(self.players)
+        yield
+        self.store.close()
+        print(f"Tearing down method: {request.function.__name__}")
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".csv"])
+    def test_round_trip(self, class_setup, method_setup, suffix):
+        path = self.tmp_path / f"players{suffix}"
+        report = export_players(self.store, path)
+        assert report.players == 25
+        with SQLitePlayerStore(":memory:") as target:
+            report = import_players(target, path, batch_size=10)
+            assert report.players == 25
+            assert list(target.players()) == list(self.store.players())
+            assert target.load("player 3").stats["wins"] == 7
+
+    def test_export_from_json_store(self, class_setup, method_setup):
+        source = JsonPlayerStore(self.tmp_path)
+        source.save_many(self.players[:3])
+        path = self.tmp_path / "players.jsonl"
+        export_players(source, path)
+        with open(path) as file:
+            assert [json.loads(line)["name"] for line in file] == ["Player 0", "Player 1", "Player 2"]
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".csv"])
+    def test_missing_stats_are_exported_as_zero(self, class_setup, method_setup, suffix):
+        source = JsonPlayerStore(self.tmp_path)
+        source.save(Player({"name": "Sparse", "bankroll": 50}))
+        path = self.tmp_path / f"players{suffix}"
+        export_players(source, path)
+        with SQLitePlayerStore(":memory:") as target:
+            import_players(target, path)
+            assert dict(target.load("Sparse").stats) == {
+                "name": "Sparse", "bankroll": 50, "wins": 0, "losses": 0, "pushes": 0
+            }
+
+    def test_import_is_batched(self, class_setup, method_setup, mocker):
+        path = self.tmp_path / "players.jsonl"
+        export_players(self.store, path)
+        target = mocker.MagicMock()
+        import_players(target, path, batch_size=10)
+        assert [len(call.args[0]) for call in target.save_many.call_args_list] == [10, 10, 5]
+
+    def test_report_rate(self, class_setup, method_setup):
+        clock = itertools.count(0.0, 0.5).__next__
+        report = export_players(self.store, self.tmp_path / "players.csv", clock=clock)
+        assert report.seconds == 0.5
+        assert report.rate == 50
+        assert "25 players" in str(report)
+
+    def test_bad_row_names_its_line(self, class_setup, method_setup):
+        path = self.tmp_path / "bad.jsonl"
+        good = json.dumps(self.players[0].stats.to_dict())
+        bad = json.dumps({"name": "Eve", "bankroll": -5, "wins": 0, "losses": 0, "pushes": 0})
+        path.write_text(f"{good}\n{good}\n{bad}\n")
+        with SQLitePlayerStore(":memory:") as target:
+            with pytest.raises(ValueError, match="Line 3"):
+                import_players(target, path)
+
+    @pytest.mark.parametrize("line", ["[1, 2]", "3", '"Eve"', "null"])
+    def test_line_that_is_not_an_object(self, class_setup, method_setup, line):
+        path = self.tmp_path / "bad.jsonl"
+        good = json.dumps(self.players[0].stats.to_dict())
+        path.write_text(f"{good}\n{line}\n")
+        with SQLitePlayerStore(":memory:") as target:
+            with pytest.raises(ValueError, match="Line 2"):
+                import_players(target, path)
+        assert main(["import", str(path), "--store", str(self.tmp_path / "copy.db")]) == 1
+
+    @pytest.mark.parametrize(
+        "stats",
+        [
+            {"name": "Eve", "bankroll": 5},
+            {"name": " ", "bankroll": 5, "wins": 0, "losses": 0, "pushes": 0},
+            {"name": "Eve", "bankroll": 5.5, "wins": 0, "losses": 0, "pushes": 0},
+            {"name": "Eve", "bankroll": True, "wins": 0, "losses": 0, "pushes": 0},
+            {"name": "Eve", "bankroll": 5, "wins": 0, "losses": 0, "pushes": 0, "bet": 1},
+        ],
+    )
+    def test_validate_stats_rejects(self, class_setup, method_setup, stats):
+        with pytest.raises(ValueError):
+            validate_stats(stats)
+
+    def test_validate_stats_from_text(self, class_setup, method_setup):
+        row = dict(zip(STAT_FIELDS, ("Eve", "5", "1", "2", "3")))
+        assert validate_stats(row, from_text=True) == Player.from_name_bankroll("Eve", 5).stats.to_dict() | {
+            "wins": 1, "losses": 2, "pushes": 3
+        }
+        with pytest.raises(ValueError):
+            validate_stats(row)
+
+    def test_unsupported_format(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            export_players(self.store, self.tmp_path / "players.xml")
+
+    def test_main(self, class_setup, method_setup, capsys):
+        database = self.tmp_path / "players.db"
+        path = self.tmp_path / "players.csv"
+        with SQLitePlayerStore(database) as store:
+            store.save_many(self.players)
+        assert main(["export", str(path), "--store", str(database)]) == 0
+        assert "Exported 25 players" in capsys.readouterr().out
+        assert main(["import", str(path), "--store", str(self.tmp_path / "copy.db")]) == 0
+        assert "Imported 25 players" in capsys.readouterr().out
+        path.write_text("name,bankroll\nEve,5\n")
+        assert main(["import", str(path), "--store", str(database)]) == 1
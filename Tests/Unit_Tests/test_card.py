@@ -6,6 +6,9 @@ CREATED ON: 7/4/2025
 
 """
 
+import copy
+import pickle
+
 import pytest
 
 from Blackjack import card
@@ -58,10 +61,25 @@ class TestCard:
         assert card3.__str__() == "K♦"
         assert card4.__str__() == "A♥"
 
-        card1.face_down = True
-        assert card1.face_down
-        assert card1.__str__() == "##"
-        assert str(card1) == "##"
-        card1.face_down = False
-        assert card1.__str__() == "7♠"
+    def test_cards_interned(self, class_setup, method_setup):
+        card1 = card.Card(Suit.SPADES, Value.SEVEN)
+        card2 = card.Card(Suit.SPADES, Value.SEVEN)
+        assert card1 is card2
+        assert card.Card(Suit.HEARTS, Value.SEVEN) is not card1
+        assert len(card.DECK) == 52
+        assert len(set(card.DECK)) == 52
+        assert all(card.Card(c.suit, c.value) is c for c in card.DECK)
+
+    def test_cards_immutable(self, class_setup, method_setup):
+        card1 = card.Card(Suit.SPADES, Value.SEVEN)
+        with pytest.raises(AttributeError):
+            card1.face_down = True
+        with pytest.raises(AttributeError):
+            card1.value = Value.ACE
+        assert not hasattr(card1, "__dict__")
         assert str(card1) == "7♠"
+
+    def test_cards_copy_and_pickle(self, class_setup, method_setup):
+        card1 = card.Card(Suit.DIAMONDS, Value.QUEEN)
+        assert copy.deepcopy(card1) is card1
+        assert pickle.loads(pickle.dumps(card1)) is card1
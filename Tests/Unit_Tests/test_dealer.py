@@ -10,7 +10,7 @@ import collections
 
 import pytest
 
-from Blackjack import dealer
+from Blackjack import card, dealer, hand
 from Blackjack.move import Move
 from Blackjack.suit import Suit
 from Blackjack.value import Value
@@ -148,3 +148,12 @@ class TestDealer:
         self.dealer.deal_card(self.deck.pop())
         assert fake_card2.facedown
         assert not fake_card1.facedown
+
+    def test_first_card_face_down_in_hand(self, class_setup, method_setup, mocker):
+        mocker.patch("builtins.print")
+        real_dealer = dealer.Dealer(hand.Hand())
+        real_dealer.deal_card(card.Card(Suit.CLUBS, Value.FIVE))
+        real_dealer.deal_card(card.Card(Suit.SPADES, Value.QUEEN))
+        assert str(real_dealer.hand) == "Q♠\n##"
+        real_dealer.reveal_hand()
+        assert str(real_dealer.hand) == "Q♠\n5♣"
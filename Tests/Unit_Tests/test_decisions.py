@@ -0,0 +1,188 @@
+"""
+FILENAME: test_decisions.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for decisions.py sources, and Player playing from each of them. Asynchronous tests run their own event loop with
+asyncio.run
+"""
+
+import asyncio
+import collections
+
+import pytest
+
+from Blackjack.card import Card
+from Blackjack.decisions import (
+    ConsoleDecisions,
+    PolicyDecisions,
+    QueueDecisions,
+    ScriptedDecisions,
+    StreamDecisions,
+)
+from Blackjack.move import Move
+from Blackjack.player import Player
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.suit import Suit
+from Blackjack.value import Value
+
+
+class FakeWriter:
+    """
+    FakeWriter collects the lines a StreamDecisions writes, in place of a connection
+    """
+
+    def __init__(self):
+        self.written = b""
+
+    def write(self, data: bytes) -> None:
+        self.written += data
+
+    async def drain(self) -> None:
+        pass
+
+    @property
+    def lines(self) -> list[str]:
+        return self.written.decode().splitlines()
+
+
+def make_deck(count: int = 10) -> collections.deque:
+    return collections.deque(Card(Suit.HEARTS, Value.TWO) for _ in range(count))
+
+
+def stream_with(*answers: str, eof: bool = True) -> tuple[StreamDecisions, FakeWriter]:
+    reader = asyncio.StreamReader()
+    for answer in answers:
+        reader.feed_data(f"{answer}\n".encode())
+    if eof:
+        reader.feed_eof()
+    writer = FakeWriter()
+    return StreamDecisions(reader, writer), writer
+
+
+class TestDecisions:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, mocker):
+        print(f"Setting up method: {request.function.__name__}")
+        self.fake_print = mocker.patch("builtins.print")
+        self.fake_input = mocker.patch("builtins.input")
+        self.player = Player.from_name_bankroll("Decider", 100)
+        self.player.deal_card(Card(Suit.SPADES, Value.FIVE))
+        self.player.deal_card(Card(Suit.SPADES, Value.SIX))
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_console_is_the_default(self, class_setup, method_setup):
+        assert isinstance(self.player.decisions, ConsoleDecisions)
+        assert self.player.policy is None
+
+    def test_policy_sets_decisions(self, class_setup, method_setup):
+        policy = DealerMimicPolicy()
+        self.player.policy = policy
+        assert isinstance(self.player.decisions, PolicyDecisions)
+        assert self.player.policy is policy
+        self.player.policy = None
+        assert isinstance(self.player.decisions, ConsoleDecisions)
+
+    def test_console_asks_until_valid(self, class_setup, method_setup):
+        self.fake_input.side_effect = ["ten", "500", "0", "25"]
+        assert ConsoleDecisions().bet(100) == 25
+        assert self.fake_input.call_count == 4
+
+    def test_console_refuses_unaffordable_double(self, class_setup, method_setup):
+        self.fake_input.side_effect = ["double down", "hit"]
+        assert ConsoleDecisions().decide(self.player.hand, None, False) == Move.HIT
+        self.fake_print.assert_any_call("You don't have enough money to double down.")
+
+    def test_scripted_player(self, class_setup, method_setup):
+        self.player.decisions = ScriptedDecisions([10], [Move.HIT, Move.DOUBLE_DOWN])
+        deck = make_deck()
+        self.player.ante()
+        assert self.player.bet == 10
+        assert self.player.take_turn(deck) == Move.HIT
+        assert self.player.take_turn(deck) == Move.DOUBLE_DOWN
+        assert self.player.bet == 20
+        assert self.player.hand.get_size() == 4
+        self.fake_input.assert_not_called()
+        with pytest.raises(ValueError):
+            self.player.take_turn(deck)
+
+    def test_bet_outside_bankroll(self, class_setup, method_setup):
+        self.player.decisions = ScriptedDecisions([101])
+        with pytest.raises(ValueError):
+            self.player.ante()
+
+    def test_unaffordable_double_is_a_hit(self, class_setup, method_setup):
+        self.player.decisions = ScriptedDecisions([80], [Move.DOUBLE_DOWN])
+        self.player.ante()
+        assert self.player.take_turn(make_deck()) == Move.HIT
+        assert self.player.bet == 80
+
+    def test_async_source_needs_await(self, class_setup, method_setup):
+        self.player.decisions = QueueDecisions()
+        with pytest.raises(TypeError):
+            self.player.ante()
+        with pytest.raises(TypeError):
+            self.player.take_turn(make_deck())
+
+    def test_async_methods_take_sync_source(self, class_setup, method_setup):
+        self.player.decisions = ScriptedDecisions([5], [Move.STAND])
+
+        async def play() -> Move:
+            await self.player.ante_async()
+            return await self.player.take_turn_async(make_deck())
+
+        assert asyncio.run(play()) == Move.STAND
+        assert self.player.bet == 5
+
+    def test_queue_players_wait_together(self, class_setup, method_setup):
+        players = [Player.from_name_bankroll(f"Queued {index}", 100) for index in range(3)]
+
+        async def play() -> list[int]:
+            for player in players:
+                player.decisions = QueueDecisions()
+            antes = asyncio.gather(*(player.ante_async() for player in players))
+            await asyncio.sleep(0)
+            # Every player is waiting at once, so they can be answered in any order
+            for bet, player in zip((3, 2, 1), reversed(players)):
+                await player.decisions.bets.put(bet)
+            await antes
+            return [player.bet for player in players]
+
+        assert asyncio.run(play()) == [1, 2, 3]
+
+    def test_stream_asks_again(self, class_setup, method_setup):
+        async def play() -> tuple[int, Move, list[str]]:
+            decisions, writer = stream_with("lots", "40", "FOLD", "double")
+            bet = await decisions.bet(100)
+            move = await decisions.decide(self.player.hand, None, True)
+            return bet, move, writer.lines
+
+        bet, move, lines = asyncio.run(play())
+        assert (bet, move) == (40, Move.DOUBLE_DOWN)
+        assert lines == [
+            "ANTE 100",
+            "ERR bet must be between 1 and 100",
+            "ANTE 100",
+            "TURN 11 1",
+            "ERR expected HIT, STAND or DOUBLE",
+            "TURN 11 1",
+        ]
+
+    def test_stream_disconnect(self, class_setup, method_setup):
+        async def play() -> Move:
+            decisions, _ = stream_with()
+            move = await decisions.decide(self.player.hand, None, True)
+            assert decisions.closed
+            with pytest.raises(ConnectionError):
+                await decisions.bet(100)
+            return move
+
+        assert asyncio.run(play()) == Move.STAND
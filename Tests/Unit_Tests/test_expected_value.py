@@ -0,0 +1,83 @@
+"""
+FILENAME: test_expected_value.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for expected_value.py analysis of hands in play
+"""
+
+import pytest
+
+from Blackjack import card, hand
+from Blackjack.expected_value import PlayerState, analyze, move_values
+from Blackjack.move import Move
+from Blackjack.probability import NATURAL, dealer_probabilities, shoe_composition
+from Blackjack.suit import Suit
+from Blackjack.value import Value
+
+
+class TestExpectedValue:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def make_hand(self, *values):
+        my_hand = hand.Hand()
+        for value in values:
+            my_hand.add_card(card.Card(Suit.SPADES, value))
+        return my_hand
+
+    def test_analyze_matches_move_values(self, class_setup, method_setup):
+        my_hand = self.make_hand(Value.ACE, Value.SIX)
+        values = analyze(my_hand, card.Card(Suit.HEARTS, Value.FIVE), None)
+        assert values == move_values(PlayerState(7, True, True), 5)
+        assert set(values) == {Move.STAND, Move.HIT, Move.DOUBLE_DOWN}
+
+    def test_stand_value_from_dealer_table(self, class_setup, method_setup):
+        # Standing on 20, the player wins on 17 to 19 and a bust, pushes on 20, and loses on 21 and a natural
+        composition = (1, 1, 2, 0, 1, 3, 1, 2, 1, 4)
+        values = analyze(self.make_hand(Value.KING, Value.QUEEN), card.Card(Suit.HEARTS, Value.NINE), composition)
+        table = dealer_probabilities(9, composition)
+        expected = sum(table[:3]) + table[5] - table[4] - table[NATURAL]
+        assert values[Move.STAND] == pytest.approx(expected)
+
+    def test_dealer_moves_narrow_the_hole_card(self, class_setup, method_setup):
+        # A dealer showing a ten who hit, took a six and stood must hold a two, three, four or five: 18 to 21
+        values = analyze(
+            self.make_hand(Value.KING, Value.QUEEN),
+            card.Card(Suit.HEARTS, Value.TEN),
+            None,
+            dealer_cards=[card.Card(Suit.HEARTS, Value.SIX)],
+            dealer_stood=True,
+        )
+        assert values[Move.STAND] == pytest.approx(0.25)
+
+    def test_replacement_is_close_to_exact(self, class_setup, method_setup):
+        my_hand = self.make_hand(Value.TEN, Value.SEVEN)
+        upcard = card.Card(Suit.HEARTS, Value.TEN)
+        composition = shoe_composition(6)
+        exact = analyze(my_hand, upcard, composition)
+        approximate = analyze(my_hand, upcard, composition, replacement=True)
+        for move, value in exact.items():
+            assert approximate[move] == pytest.approx(value, abs=0.01)
+        assert exact != approximate
+
+    def test_analyze_rejects_bust_hand(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            analyze(self.make_hand(Value.KING, Value.QUEEN, Value.TWO), card.Card(Suit.HEARTS, Value.TEN), None)
+
+    def test_analyze_rejects_impossible_dealer(self, class_setup, method_setup):
+        # No hole card lets a dealer showing an ace hit twice on tens without busting
+        ten = card.Card(Suit.HEARTS, Value.TEN)
+        ace = card.Card(Suit.HEARTS, Value.ACE)
+        with pytest.raises(ValueError):
+            analyze(self.make_hand(Value.FIVE, Value.SIX), ace, None, dealer_cards=[ten, ten])
@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -30,8 +31,8 @@ class TestFileIO:
         player = Player.from_name_bankroll("Test Player", 100)
         test_path = Path(self.temp_dir) / "permission_test.blackjack"
 
-        # Using mocker instead of mock_open
-        mocker.patch("builtins.open", side_effect=PermissionError("Access denied"))
+        # Using mocker instead of mock_open. The stats are written to a temporary file beside the target first
+        mocker.patch("tempfile.NamedTemporaryFile", side_effect=PermissionError("Access denied"))
 
         with pytest.raises(PermissionError, match="Access denied"):
             save_player(player, test_path)
@@ -43,13 +44,16 @@ class TestFileIO:
 
         # Create mock that raises exception when called
         mock_open_func = mocker.Mock(side_effect=PermissionError("Access denied"))
-        mocker.patch("builtins.open", mock_open_func)
+        mocker.patch("tempfile.NamedTemporaryFile", mock_open_func)
 
         with pytest.raises(PermissionError):
             save_player(player, test_path)
 
         # Verify open was called with expected arguments
-        mock_open_func.assert_called_once_with(test_path, "w")
+        # The stats are written beside the target first, and only renamed over it once complete
+        mock_open_func.assert_called_once_with(
+            "w", dir=test_path.parent, prefix=".permission_test.blackjack.", suffix=".tmp", delete=False
+        )
 
     def test_load_player_file_corruption_v1(self, class_setup, method_setup, mocker):
         """Approach 1: Mock file content directly"""
@@ -92,6 +96,7 @@ class TestFileIO:
 
         # Mock open for save (we don't care about the file, just that it's called)
         mocker.patch("builtins.open", mocker.mock_open())
+        mocker.patch("os.replace")
 
         # Execute save
         save_player(player, test_path)
@@ -118,8 +123,8 @@ class TestFileIO:
         player = Player.from_name_bankroll("Test Player", 100)
         test_path = Path(self.temp_dir) / "new_way.blackjack"
 
-        # More concise and readable
-        mocker.patch("builtins.open", side_effect=PermissionError("Access denied"))
+        # More concise and readable. save_player writes through a temporary file beside the target
+        mocker.patch("tempfile.NamedTemporaryFile", side_effect=PermissionError("Access denied"))
 
         with pytest.raises(PermissionError):
             save_player(player, test_path)
@@ -138,9 +143,10 @@ class TestFileIO:
                 mocker.mock_open(
                     read_data='{"name": "old", "bankroll": 50}'
                 ).return_value,
-                PermissionError("File locked"),
             ],
         )
+        # save_player writes through a temporary file beside the target
+        mocker.patch("tempfile.NamedTemporaryFile", side_effect=PermissionError("File locked"))
 
         # First operation should work
         loaded_player = load_player(test_path)
@@ -177,3 +183,38 @@ class TestFileIO:
         # Normal path works
         player = load_player(Path("normal_file.blackjack"))
         assert player.name == "test"
+
+    def test_failed_save_keeps_old_file(self, class_setup, method_setup, mocker):
+        """A save that fails part way leaves the previous file whole, and no temporary file behind"""
+        test_path = Path(self.temp_dir) / "atomic.blackjack"
+        save_player(Player.from_name_bankroll("Atomic", 100), test_path)
+
+        mocker.patch("json.dump", side_effect=OSError("Disk full"))
+        with pytest.raises(OSError, match="Disk full"):
+            save_player(Player.from_name_bankroll("Atomic", 900), test_path)
+
+        assert load_player(test_path).bankroll == 100
+        assert list(Path(self.temp_dir).glob(".atomic.blackjack.*")) == []
+
+    def test_save_with_fsync(self, class_setup, method_setup, mocker):
+        """An fsync save forces the file to disk before it replaces the old one"""
+        test_path = Path(self.temp_dir) / "fsync.blackjack"
+        fsync = mocker.spy(os, "fsync")
+
+        save_player(Player.from_name_bankroll("Durable", 300), test_path, fsync=True)
+
+        assert fsync.call_count >= 1
+        assert load_player(test_path).bankroll == 300
+        assert list(Path(self.temp_dir).glob(".fsync.blackjack.*")) == []
+
+    def test_saves_use_their_own_temporary_files(self, class_setup, method_setup, mocker):
+        """Two saves of one player never share a temporary file"""
+        test_path = Path(self.temp_dir) / "shared.blackjack"
+        replace = mocker.spy(os, "replace")
+
+        save_player(Player.from_name_bankroll("Shared", 100), test_path)
+        save_player(Player.from_name_bankroll("Shared", 200), test_path)
+
+        first, second = (call.args[0] for call in replace.call_args_list)
+        assert first != second
+        assert load_player(test_path).bankroll == 200
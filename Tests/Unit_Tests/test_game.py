@@ -34,7 +34,8 @@ class TestGameLogic:
         self.fake_print = mocker.patch("builtins.print")
         self.deck = collections.deque()
         self.fake_player = mocker.Mock()
-        self.fake_dealer_hand = mocker.Mock()
+        # A MagicMock, so the game can look up the dealer's upcard with hand[-2]
+        self.fake_dealer_hand = mocker.MagicMock()
         self.fake_player_hand = mocker.Mock()
         self.fake_dealer = mocker.Mock()
         self.fake_dealer.hand = self.fake_dealer_hand
@@ -35,7 +35,8 @@ class TestGameEdgeCases:
         self.fake_print = mocker.patch("builtins.print")
         self.deck = collections.deque()
         self.fake_player = mocker.Mock()
-        self.fake_dealer_hand = mocker.Mock()
+        # A MagicMock, so the game can look up the dealer's upcard with hand[-2]
+        self.fake_dealer_hand = mocker.MagicMock()
         self.fake_player_hand = mocker.Mock()
         self.fake_dealer = mocker.Mock()
         self.fake_dealer.hand = self.fake_dealer_hand
@@ -368,8 +369,9 @@ class TestFileIOEdgeCases:
         player = Player.from_name_bankroll("Test Player", 100)
         file_path = Path(self.temp_dir) / "concurrent.blackjack"
 
+        # save_player writes through a temporary file beside the target
         with mocker.patch(
-            "builtins.open",
+            "tempfile.NamedTemporaryFile",
             side_effect=PermissionError("File is locked by another process"),
         ):
             with pytest.raises(PermissionError):
@@ -0,0 +1,142 @@
+"""
+FILENAME: test_game_resumable.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for Game.play_hand, the resumable hand, and Game.new_hand_async. Asynchronous tests run their own event loop with
+asyncio.run
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from Blackjack.dealer import Dealer
+from Blackjack.decisions import Decision, DecisionRequest, PolicyDecisions, QueueDecisions
+from Blackjack.game import Game
+from Blackjack.move import Move
+from Blackjack.player import OutOfMoneyException, Player
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.result import Result
+from Blackjack.shoe import Shoe
+from Blackjack.strategy import BasicStrategyPolicy
+
+
+def make_game(seed: int, policy=None) -> Game:
+    player = Player.from_name_bankroll(f"Player {seed}", 1000)
+    return Game(player, Dealer(), Shoe(rng=random.Random(seed)), policy or DealerMimicPolicy())
+
+
+def finish(hand, answer) -> tuple[Result, int]:
+    """
+    finish drives a resumable hand to its end, answering every request with answer
+    """
+    request = next(hand)
+    while True:
+        try:
+            request = hand.send(answer(request))
+        except StopIteration as finished:
+            return finished.value
+
+
+class TestResumableGame:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.policy = BasicStrategyPolicy()
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_matches_new_hand(self, class_setup, method_setup):
+        resumable = make_game(6, self.policy)
+        whole = make_game(6, self.policy)
+        decisions = PolicyDecisions(self.policy)
+        for _ in range(300):
+            assert finish(resumable.play_hand(), lambda request: request.ask(decisions)) == whole.new_hand()
+        assert resumable.player.hand is None and resumable.dealer.hand is None
+
+    def test_interleaved_hands(self, class_setup, method_setup):
+        games = [make_game(seed) for seed in range(40)]
+        expected = [[game.new_hand() for _ in range(10)] for game in map(make_game, range(40))]
+        decisions = PolicyDecisions(DealerMimicPolicy())
+        results = [[] for _ in games]
+        for _ in range(10):
+            # Every game is started, then each is moved on one decision at a time, in turn, until all have finished
+            hands = [game.play_hand() for game in games]
+            requests = [next(hand) for hand in hands]
+            while any(request is not None for request in requests):
+                for index, hand in enumerate(hands):
+                    if requests[index] is None:
+                        continue
+                    try:
+                        requests[index] = hand.send(requests[index].ask(decisions))
+                    except StopIteration as finished:
+                        results[index].append(finished.value)
+                        requests[index] = None
+        assert results == expected
+
+    def test_requests(self, class_setup, method_setup):
+        game = make_game(3)
+        hand = game.play_hand()
+        request = next(hand)
+        assert isinstance(request, DecisionRequest)
+        assert request.decision == Decision.BET
+        assert request.bankroll == 1000
+        assert game.player.hand is None
+        request = hand.send(600)
+        assert request.decision == Decision.MOVE
+        assert request.hand is game.player.hand
+        assert request.dealer_upcard is game.dealer.hand[-2]
+        assert request.hand.get_size() == 2
+        assert not request.can_double
+        hand.close()
+
+    def test_broke_player_is_not_asked(self, class_setup, method_setup, mocker):
+        mocker.patch("builtins.print")
+        game = make_game(3)
+        game.player.bankroll = 0
+        with pytest.raises(OutOfMoneyException):
+            next(game.play_hand())
+
+    def test_bet_outside_bankroll(self, class_setup, method_setup):
+        hand = make_game(3).play_hand()
+        next(hand)
+        with pytest.raises(ValueError):
+            hand.send(1001)
+
+    def test_stand_is_played(self, class_setup, method_setup):
+        game = make_game(8)
+        _, net_change = finish(game.play_hand(), lambda request: 10 if request.decision == Decision.BET else Move.STAND)
+        assert game._moves == [Move.STAND]
+        assert net_change in (-10, 0, 10)
+
+    def test_async_hands_wait_together(self, class_setup, method_setup):
+        games = [make_game(seed) for seed in range(20)]
+
+        async def play() -> list[tuple[Result, int]]:
+            for game in games:
+                game.player.decisions = QueueDecisions()
+            hands = asyncio.gather(*(game.new_hand_async() for game in games))
+            await asyncio.sleep(0)
+            # Every hand is waiting on its bet at once, on one thread
+            assert not hands.done()
+            assert all(game.player.hand is None for game in games)
+            for game in games:
+                await game.player.decisions.bets.put(5)
+            await asyncio.sleep(0)
+            assert all(game.player.hand.get_size() == 2 for game in games)
+            for game in games:
+                await game.player.decisions.moves.put(Move.STAND)
+            return await hands
+
+        results = asyncio.run(play())
+        assert len(results) == 20
+        assert all(net_change in (-5, 0, 5) for _, net_change in results)
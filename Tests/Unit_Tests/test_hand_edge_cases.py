@@ -310,3 +310,45 @@ class TestHandEdgeCases:
         assert self.my_hand.get_total() == 0
         assert self.my_hand.get_size() == 0
         assert str(self.my_hand) == ""
+        assert not self.my_hand.is_soft()
+        assert not self.my_hand.is_blackjack()
+        assert not self.my_hand.is_bust()
+
+    # ==================== SOFT, BLACKJACK AND BUST FLAGS ====================
+
+    def test_soft_flag_follows_ace(self, class_setup, method_setup):
+        """Test that the soft flag is set while an ace counts as 11, and cleared once it must count as 1"""
+        self.my_hand.add_card(card.Card(Suit.SPADES, Value.ACE))
+        assert self.my_hand.is_soft()
+        self.my_hand.add_card(card.Card(Suit.HEARTS, Value.SIX))
+        assert self.my_hand.is_soft()
+        assert self.my_hand.get_total() == 17
+        self.my_hand.add_card(card.Card(Suit.CLUBS, Value.NINE))
+        assert not self.my_hand.is_soft()
+        assert self.my_hand.get_total() == 16
+
+    def test_hard_hand_is_not_soft(self, class_setup, method_setup):
+        """Test that a hand without aces is never soft"""
+        self.my_hand.add_card(card.Card(Suit.SPADES, Value.TEN))
+        self.my_hand.add_card(card.Card(Suit.HEARTS, Value.SEVEN))
+        assert not self.my_hand.is_soft()
+
+    def test_blackjack_requires_two_cards(self, class_setup, method_setup):
+        """Test that only a two card 21 is a blackjack"""
+        self.my_hand.add_card(card.Card(Suit.SPADES, Value.ACE))
+        self.my_hand.add_card(card.Card(Suit.HEARTS, Value.KING))
+        assert self.my_hand.is_blackjack()
+
+        three_card_21 = hand.Hand()
+        for value in (Value.SEVEN, Value.SEVEN, Value.SEVEN):
+            three_card_21.add_card(card.Card(Suit.CLUBS, value))
+        assert three_card_21.get_total() == 21
+        assert not three_card_21.is_blackjack()
+
+    def test_bust_flag(self, class_setup, method_setup):
+        """Test that the bust flag is set once the total passes 21"""
+        self.my_hand.add_card(card.Card(Suit.SPADES, Value.KING))
+        self.my_hand.add_card(card.Card(Suit.HEARTS, Value.QUEEN))
+        assert not self.my_hand.is_bust()
+        self.my_hand.add_card(card.Card(Suit.CLUBS, Value.TWO))
+        assert self.my_hand.is_bust()
@@ -0,0 +1,150 @@
+"""
+FILENAME: test_hand_history.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for hand_history.py
+"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from Blackjack.card import Card
+from Blackjack.game import Game
+from Blackjack.hand import Hand
+from Blackjack.hand_history import (
+    HAND_RECORD,
+    MAX_CARDS,
+    HandHistoryWriter,
+    read_hand_history,
+    record_cards,
+)
+from Blackjack.move import Move
+from Blackjack.player import Player
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.result import Result
+from Blackjack.shoe import Shoe
+from Blackjack.suit import Suit
+from Blackjack.value import Value
+
+
+def make_hand(*cards: Card) -> Hand:
+    hand = Hand()
+    for card in cards:
+        hand.add_card(card)
+    return hand
+
+
+class TestHandHistory:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.path = tmp_path / "hands.bjh"
+        self.player_cards = (Card(Suit.HEARTS, Value.ACE), Card(Suit.SPADES, Value.FIVE), Card(Suit.CLUBS, Value.KING))
+        self.dealer_cards = (Card(Suit.DIAMONDS, Value.TEN), Card(Suit.CLUBS, Value.SEVEN))
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def write_one(self, writer: HandHistoryWriter) -> None:
+        writer.record(
+            make_hand(*self.player_cards),
+            make_hand(*self.dealer_cards),
+            [Move.HIT, Move.STAND],
+            Result.DEFEAT,
+            25,
+            -25,
+        )
+
+    def test_round_trip(self, class_setup, method_setup):
+        with HandHistoryWriter(self.path) as writer:
+            self.write_one(writer)
+        records = read_hand_history(self.path)
+        assert records.dtype == HAND_RECORD
+        assert len(records) == 1
+        record = records[0]
+        assert record_cards(record["player_ranks"], record["player_suits"]) == list(self.player_cards)
+        assert record_cards(record["dealer_ranks"], record["dealer_suits"], record["dealer_cards"]) == list(
+            self.dealer_cards
+        )
+        assert list(record["moves"][: record["move_count"]]) == [Move.HIT.value, Move.STAND.value]
+        assert (record["result"], record["bet"], record["net_change"]) == (Result.DEFEAT.value, 25, -25)
+
+    def test_reader_is_memory_mapped(self, class_setup, method_setup):
+        with HandHistoryWriter(self.path) as writer:
+            for _ in range(3):
+                self.write_one(writer)
+        records = read_hand_history(self.path)
+        assert isinstance(records, np.memmap)
+        assert not records.flags.writeable
+        assert records["net_change"].sum() == -75
+
+    def test_records_are_buffered(self, class_setup, method_setup):
+        writer = HandHistoryWriter(self.path, buffer_records=2)
+        self.write_one(writer)
+        assert len(read_hand_history(self.path)) == 0
+        self.write_one(writer)
+        assert len(read_hand_history(self.path)) == 2
+        self.write_one(writer)
+        writer.close()
+        assert len(read_hand_history(self.path)) == 3
+
+    def test_append_and_partial_record(self, class_setup, method_setup):
+        with HandHistoryWriter(self.path) as writer:
+            self.write_one(writer)
+        with open(self.path, "ab") as file:
+            file.write(b"\x01" * 10)
+        assert len(read_hand_history(self.path)) == 1
+        with HandHistoryWriter(self.path) as writer:
+            self.write_one(writer)
+        records = read_hand_history(self.path)
+        assert len(records) == 2
+        assert records[1]["bet"] == 25
+
+    def test_not_a_history(self, class_setup, method_setup):
+        self.path.write_bytes(b"{}" * 20)
+        with pytest.raises(ValueError):
+            read_hand_history(self.path)
+        with pytest.raises(ValueError):
+            HandHistoryWriter(self.path)
+
+    def test_hand_too_large(self, class_setup, method_setup):
+        ace = Card(Suit.SPADES, Value.ACE)
+        with HandHistoryWriter(self.path) as writer:
+            with pytest.raises(ValueError):
+                writer.record(
+                    make_hand(*[ace] * (MAX_CARDS + 1)), make_hand(*self.dealer_cards), [], Result.PUSH, 1, 0
+                )
+        assert len(read_hand_history(self.path)) == 0
+
+    def test_game_records_every_hand(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Historian", 1000)
+        with HandHistoryWriter(self.path) as writer:
+            game = Game(player, deck=Shoe(rng=random.Random(3)), policy=DealerMimicPolicy(), history=writer)
+            outcomes = [game.new_hand() for _ in range(200)]
+        records = read_hand_history(self.path)
+        assert len(records) == 200
+        assert list(records["result"]) == [result.value for result, _ in outcomes]
+        assert list(records["net_change"]) == [net_change for _, net_change in outcomes]
+        for record in records:
+            hand = make_hand(*record_cards(record["player_ranks"], record["player_suits"]))
+            moves = [Move(move) for move in record["moves"][: record["move_count"]]]
+            assert hand.get_size() == record["player_cards"]
+            assert len(moves) >= 1
+            assert hand.get_size() == 2 + sum(move != Move.STAND for move in moves)
+
+    def test_game_does_not_need_numpy(self, class_setup, method_setup):
+        # NumPy is hidden from a fresh interpreter, which must still be able to play
+        code = "import sys; sys.modules['numpy'] = None; import Blackjack.game, Blackjack.table, Blackjack.main_menu"
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
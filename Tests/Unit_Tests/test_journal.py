@@ -0,0 +1,136 @@
+"""
+FILENAME: test_journal.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for journal.py, and for replaying a journal into a Player
+"""
+
+import pytest
+
+from Blackjack.journal import HandJournal, HandRecord
+from Blackjack.player import Player
+from Blackjack.result import Result
+
+
+class TestJournal:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.path = tmp_path / "alice.journal"
+        self.hands = [(Result.VICTORY, 10), (Result.DEFEAT, -20), (Result.PUSH, 0), (Result.VICTORY, 5)]
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def play(self, player):
+        for result, net_change in self.hands:
+            player.bet = abs(net_change) or 10
+            player.update_stats((result, net_change))
+
+    def test_each_hand_is_one_line(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path) as journal:
+            player.attach_journal(journal)
+            self.play(player)
+        lines = self.path.read_text().splitlines()
+        assert len(lines) == len(self.hands)
+        assert HandJournal(self.path).read()[1][1] == HandRecord(Result.DEFEAT, 20, -20)
+
+    def test_replay_rebuilds_stats(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path) as journal:
+            player.attach_journal(journal)
+            self.play(player)
+        replayed = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path) as journal:
+            replayed.attach_journal(journal)
+        assert replayed == player
+        assert replayed.bankroll == 95
+
+    def test_snapshot_compacts(self, class_setup, method_setup):
+        saved = []
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path, snapshot_every=3, on_snapshot=saved.append) as journal:
+            player.attach_journal(journal)
+            self.play(player)
+            assert journal.pending == 1
+        assert len(self.path.read_text().splitlines()) == 2
+        assert saved[0]["losses"] == 1
+        # The snapshot replaces the starting stats, however stale they are
+        replayed = Player.from_name_bankroll("Alice", 1)
+        with HandJournal(self.path) as journal:
+            replayed.attach_journal(journal)
+        assert replayed == player
+
+    def test_records_are_handed_over(self, class_setup, method_setup):
+        handed = []
+
+        def save(records):
+            handed.append(records)
+            return True
+
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path, snapshot_every=3, on_records=save) as journal:
+            player.attach_journal(journal)
+            self.play(player)
+            assert [len(records) for records in handed] == [3]
+            assert handed[0][1] == HandRecord(Result.DEFEAT, 20, -20)
+            # Only the hand after the snapshot is left in the file
+            assert len(self.path.read_text().splitlines()) == 1
+            assert journal.read()[0] is None
+        assert self.path.exists()
+
+    def test_unsaved_records_are_kept(self, class_setup, method_setup):
+        handed = []
+
+        def save(records):
+            handed.append(records)
+            return False
+
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path, snapshot_every=2, on_records=save) as journal:
+            player.attach_journal(journal)
+            self.play(player)
+            # The first two hands were not saved, so they are handed over again with the next two
+            assert [len(records) for records in handed] == [2, 4]
+            assert journal.pending == 0
+        assert len(self.path.read_text().splitlines()) == len(self.hands)
+
+    def test_empty_journal_is_removed(self, class_setup, method_setup):
+        with HandJournal(self.path, on_records=lambda records: True) as journal:
+            journal.record(Result.PUSH, 10, 0, {})
+            journal.snapshot({})
+        assert not self.path.exists()
+        HandJournal(self.path).close()
+        assert not self.path.exists()
+
+    def test_partial_last_line_is_dropped(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path) as journal:
+            player.attach_journal(journal)
+            self.play(player)
+        with open(self.path, "a") as file:
+            file.write('{"result": "VIC')
+        with HandJournal(self.path) as journal:
+            assert len(journal.read()[1]) == len(self.hands)
+            journal.record(Result.PUSH, 10, 0, player.stats)
+        with HandJournal(self.path) as journal:
+            assert journal.read()[1][-1] == HandRecord(Result.PUSH, 10, 0)
+
+    def test_rejected_result_is_not_recorded(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 100)
+        with HandJournal(self.path) as journal:
+            player.attach_journal(journal)
+            assert not player.update_stats((Result.VICTORY, -10))
+            assert journal.pending == 0
+
+    def test_invalid_snapshot_every(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            HandJournal(self.path, snapshot_every=0)
@@ -0,0 +1,96 @@
+"""
+FILENAME: test_leaderboard.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for leaderboard.py
+"""
+
+import random
+
+import pytest
+
+from Blackjack.leaderboard import Leaderboard
+from Blackjack.player import Player
+from Blackjack.player_store import SQLitePlayerStore
+from Blackjack.result import Result
+
+
+class TestLeaderboard:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.leaderboard = Leaderboard()
+        for name, bankroll in (("Alice", 300), ("Bob", 500), ("Carol", 300), ("Dave", 100)):
+            self.leaderboard.update(Player.from_name_bankroll(name, bankroll).stats)
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_top(self, class_setup, method_setup):
+        assert self.leaderboard.top(3) == [("Bob", 500), ("Alice", 300), ("Carol", 300)]
+        assert self.leaderboard.top(10)[-1] == ("Dave", 100)
+        assert self.leaderboard.top(0) == []
+
+    def test_ties_share_a_rank(self, class_setup, method_setup):
+        ranks = [self.leaderboard.rank(name) for name in ("Bob", "alice", "CAROL", "Dave")]
+        assert ranks == [1, 2, 2, 4]
+
+    def test_update_moves_a_player(self, class_setup, method_setup):
+        self.leaderboard.update(Player.from_name_bankroll("Dave", 1000).stats)
+        assert len(self.leaderboard) == 4
+        assert self.leaderboard.rank("Dave") == 1
+        assert self.leaderboard.score("Dave") == 1000
+        assert self.leaderboard.rank("Bob") == 2
+
+    def test_remove(self, class_setup, method_setup):
+        self.leaderboard.remove("bob")
+        assert "Bob" not in self.leaderboard
+        assert self.leaderboard.rank("Alice") == 1
+        with pytest.raises(KeyError):
+            self.leaderboard.rank("Bob")
+
+    def test_player_update_stats_moves_them(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Eve", 200)
+        player.attach_leaderboard(self.leaderboard)
+        assert self.leaderboard.rank("Eve") == 4
+        player.bet = 250
+        player.update_stats((Result.VICTORY, 250))
+        assert self.leaderboard.rank("Eve") == 2
+        assert self.leaderboard.score("Eve") == player.bankroll
+
+    def test_win_rate(self, class_setup, method_setup):
+        leaderboard = Leaderboard("win_rate")
+        for name, wins, losses in (("Alice", 3, 1), ("Bob", 1, 1), ("Carol", 0, 0)):
+            stats = Player.from_name_bankroll(name, 100).stats.to_dict() | {"wins": wins, "losses": losses}
+            leaderboard.update(stats)
+        assert leaderboard.top(3) == [("Alice", 0.75), ("Bob", 0.5), ("Carol", 0.0)]
+
+    def test_rebuild_matches_incremental(self, class_setup, method_setup):
+        rng = random.Random(7)
+        players = [Player.from_name_bankroll(f"Player {index}", rng.randrange(1000)) for index in range(200)]
+        incremental = Leaderboard()
+        for player in players:
+            incremental.update(player.stats)
+        for player in rng.sample(players, 50):
+            player.bankroll = rng.randrange(1000)
+            incremental.update(player.stats)
+        with SQLitePlayerStore(":memory:") as store:
+            store.save_many(players)
+            rebuilt = Leaderboard()
+            rebuilt.rebuild(player.stats for player in store.players())
+        assert rebuilt.top(200) == incremental.top(200)
+        expected = sorted(players, key=lambda player: -player.bankroll)
+        assert [score for _, score in rebuilt.top(200)] == [player.bankroll for player in expected]
+
+    def test_bad_arguments(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            Leaderboard("losses")
+        with pytest.raises(ValueError):
+            self.leaderboard.top(-1)
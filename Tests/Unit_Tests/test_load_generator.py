@@ -0,0 +1,98 @@
+"""
+FILENAME: test_load_generator.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for load_generator.py. Bots play against a server in the test's own event loop, and run_load is tried once
+against a server process of its own
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from Blackjack.load_generator import LoadReport, generate_load, percentile, resource, run_load
+from Blackjack.player_store import SQLitePlayerStore
+from Blackjack.server import GameServer
+from Blackjack.shoe import Shoe
+
+
+class TestLoadGenerator:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.store = SQLitePlayerStore(tmp_path / "players.db")
+        self.server = GameServer(self.store, shoe_factory=lambda: Shoe(rng=random.Random(5)))
+        yield
+        self.store.close()
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def load(self, clients: int, hands: int, think_time: float = 0.0) -> LoadReport:
+        async def run() -> LoadReport:
+            listener = await self.server.start("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                return await generate_load(
+                    "127.0.0.1", port, clients, hands, think_time, ramp_up=0.05, rng=random.Random(1)
+                )
+
+        return asyncio.run(run())
+
+    def test_percentile(self, class_setup, method_setup):
+        values = [5.0, 1.0, 4.0, 2.0, 3.0]
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 95) == 5.0
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 20) == 1.0
+        with pytest.raises(ValueError):
+            percentile([], 50)
+        with pytest.raises(ValueError):
+            percentile(values, 101)
+
+    def test_report(self, class_setup, method_setup):
+        report = LoadReport(4, 200, 2.0, [0.001, 0.002, 0.003, 0.004], 0.5)
+        assert report.hands_per_second == 100
+        assert report.cpu_per_hand == 0.0025
+        assert report.round_trip(50) == 0.002
+        assert "100.0 hands/s" in str(report)
+        assert "p99 4.00ms" in str(report)
+        unmeasured = LoadReport(1, 10, 1.0, [], None)
+        assert unmeasured.cpu_per_hand is None
+        assert "not measured" in str(unmeasured)
+
+    def test_bots_play_every_hand(self, class_setup, method_setup):
+        report = self.load(clients=20, hands=5)
+        assert report.hands == 100
+        # Every hand has a bet and at least one move
+        assert len(report.round_trips) >= 200
+        assert report.cpu_seconds is None
+        players = list(self.store.players())
+        assert len(players) == 20
+        for player in players:
+            assert player.stats["wins"] + player.stats["losses"] + player.stats["pushes"] == 5
+        assert self.server.connections == 0
+
+    def test_think_time(self, class_setup, method_setup):
+        report = self.load(clients=3, hands=2, think_time=0.01)
+        assert report.hands == 6
+        assert report.seconds > 0.01
+
+    def test_bad_arguments(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            asyncio.run(generate_load("127.0.0.1", 1, 0, 5))
+        with pytest.raises(ValueError):
+            asyncio.run(generate_load("127.0.0.1", 1, 5, 5, think_time=-1))
+
+    def test_run_load_starts_a_server(self, class_setup, method_setup):
+        report = run_load(clients=4, hands=3, rng=random.Random(2))
+        assert report.hands == 12
+        if resource is not None:
+            assert report.cpu_seconds is not None and report.cpu_seconds >= 0
@@ -12,7 +12,10 @@ import pytest
 
 import Blackjack
 import Blackjack.main_menu
-from Blackjack.player import Player
+from Blackjack.main_menu import open_journal
+from Blackjack.player import Player, save_player
+from Blackjack.player_store import SQLitePlayerStore
+from Blackjack.result import Result
 
 
 class TestMenu:
@@ -33,10 +36,17 @@ class TestMenu:
         self.new_hand = mocker.patch(
             "Blackjack.game.Game.new_hand", return_value="mocked"
         )
-        self.save_player = mocker.patch("Blackjack.main_menu.save_player")
-
-        self.load_player = mocker.patch(
-            "Blackjack.main_menu.load_player", return_value=self.fake_player
+        self.store = mocker.MagicMock()
+        self.store.__enter__.return_value = self.store
+        self.store.__contains__.return_value = True
+        self.store.load.return_value = self.fake_player
+        self.open_store = mocker.patch(
+            "Blackjack.main_menu.open_store", return_value=self.store
+        )
+        self.journal = mocker.MagicMock()
+        self.journal.__enter__.return_value = self.journal
+        self.open_journal = mocker.patch(
+            "Blackjack.main_menu.open_journal", return_value=self.journal
         )
 
         yield
@@ -48,7 +58,10 @@ class TestMenu:
         Blackjack.main_menu.main_menu()
 
         assert self.new_hand.call_count == 1
-        assert self.save_player.call_count == 1
+        self.store.load.assert_called_once_with("Player 1")
+        self.fake_player.attach_journal.assert_called_once_with(self.journal)
+        self.fake_player.update_stats.assert_called_once_with("mocked")
+        self.store.save.assert_not_called()
 
     def test_player_creation(self, class_setup, method_setup):
         self.fake_input.side_effect = ["Player 1", "1000"]
@@ -56,6 +69,8 @@ class TestMenu:
         assert type(self.player) is Player
         assert self.player.name == "Player 1"
         assert self.player.bankroll == 1000
+        self.journal.snapshot.assert_called_once_with(self.player.stats)
+        self.store.save.assert_called_once_with(self.player)
         self.fake_print.reset_mock()
         assert self.fake_input.call_count == 2
         self.fake_input.reset_mock()
@@ -77,7 +92,6 @@ class TestMenu:
         assert new_player.bankroll == 1001
 
     def test_bad_input_player_creation(self, class_setup, method_setup):
-        path = Path("player 2.blackjack")
         self.fake_input.side_effect = ["Player 2", "Bad Input", "2000"]
         self.player = Blackjack.main_menu.new_player()
         assert type(self.player) is Player
@@ -85,4 +99,64 @@ class TestMenu:
         assert self.player.name == "Player 2"
         assert self.player.bankroll == 2000
         assert self.fake_input.call_count == 3
-        Path.unlink(path, missing_ok=True)
+
+    def test_show_stats(self, class_setup, method_setup):
+        self.fake_input.side_effect = ["Player 1"]
+        Blackjack.main_menu.show_stats()
+        self.fake_print.assert_called_once_with(self.fake_player.stats)
+
+    def test_legacy_file_is_imported(self, class_setup, method_setup, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        save_player(Player.from_name_bankroll("Player 3", 300), Path("player 3.blackjack"))
+        self.store.__contains__.return_value = False
+        self.fake_input.side_effect = ["Player 3"]
+        Blackjack.main_menu.show_stats()
+        self.store.import_json.assert_called_once_with(Path("player 3.blackjack"))
+        self.store.load.assert_not_called()
+
+    def test_legacy_lower_case_file_is_imported(self, class_setup, method_setup, tmp_path, monkeypatch):
+        # Older versions named the file with name.lower(), which keeps the spaces the normalized name collapses
+        monkeypatch.chdir(tmp_path)
+        save_player(Player.from_name_bankroll("Player  5", 500), Path("player  5.blackjack"))
+        self.store.__contains__.return_value = False
+        self.fake_input.side_effect = ["Player  5"]
+        Blackjack.main_menu.show_stats()
+        self.store.import_json.assert_called_once_with(Path("player  5.blackjack"))
+
+    def test_journal_snapshot_keeps_other_updates(self, class_setup, method_setup, tmp_path, monkeypatch):
+        monkeypatch.setattr(Blackjack.main_menu, "JOURNAL_DIRECTORY", tmp_path / "journals")
+        with SQLitePlayerStore(tmp_path / "players.db") as store:
+            store.save(Player.from_name_bankroll("Player 4", 100))
+            player = store.load("Player 4")
+            with open_journal(store, "Player 4") as journal:
+                journal.snapshot_every = 2
+                player.attach_journal(journal)
+                player.bet = 10
+                player.update_stats((Result.VICTORY, 10))
+                # Another writer saves a hand to the store while the player is playing
+                store.apply_result("Player 4", (Result.PUSH, 0))
+                player.bet = 10
+                player.update_stats((Result.DEFEAT, -10))
+            stored = store.load("Player 4")
+        assert (stored.stats["wins"], stored.stats["losses"], stored.stats["pushes"]) == (1, 1, 1)
+        assert stored.bankroll == 100
+        assert list((tmp_path / "journals").iterdir()) == []
+
+    def test_journal_kept_when_store_cannot_cover_a_hand(self, class_setup, method_setup, tmp_path, monkeypatch):
+        monkeypatch.setattr(Blackjack.main_menu, "JOURNAL_DIRECTORY", tmp_path / "journals")
+        with SQLitePlayerStore(tmp_path / "players.db") as store:
+            store.save(Player.from_name_bankroll("Player 6", 100))
+            player = store.load("Player 6")
+            with open_journal(store, "Player 6") as journal:
+                journal.snapshot_every = 2
+                player.attach_journal(journal)
+                # The stored bankroll drops below the menu's loss before the journal is replayed onto it
+                store.apply_result("Player 6", (Result.DEFEAT, -50))
+                player.bet = 80
+                player.update_stats((Result.DEFEAT, -80))
+                player.bet = 10
+                player.update_stats((Result.PUSH, 0))
+            stored = store.load("Player 6")
+        assert (stored.bankroll, stored.stats["losses"], stored.stats["pushes"]) == (50, 1, 0)
+        # Neither hand is lost: both are still in the journal
+        assert len((tmp_path / "journals" / "player 6.journal").read_text().splitlines()) == 2
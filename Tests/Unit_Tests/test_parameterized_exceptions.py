@@ -346,8 +346,9 @@ class TestExceptionHandling:
         mock_open = mocker.mock_open()
         mock_open.side_effect = PermissionError("Access denied")
 
+        # save_player writes through a temporary file beside the target
         with mocker.patch(
-            "builtins.open", side_effect=PermissionError("Access denied")
+            "tempfile.NamedTemporaryFile", side_effect=PermissionError("Access denied")
         ):
             with pytest.raises(PermissionError, match="Access denied"):
                 save_player(player, test_path)
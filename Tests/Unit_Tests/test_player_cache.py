@@ -0,0 +1,95 @@
+"""
+FILENAME: test_player_cache.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for player_cache.py
+"""
+
+import json
+import os
+
+import pytest
+
+from Blackjack.player import Player, save_player
+from Blackjack.player_cache import PlayerCache
+
+
+class TestPlayerCache:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.tmp_path = tmp_path
+        self.cache = PlayerCache(capacity=2)
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def save(self, name: str, bankroll: int):
+        path = self.tmp_path / f"{name}.blackjack"
+        save_player(Player.from_name_bankroll(name, bankroll), path)
+        return path
+
+    def test_second_load_is_a_hit(self, class_setup, method_setup, mocker):
+        path = self.save("Alice", 500)
+        assert self.cache.load(path).bankroll == 500
+        spy = mocker.spy(json, "load")
+        assert self.cache.load(path).bankroll == 500
+        spy.assert_not_called()
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_loaded_players_do_not_share_stats(self, class_setup, method_setup):
+        path = self.save("Alice", 500)
+        first = self.cache.load(path)
+        first.bankroll = 0
+        assert self.cache.load(path).bankroll == 500
+
+    def test_external_edit_is_picked_up(self, class_setup, method_setup):
+        path = self.save("Alice", 500)
+        self.cache.load(path)
+        with open(path, "w") as file:
+            json.dump({"name": "Alice", "bankroll": 12345}, file)
+        status = os.stat(path)
+        os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+        assert self.cache.load(path).bankroll == 12345
+        assert self.cache.misses == 2
+
+    def test_invalidate(self, class_setup, method_setup):
+        path = self.save("Alice", 500)
+        self.cache.load(path)
+        self.cache.invalidate(path)
+        assert path not in self.cache
+        self.cache.load(path)
+        assert self.cache.misses == 2
+
+    def test_least_recently_loaded_is_evicted(self, class_setup, method_setup):
+        alice, bob, carol = self.save("Alice", 1), self.save("Bob", 2), self.save("Carol", 3)
+        self.cache.load(alice)
+        self.cache.load(bob)
+        self.cache.load(alice)
+        self.cache.load(carol)
+        assert len(self.cache) == 2
+        assert alice in self.cache
+        assert bob not in self.cache
+
+    def test_missing_file(self, class_setup, method_setup):
+        with pytest.raises(FileNotFoundError):
+            self.cache.load(self.tmp_path / "missing.blackjack")
+
+    def test_clear_keeps_counts(self, class_setup, method_setup):
+        path = self.save("Alice", 500)
+        self.cache.load(path)
+        self.cache.load(path)
+        self.cache.clear()
+        assert len(self.cache) == 0
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_bad_capacity(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            PlayerCache(capacity=0)
@@ -0,0 +1,84 @@
+"""
+FILENAME: test_player_stats.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for player_stats.py
+"""
+
+import json
+
+import pytest
+
+from Blackjack.player import Player, load_player, save_player
+from Blackjack.player_stats import PlayerStats
+from Blackjack.result import Result
+
+
+class TestPlayerStats:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.stats = PlayerStats("Alice", 500, wins=3)
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_has_no_dictionary(self, class_setup, method_setup):
+        assert not hasattr(self.stats, "__dict__")
+
+    def test_reads_as_a_dictionary(self, class_setup, method_setup):
+        assert self.stats == {"name": "Alice", "bankroll": 500, "wins": 3, "losses": 0, "pushes": 0}
+        assert self.stats["wins"] == self.stats.wins == 3
+        assert self.stats.get("losses") == 0
+        assert self.stats.get("missing", 7) == 7
+        assert list(self.stats) == ["name", "bankroll", "wins", "losses", "pushes"]
+        assert len(self.stats) == 5
+
+    def test_writes_as_a_dictionary(self, class_setup, method_setup):
+        self.stats["bankroll"] = 250
+        self.stats.update({"pushes": 4})
+        assert (self.stats.bankroll, self.stats.pushes) == (250, 4)
+
+    def test_extra_keys_are_kept(self, class_setup, method_setup):
+        self.stats["nickname"] = "Ace"
+        assert self.stats["nickname"] == "Ace"
+        assert "nickname" in self.stats
+        assert self.stats.to_dict()["nickname"] == "Ace"
+        del self.stats["nickname"]
+        assert "nickname" not in self.stats
+
+    def test_missing_stats(self, class_setup, method_setup):
+        stats = PlayerStats.from_dict({"name": "Bob"})
+        assert stats == {"name": "Bob"}
+        assert "bankroll" not in stats
+        with pytest.raises(KeyError):
+            _ = stats["bankroll"]
+        with pytest.raises(KeyError):
+            del stats["wins"]
+
+    def test_file_round_trip(self, class_setup, method_setup, tmp_path):
+        path = tmp_path / "alice.blackjack"
+        save_player(Player(self.stats), path)
+        with open(path) as file:
+            assert json.load(file) == {"name": "Alice", "bankroll": 500, "wins": 3, "losses": 0, "pushes": 0}
+        loaded = load_player(path)
+        assert isinstance(loaded.stats, PlayerStats)
+        assert loaded.stats == self.stats
+
+    def test_player_stats_assigned_a_dictionary(self, class_setup, method_setup):
+        player = Player(self.stats)
+        assert player.stats is self.stats
+        player.stats = {"name": "Alice", "bankroll": 10}
+        assert isinstance(player.stats, PlayerStats)
+        player.bet = 10
+        player.update_stats((Result.PUSH, 0))
+        assert player.stats == {"name": "Alice", "bankroll": 10, "pushes": 1}
+        player.update_stats((Result.DEFEAT, -10))
+        assert (player.bankroll, player.stats["losses"]) == (0, 1)
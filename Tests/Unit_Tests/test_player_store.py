@@ -0,0 +1,186 @@
+"""
+FILENAME: test_player_store.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for player_store.py, run against every store
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from Blackjack.player import Player, load_player, save_player
+from Blackjack.player_cache import PlayerCache
+from Blackjack.player_store import JsonPlayerStore, SQLitePlayerStore, UpdateConflictError, normalize_name
+from Blackjack.result import Result
+from Blackjack.sharded_store import ShardedPlayerStore
+
+
+class TestPlayerStore:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture(params=["json", "cached json", "sharded", "sqlite"])
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.tmp_path = tmp_path
+        if request.param == "json":
+            self.open_store = lambda: JsonPlayerStore(tmp_path)
+        elif request.param == "sharded":
+            self.open_store = lambda: ShardedPlayerStore(tmp_path / "sharded")
+        elif request.param == "cached json":
+            self.open_store = lambda: JsonPlayerStore(tmp_path, cache=PlayerCache())
+        else:
+            self.open_store = lambda: SQLitePlayerStore(tmp_path / "players.db")
+        self.store = self.open_store()
+        yield
+        self.store.close()
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_save_and_load(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 500)
+        player.stats["wins"] = 3
+        self.store.save(player)
+        assert self.store.load("Alice") == player
+
+    def test_names_are_normalized(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 500))
+        assert "  ALICE " in self.store
+        assert self.store.load("alice").name == "Alice"
+        assert "Bob" not in self.store
+
+    def test_missing_player_raises_key_error(self, class_setup, method_setup):
+        with pytest.raises(KeyError):
+            self.store.load("Nobody")
+
+    def test_save_replaces_stats(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 500)
+        self.store.save(player)
+        player.bankroll = 650
+        self.store.save(player)
+        assert self.store.load("Alice").bankroll == 650
+        assert self.store.names() == ["Alice"]
+
+    def test_save_many(self, class_setup, method_setup):
+        players = [Player.from_name_bankroll(name, 100) for name in ("Carol", "alice", "Bob")]
+        self.store.save_many(players)
+        assert self.store.names() == ["alice", "Bob", "Carol"]
+
+    def test_json_import_and_export(self, class_setup, method_setup):
+        source = self.tmp_path / "import.json"
+        save_player(Player.from_name_bankroll("Dave", 250), source)
+        self.store.import_json(source)
+        target = self.tmp_path / "export.json"
+        self.store.export_json("dave", target)
+        assert load_player(target) == load_player(source)
+
+    @pytest.mark.parametrize("name", ["", "   "])
+    def test_blank_name(self, name, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            self.store.save(Player.from_name_bankroll(name, 100))
+
+    def test_apply_result(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 500))
+        player = self.store.apply_result("alice", (Result.VICTORY, 50))
+        assert player.bankroll == 550
+        assert self.store.load("Alice").stats["wins"] == 1
+        with pytest.raises(KeyError):
+            self.store.apply_result("Nobody", (Result.PUSH, 0))
+        # A name with no player leaves no lock file behind
+        assert not list(self.tmp_path.rglob(".nobody*"))
+
+    def test_concurrent_updates_are_all_kept(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 1000))
+        errors = []
+
+        def play_hands():
+            try:
+                store = self.open_store()
+                for _ in range(25):
+                    store.apply_result("Alice", (Result.VICTORY, 2))
+                    store.apply_result("Alice", (Result.DEFEAT, -1))
+                store.close()
+            except Exception as error:
+                errors.append(error)
+
+        tables = [threading.Thread(target=play_hands) for _ in range(4)]
+        for table in tables:
+            table.start()
+        for table in tables:
+            table.join()
+        assert errors == []
+        player = self.store.load("Alice")
+        assert (player.bankroll, player.stats["wins"], player.stats["losses"]) == (1100, 100, 100)
+
+
+class TestSQLitePlayerStore:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.path = tmp_path / "players.db"
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_database_is_in_wal_mode(self, class_setup, method_setup):
+        with SQLitePlayerStore(self.path) as store:
+            assert store._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_players_persist(self, class_setup, method_setup):
+        with SQLitePlayerStore(self.path) as store:
+            store.save_many(Player.from_name_bankroll(f"Player {index}", 100 + index) for index in range(1000))
+        with SQLitePlayerStore(self.path) as store:
+            assert len(store) == 1000
+            assert store.load("player 999").bankroll == 1099
+
+    def test_normalize_name(self, class_setup, method_setup):
+        assert normalize_name("  Mary   Ann ") == "mary ann"
+        assert normalize_name("STRASSE") == normalize_name("straße")
+
+    def test_update_retries_on_conflict(self, class_setup, method_setup):
+        with SQLitePlayerStore(self.path) as store, SQLitePlayerStore(self.path) as other:
+            store.save(Player.from_name_bankroll("Alice", 500))
+            attempts = []
+
+            def change(player):
+                attempts.append(player.bankroll)
+                if len(attempts) == 1:
+                    other.apply_result("Alice", (Result.VICTORY, 100))
+                player.update_stats((Result.DEFEAT, -50))
+
+            assert store.update("Alice", change).bankroll == 550
+            assert attempts == [500, 600]
+            assert store.version("Alice") == 2
+
+    def test_update_gives_up(self, class_setup, method_setup):
+        with SQLitePlayerStore(self.path, retries=2) as store, SQLitePlayerStore(self.path) as other:
+            store.save(Player.from_name_bankroll("Alice", 500))
+            with pytest.raises(UpdateConflictError):
+                store.update("Alice", lambda player: other.apply_result("Alice", (Result.PUSH, 0)))
+            assert other.load("Alice").stats["pushes"] == 2
+
+    def test_unversioned_database_is_upgraded(self, class_setup, method_setup):
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE players (normalized_name TEXT PRIMARY KEY, name TEXT NOT NULL, bankroll INTEGER NOT NULL, "
+            "wins INTEGER NOT NULL DEFAULT 0, losses INTEGER NOT NULL DEFAULT 0, pushes INTEGER NOT NULL DEFAULT 0) "
+            "WITHOUT ROWID"
+        )
+        connection.execute("INSERT INTO players (normalized_name, name, bankroll) VALUES ('alice', 'Alice', 5)")
+        connection.commit()
+        connection.close()
+        with SQLitePlayerStore(self.path) as store:
+            assert store.version("Alice") == 0
+            assert store.apply_result("Alice", (Result.VICTORY, 5)).bankroll == 10
+            assert store.version("Alice") == 1
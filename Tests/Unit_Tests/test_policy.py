@@ -0,0 +1,104 @@
+"""
+FILENAME: test_policy.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for policy.py, headless play through Game, and simulation.py
+"""
+
+import collections
+
+import pytest
+
+from Blackjack import card, hand
+from Blackjack.game import Game
+from Blackjack.move import Move
+from Blackjack.player import Player
+from Blackjack.policy import DealerMimicPolicy, Policy
+from Blackjack.result import Result
+from Blackjack.simulation import simulate
+from Blackjack.suit import Suit
+from Blackjack.value import Value
+
+
+class AlwaysDoublePolicy(Policy):
+    def bet(self, bankroll: int) -> int:
+        return 10
+
+    def decide(self, player_hand, dealer_upcard, can_double) -> Move:
+        return Move.DOUBLE_DOWN
+
+
+class TestPolicy:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, mocker):
+        print(f"Setting up method: {request.function.__name__}")
+        self.fake_input = mocker.patch("builtins.input")
+        self.fake_print = mocker.patch("builtins.print")
+        self.player = Player.from_name_bankroll("Bot", 100)
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_dealer_mimic_decisions(self, class_setup, method_setup):
+        policy = DealerMimicPolicy()
+        my_hand = hand.Hand()
+        my_hand.add_card(card.Card(Suit.SPADES, Value.TEN))
+        my_hand.add_card(card.Card(Suit.HEARTS, Value.SIX))
+        assert policy.decide(my_hand, None, True) == Move.HIT
+        my_hand.add_card(card.Card(Suit.CLUBS, Value.ACE))
+        assert policy.decide(my_hand, None, True) == Move.STAND
+
+    def test_dealer_mimic_bet_capped_by_bankroll(self, class_setup, method_setup):
+        assert DealerMimicPolicy(500).bet(100) == 100
+        assert DealerMimicPolicy(5).bet(100) == 5
+
+    def test_dealer_mimic_invalid_bet_size(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            DealerMimicPolicy(0)
+
+    def test_policy_ante(self, class_setup, method_setup):
+        self.player.policy = DealerMimicPolicy(25)
+        self.player.ante()
+        assert self.player.bet == 25
+        assert self.fake_input.call_count == 0
+
+    def test_policy_double_down_falls_back_to_hit(self, class_setup, method_setup):
+        self.player.policy = AlwaysDoublePolicy()
+        self.player.hand = hand.Hand()
+        self.player.bet = 51
+        deck = collections.deque([card.Card(Suit.CLUBS, Value.TWO)])
+        assert self.player.take_turn(deck) == Move.HIT
+        assert self.player.bet == 51
+        assert len(deck) == 0
+
+    def test_policy_double_down(self, class_setup, method_setup):
+        self.player.policy = AlwaysDoublePolicy()
+        self.player.hand = hand.Hand()
+        self.player.bet = 50
+        deck = collections.deque([card.Card(Suit.CLUBS, Value.TWO)])
+        assert self.player.take_turn(deck) == Move.DOUBLE_DOWN
+        assert self.player.bet == 100
+
+    def test_headless_game_has_no_console_io(self, class_setup, method_setup):
+        game = Game(self.player, policy=DealerMimicPolicy(10))
+        result, net_change = game.new_hand()
+        assert result in Result
+        assert net_change in (-10, 0, 10)
+        assert self.fake_input.call_count == 0
+        assert self.fake_print.call_count == 0
+
+    def test_simulate_tallies_every_hand(self, class_setup, method_setup):
+        tally = simulate(DealerMimicPolicy(), 500)
+        assert tally.hands == 500
+        assert sum(tally.counts.values()) == 500
+        assert -1.0 <= tally.mean <= 1.0
+        assert tally.variance > 0
+        assert self.fake_input.call_count == 0
+        assert self.fake_print.call_count == 0
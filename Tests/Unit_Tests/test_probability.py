@@ -0,0 +1,106 @@
+"""
+FILENAME: test_probability.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for probability.py dealer outcome tables
+"""
+
+import pytest
+
+from Blackjack import card, probability
+from Blackjack.probability import (
+    BUST,
+    NATURAL,
+    composition_key,
+    composition_of,
+    dealer_key_outcomes,
+    dealer_outcomes,
+    dealer_probabilities,
+    dealer_table,
+    key_composition,
+    key_draw_probabilities,
+    remove_key_rank,
+    remove_rank,
+    shoe_composition,
+)
+from Blackjack.suit import Suit
+from Blackjack.value import Value
+
+
+class TestProbability:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    @pytest.mark.parametrize("composition", [None, shoe_composition(1), shoe_composition(6)])
+    def test_tables_sum_to_one(self, composition, class_setup, method_setup):
+        for upcard, table in dealer_table(composition).items():
+            assert sum(table) == pytest.approx(1.0)
+            assert all(outcome >= 0 for outcome in table)
+
+    def test_infinite_deck_known_values(self, class_setup, method_setup):
+        assert dealer_probabilities(6)[BUST] == pytest.approx(0.4232, abs=1e-4)
+        assert dealer_probabilities(1)[NATURAL] == pytest.approx(4 / 13)
+        assert dealer_probabilities(10)[NATURAL] == pytest.approx(1 / 13)
+        assert dealer_probabilities(5)[NATURAL] == 0
+
+    def test_finite_shoe_is_exact(self, class_setup, method_setup):
+        # Only a seven and two tens left: the hole card is a ten two times in three
+        composition = (0, 0, 0, 0, 0, 0, 1, 0, 0, 2)
+        table = dealer_probabilities(10, composition)
+        assert table[3] == pytest.approx(2 / 3)  # 20 with the hole ten
+        assert table[0] == pytest.approx(1 / 3)  # 17 with the hole seven
+
+    def test_dealer_table_skips_missing_upcards(self, class_setup, method_setup):
+        composition = (0, 0, 0, 0, 0, 0, 1, 0, 0, 2)
+        assert set(dealer_table(composition)) == {7, 10}
+
+    def test_composition_of_cards(self, class_setup, method_setup):
+        assert composition_of(card.DECK) == shoe_composition(1)
+        cards = [card.Card(Suit.SPADES, Value.ACE), card.Card(Suit.HEARTS, Value.KING)]
+        assert composition_of(cards) == (1, 0, 0, 0, 0, 0, 0, 0, 0, 1)
+
+    def test_invalid_upcard(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            dealer_probabilities(11)
+
+    def test_repeated_queries_are_cached(self, class_setup, method_setup):
+        composition = shoe_composition(2)
+        dealer_probabilities(4, composition)
+        hits = probability.dealer_probabilities.cache_info().hits
+        dealer_probabilities(4, composition)
+        assert probability.dealer_probabilities.cache_info().hits == hits + 1
+
+    def test_composition_key_round_trip(self, class_setup, method_setup):
+        composition = shoe_composition(8)
+        key = composition_key(composition)
+        assert key_composition(key) == composition
+        assert key_composition(remove_key_rank(key, 10)) == remove_rank(composition, 10)
+        assert composition_key(None) is None
+
+    def test_replacement_key_does_not_change(self, class_setup, method_setup):
+        composition = (0, 0, 0, 0, 0, 0, 1, 0, 0, 2)
+        key = composition_key(composition, replacement=True)
+        assert key != composition_key(composition)
+        assert remove_key_rank(key, 10) == key
+        assert key_draw_probabilities(key) == pytest.approx((0, 0, 0, 0, 0, 0, 1 / 3, 0, 0, 2 / 3))
+
+    @pytest.mark.parametrize("composition", [(1, 2, 3), (0,) * 9 + (512,), (-1,) + (0,) * 9])
+    def test_invalid_composition_key(self, composition, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            composition_key(composition)
+
+    def test_outcomes_match_key_outcomes(self, class_setup, method_setup):
+        composition = shoe_composition(1)
+        assert dealer_outcomes(12, False, composition) == dealer_key_outcomes(12, False, composition_key(composition))
+        assert sum(dealer_outcomes(12, False, composition)) == pytest.approx(1)
@@ -0,0 +1,231 @@
+"""
+FILENAME: test_server.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for server.py. Each test runs its own event loop with asyncio.run, with the server on a free local port
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from Blackjack.player import Player
+from Blackjack.player_store import SQLitePlayerStore
+from Blackjack.server import PROTOCOL_VERSION, GameServer, _Session
+from Blackjack.shoe import Shoe
+
+
+class Client:
+    """
+    Client speaks the line protocol to a server, for the tests
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, line: str) -> None:
+        self.writer.write(f"{line}\n".encode())
+        await self.writer.drain()
+
+    async def receive(self) -> str:
+        return (await asyncio.wait_for(self.reader.readline(), 5)).decode().strip()
+
+    async def command(self, line: str) -> str:
+        await self.send(line)
+        return await self.receive()
+
+    async def play_hand(self, bet: int, move: str = "STAND") -> list[str]:
+        """
+        play_hand bets, makes the same move every turn, and returns every line up to and including the result
+        """
+        await self.send(f"BET {bet}")
+        lines = []
+        while True:
+            line = await self.receive()
+            lines.append(line)
+            if line.startswith("TURN"):
+                await self.send(move)
+            elif not line.startswith("HAND"):
+                return lines
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class TestGameServer:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.tmp_path = tmp_path
+        self.store = SQLitePlayerStore(tmp_path / "players.db")
+        self.server = GameServer(self.store, shoe_factory=lambda: Shoe(rng=random.Random(11)))
+        yield
+        self.store.close()
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def serve(self, test) -> None:
+        """
+        serve runs a test coroutine against the server on a free port. The test is given a function that connects a
+        new client
+        """
+
+        async def run():
+            listener = await self.server.start("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+
+            async def connect() -> Client:
+                client = Client(*await asyncio.open_connection("127.0.0.1", port))
+                assert await client.receive() == f"WELCOME blackjack {PROTOCOL_VERSION}"
+                return client
+
+            async with listener:
+                await test(connect)
+
+        asyncio.run(run())
+
+    def test_play_a_hand(self, class_setup, method_setup):
+        async def test(connect):
+            client = await connect()
+            assert await client.command("NEW 100 Alice") == "OK"
+            assert await client.command("SIT high rollers") == "OK"
+            lines = await client.play_hand(10)
+            assert lines[0].startswith("HAND ") and "??" in lines[0]
+            assert "??" not in lines[-2]
+            kind, result, net_change, bankroll = lines[-1].split()
+            assert kind == "RESULT"
+            assert result in ("VICTORY", "DEFEAT", "PUSH")
+            assert int(bankroll) == 100 + int(net_change)
+            stats = await client.command("STATS")
+            assert stats.startswith(f"STATS {bankroll} ")
+            assert await client.command("QUIT") == "OK"
+            await client.close()
+
+        self.serve(test)
+        player = self.store.load("alice")
+        assert player.stats["wins"] + player.stats["losses"] + player.stats["pushes"] == 1
+
+    def test_errors(self, class_setup, method_setup):
+        async def test(connect):
+            client = await connect()
+            assert (await client.command("DANCE")).startswith("ERR unknown command")
+            assert (await client.command("SIT table")).startswith("ERR")
+            assert (await client.command("PLAYER Nobody")).startswith("ERR no player")
+            assert await client.command("NEW 50 Bob") == "OK"
+            assert (await client.command("NEW 50 bob")).startswith("ERR")
+            assert (await client.command("BET 5")).startswith("ERR sit")
+            assert await client.command("SIT table") == "OK"
+            assert (await client.command("BET 500")).startswith("ERR bet must be between 1 and 50")
+            await client.send("BET 5")
+            line = await client.receive()
+            while not line.startswith("TURN"):
+                line = await client.receive()
+            assert (await client.command("SPLIT")).startswith("ERR expected")
+            assert (await client.receive()).startswith("TURN")
+            await client.close()
+
+        self.serve(test)
+
+    def test_table_is_taken(self, class_setup, method_setup):
+        self.store.save_many([Player.from_name_bankroll("Alice", 10), Player.from_name_bankroll("Bob", 10)])
+
+        async def test(connect):
+            alice, bob = await connect(), await connect()
+            assert await alice.command("PLAYER alice") == "OK"
+            assert await bob.command("PLAYER bob") == "OK"
+            assert await alice.command("SIT one") == "OK"
+            assert (await bob.command("SIT one")).startswith("ERR table one is taken")
+            assert await alice.command("LEAVE") == "OK"
+            assert await bob.command("SIT one") == "OK"
+            await alice.close()
+            await bob.close()
+
+        self.serve(test)
+
+    def test_many_tables_at_once(self, class_setup, method_setup):
+        async def play(connect, index):
+            client = await connect()
+            assert await client.command(f"NEW 1000 Player {index}") == "OK"
+            assert await client.command(f"SIT table {index}") == "OK"
+            for _ in range(3):
+                assert (await client.play_hand(5, "HIT" if index % 2 else "STAND"))[-1].startswith("RESULT")
+            await client.close()
+
+        async def test(connect):
+            await asyncio.gather(*(play(connect, index) for index in range(40)))
+
+        self.serve(test)
+        # Every table is closed once its player has gone
+        assert self.server.tables == {}
+        for player in self.store.players():
+            assert player.stats["wins"] + player.stats["losses"] + player.stats["pushes"] == 3
+
+    def test_disconnect_mid_hand_stands(self, class_setup, method_setup):
+        async def test(connect):
+            client = await connect()
+            assert await client.command("NEW 100 Carol") == "OK"
+            assert await client.command("SIT table") == "OK"
+            await client.send("BET 10")
+            while not (await client.receive()).startswith("TURN"):
+                pass
+            await client.close()
+            for _ in range(100):
+                if self.server.connections == 0:
+                    break
+                await asyncio.sleep(0.01)
+
+        self.serve(test)
+        stats = self.store.load("Carol").stats
+        assert stats["wins"] + stats["losses"] + stats["pushes"] == 1
+        assert "table" not in self.server.tables
+
+    def test_result_saved_before_it_is_sent(self, class_setup, method_setup, mocker):
+        send_hands = _Session._send_hands
+
+        async def disconnect_once_over(session, player_hand, dealer_hand):
+            # The hand is over once the player's hand is cleared, and the client is gone before it is shown
+            if session.player.hand is None:
+                raise ConnectionResetError("Connection reset by peer")
+            await send_hands(session, player_hand, dealer_hand)
+
+        mocker.patch.object(_Session, "_send_hands", disconnect_once_over)
+
+        async def test(connect):
+            client = await connect()
+            assert await client.command("NEW 100 Erin") == "OK"
+            assert await client.command("SIT table") == "OK"
+            await client.send("BET 10")
+            while not (await client.receive()).startswith("TURN"):
+                pass
+            await client.send("STAND")
+            assert await client.receive() == ""
+            await client.close()
+
+        self.serve(test)
+        stats = self.store.load("Erin").stats
+        assert stats["wins"] + stats["losses"] + stats["pushes"] == 1
+        assert self.server.tables == {}
+
+    def test_unix_socket(self, class_setup, method_setup):
+        path = self.tmp_path / "blackjack.sock"
+
+        async def run():
+            listener = await self.server.start_unix(path)
+            async with listener:
+                client = Client(*await asyncio.open_unix_connection(path))
+                assert (await client.receive()).startswith("WELCOME")
+                assert await client.command("NEW 20 Dave") == "OK"
+                assert await client.command("STATS") == "STATS 20 0 0 0"
+                await client.close()
+
+        asyncio.run(run())
@@ -0,0 +1,89 @@
+"""
+FILENAME: test_sharded_store.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for sharded_store.py
+"""
+
+import json
+
+import pytest
+
+from Blackjack.player import Player, load_player, save_player
+from Blackjack.player_store import JsonPlayerStore
+from Blackjack.sharded_store import MANIFEST_NAME, ShardedPlayerStore, main, migrate_flat, shard_key
+
+
+class TestShardedPlayerStore:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.tmp_path = tmp_path
+        self.root = tmp_path / "players"
+        self.store = ShardedPlayerStore(self.root)
+        yield
+        self.store.close()
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_file_is_placed_by_hash(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 500))
+        key = shard_key("  ALICE ")
+        path = self.root / key[:2] / key[2:4] / f"{key}.blackjack"
+        assert self.store.path_for("alice") == path
+        assert load_player(path).name == "Alice"
+
+    def test_unsafe_names_are_stored(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("../../etc/passwd", 5))
+        assert self.store.load("../../etc/passwd").bankroll == 5
+        assert self.store.path_for("../../etc/passwd").is_relative_to(self.root)
+
+    def test_manifest_records_layout(self, class_setup, method_setup):
+        with open(self.root / MANIFEST_NAME) as file:
+            assert json.load(file)["depth"] == 2
+        deep = ShardedPlayerStore(self.tmp_path / "deep", depth=3)
+        deep.save(Player.from_name_bankroll("Bob", 1))
+        reopened = ShardedPlayerStore(self.tmp_path / "deep")
+        assert reopened.depth == 3
+        assert reopened.load("Bob").bankroll == 1
+        assert reopened.names() == ["Bob"]
+        with pytest.raises(ValueError):
+            ShardedPlayerStore(self.tmp_path / "deep", depth=2)
+
+    def test_bad_manifest_and_depth(self, class_setup, method_setup):
+        other = self.tmp_path / "other"
+        other.mkdir()
+        (other / MANIFEST_NAME).write_text('{"format": "something else"}')
+        with pytest.raises(ValueError):
+            ShardedPlayerStore(other)
+        with pytest.raises(ValueError):
+            ShardedPlayerStore(self.tmp_path / "flat", depth=0)
+
+    def test_migrate_flat(self, class_setup, method_setup):
+        flat = self.tmp_path / "flat"
+        flat.mkdir()
+        players = [Player.from_name_bankroll(f"Player {index}", index) for index in range(7)]
+        JsonPlayerStore(flat).save_many(players)
+        assert migrate_flat(flat, self.store, batch_size=3) == 7
+        assert self.store.names() == [player.name for player in players]
+        assert self.store.load("player 6") == players[6]
+        assert len(list(flat.glob("*.blackjack"))) == 7
+        assert migrate_flat(flat, self.store, remove=True) == 7
+        assert not list(flat.glob("*.blackjack"))
+        assert len(self.store.names()) == 7
+
+    def test_main(self, class_setup, method_setup, capsys):
+        flat = self.tmp_path / "flat"
+        flat.mkdir()
+        save_player(Player.from_name_bankroll("Carol", 42), flat / "carol.blackjack")
+        assert main(["migrate", str(flat), str(self.tmp_path / "migrated")]) == 0
+        assert "Migrated 1 players" in capsys.readouterr().out
+        assert ShardedPlayerStore(self.tmp_path / "migrated").load("Carol").bankroll == 42
+        assert main(["migrate", str(flat), str(self.tmp_path / "migrated"), "--depth", "3"]) == 1
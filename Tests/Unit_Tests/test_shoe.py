@@ -0,0 +1,115 @@
+"""
+FILENAME: test_shoe.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for shoe.py, and for playing many hands from one shoe through Game
+"""
+
+import collections
+import random
+
+import pytest
+
+from Blackjack import card
+from Blackjack.game import Game
+from Blackjack.player import Player
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.probability import card_rank, remove_rank, shoe_composition
+from Blackjack.shoe import Shoe
+
+
+class TestShoe:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.shoe = Shoe(decks=6, penetration=0.75, rng=random.Random(1))
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_shoe_composition(self, class_setup, method_setup):
+        assert len(self.shoe) == 312
+        dealt = collections.Counter(self.shoe.deal() for _ in range(312))
+        assert len(self.shoe) == 0
+        assert set(dealt) == set(card.DECK)
+        assert all(count == 6 for count in dealt.values())
+
+    def test_composition_counts_undealt_cards(self, class_setup, method_setup):
+        assert self.shoe.composition() == shoe_composition(6)
+        dealt = self.shoe.deal()
+        assert self.shoe.composition() == remove_rank(shoe_composition(6), card_rank(dealt))
+
+    def test_empty_shoe_raises(self, class_setup, method_setup):
+        single = Shoe(decks=1, penetration=1.0)
+        for _ in range(52):
+            single.deal()
+        with pytest.raises(IndexError):
+            single.deal()
+        with pytest.raises(IndexError):
+            single.pop()
+
+    def test_empty_shoe_deals_discards(self, class_setup, method_setup):
+        single = Shoe(decks=1, penetration=1.0, rng=random.Random(3))
+        discards = [single.deal() for _ in range(50)]
+        single.start_hand()
+        in_play = [single.deal() for _ in range(2)]
+        # The shoe is empty part way through the hand, so the discards are shuffled and dealt
+        dealt = [single.deal() for _ in range(50)]
+        assert sorted(dealt, key=card.DECK.index) == sorted(discards, key=card.DECK.index)
+        assert not set(in_play) & set(dealt)
+        with pytest.raises(IndexError):
+            single.deal()
+
+    def test_start_hand_shuffles_at_cut_card(self, class_setup, method_setup):
+        for _ in range(234):
+            self.shoe.deal()
+        self.shoe.start_hand()
+        assert len(self.shoe) == 312
+
+    def test_pop_and_popleft_deal(self, class_setup, method_setup):
+        assert isinstance(self.shoe.pop(), card.Card)
+        assert isinstance(self.shoe.popleft(), card.Card)
+        assert len(self.shoe) == 310
+
+    def test_cut_card(self, class_setup, method_setup):
+        for _ in range(233):
+            self.shoe.deal()
+        assert not self.shoe.cut_card_reached()
+        self.shoe.deal()
+        assert self.shoe.cut_card_reached()
+        self.shoe.shuffle()
+        assert not self.shoe.cut_card_reached()
+        assert len(self.shoe) == 312
+
+    def test_seeded_shoes_match(self, class_setup, method_setup):
+        other = Shoe(decks=6, penetration=0.75, rng=random.Random(1))
+        assert [self.shoe.deal() for _ in range(20)] == [other.deal() for _ in range(20)]
+
+    @pytest.mark.parametrize(
+        "decks,penetration", [(0, 0.75), (-1, 0.75), (6, 0), (6, 1.5), (6, -0.2)]
+    )
+    def test_invalid_configuration(self, decks, penetration, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            Shoe(decks, penetration)
+
+    def test_game_reshuffles_at_cut_card(self, class_setup, method_setup):
+        shoe = Shoe(decks=1, penetration=0.5, rng=random.Random(7))
+        player = Player.from_name_bankroll("Bot", 1000)
+        game = Game(player, deck=shoe, policy=DealerMimicPolicy())
+        for _ in range(200):
+            game.new_hand()
+            assert len(shoe) > 0
+        assert game.deck is shoe
+
+    def test_full_penetration_shoe_never_runs_dry(self, class_setup, method_setup):
+        shoe = Shoe(decks=1, penetration=1.0, rng=random.Random(11))
+        game = Game(Player.from_name_bankroll("Bot", 10**6), deck=shoe, policy=DealerMimicPolicy())
+        for _ in range(500):
+            game.new_hand()
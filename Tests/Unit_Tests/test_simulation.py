@@ -0,0 +1,79 @@
+"""
+FILENAME: test_simulation.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for simulation.py tallies, seeding and the parallel runner
+"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.result import Result
+from Blackjack.simulation import SimulationResult, simulate, simulate_parallel
+
+
+class TestSimulation:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request):
+        print(f"Setting up method: {request.function.__name__}")
+        self.policy = DealerMimicPolicy()
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_merge_matches_single_tally(self, class_setup, method_setup):
+        outcomes = [(Result.VICTORY, 2), (Result.DEFEAT, -1), (Result.PUSH, 0), (Result.DEFEAT, -2)]
+        whole = SimulationResult()
+        first = SimulationResult()
+        second = SimulationResult()
+        for index, outcome in enumerate(outcomes):
+            whole.record(*outcome)
+            (first if index < 2 else second).record(*outcome)
+        first.merge(second)
+        assert first.hands == whole.hands
+        assert first.counts == whole.counts
+        assert first.mean == whole.mean
+        assert first.variance == pytest.approx(whole.variance)
+
+    def test_seeded_simulation_repeats(self, class_setup, method_setup):
+        first = simulate(self.policy, 300, rng=random.Random(11))
+        second = simulate(self.policy, 300, rng=random.Random(11))
+        assert first.counts == second.counts
+        assert first.net_total == second.net_total
+
+    def test_parallel_plays_every_hand(self, class_setup, method_setup):
+        tally = simulate_parallel(self.policy, 1001, workers=2, seed=3)
+        assert tally.hands == 1001
+        assert sum(tally.counts.values()) == 1001
+
+    def test_parallel_is_reproducible(self, class_setup, method_setup):
+        first = simulate_parallel(self.policy, 600, workers=2, seed=8)
+        second = simulate_parallel(self.policy, 600, workers=2, seed=8)
+        assert first.counts == second.counts
+        assert first.net_square_total == second.net_square_total
+
+    def test_parallel_invalid_workers(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            simulate_parallel(self.policy, 10, workers=0)
+
+    def test_simulate_does_not_need_numpy(self, class_setup, method_setup):
+        # NumPy is hidden from a fresh interpreter, which must still be able to run a simulation in one process
+        code = (
+            "import random, sys; sys.modules['numpy'] = None\n"
+            "from Blackjack.policy import DealerMimicPolicy\n"
+            "from Blackjack.simulation import simulate\n"
+            "assert simulate(DealerMimicPolicy(), 50, rng=random.Random(1)).hands == 50"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
@@ -0,0 +1,116 @@
+"""
+FILENAME: test_strategy.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for expected_value.py and the basic strategy table in strategy.py
+"""
+
+import random
+
+import pytest
+
+from Blackjack import card, hand
+from Blackjack.expected_value import PlayerState, move_values
+from Blackjack.game import Game
+from Blackjack.move import Move
+from Blackjack.player import Player
+from Blackjack.probability import RANKS
+from Blackjack.shoe import Shoe
+from Blackjack.strategy import (
+    BasicStrategyPolicy,
+    basic_strategy,
+    load_basic_strategy,
+    save_basic_strategy,
+)
+from Blackjack.suit import Suit
+from Blackjack.value import Value
+
+
+class TestStrategy:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, mocker):
+        print(f"Setting up method: {request.function.__name__}")
+        self.fake_input = mocker.patch("builtins.input")
+        self.fake_print = mocker.patch("builtins.print")
+        self.policy = BasicStrategyPolicy()
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def make_hand(self, *values):
+        my_hand = hand.Hand()
+        for value in values:
+            my_hand.add_card(card.Card(Suit.SPADES, value))
+        return my_hand
+
+    def test_natural_stand_value(self, class_setup, method_setup):
+        # A natural only fails to win against a dealer natural, which is a push
+        values = move_values(PlayerState(11, True, True), 10)
+        assert values[Move.STAND] == pytest.approx(1 - 1 / 13)
+
+    def test_double_is_twice_a_one_card_hit(self, class_setup, method_setup):
+        # Hard 20 doubled can only improve by an ace; the value is never better than standing
+        values = move_values(PlayerState(20, False, False), 6)
+        assert values[Move.DOUBLE_DOWN] < values[Move.STAND]
+        assert Move.DOUBLE_DOWN not in move_values(PlayerState(20, False, False), 6, can_double=False)
+
+    def test_table_is_complete(self, class_setup, method_setup):
+        table = basic_strategy()
+        for upcard in RANKS:
+            for total in range(4, 22):
+                assert (total, False, upcard) in table
+            for total in range(12, 22):
+                assert (total, True, upcard) in table
+        assert all(without_double != Move.DOUBLE_DOWN for _, without_double in table.values())
+
+    @pytest.mark.parametrize("total,soft,upcard", [(11, False, 6), (16, False, 10), (18, True, 9), (13, False, 2)])
+    def test_table_matches_expected_values(self, total, soft, upcard, class_setup, method_setup):
+        values = move_values(PlayerState(total - 10 if soft else total, soft, False), upcard)
+        best, without_double = basic_strategy()[(total, soft, upcard)]
+        assert best == max(values, key=values.get)
+        values.pop(Move.DOUBLE_DOWN)
+        assert without_double == max(values, key=values.get)
+
+    def test_save_load_round_trip(self, class_setup, method_setup, tmp_path):
+        path = tmp_path / "strategy.json"
+        save_basic_strategy(basic_strategy(), path)
+        assert load_basic_strategy(path) == basic_strategy()
+
+    def test_policy_respects_double_limit(self, class_setup, method_setup):
+        eleven = self.make_hand(Value.FIVE, Value.SIX)
+        upcard = card.Card(Suit.HEARTS, Value.SIX)
+        assert self.policy.decide(eleven, upcard, True) == Move.DOUBLE_DOWN
+        assert self.policy.decide(eleven, upcard, False) == Move.HIT
+
+    def test_policy_stands_on_hard_seventeen(self, class_setup, method_setup):
+        seventeen = self.make_hand(Value.TEN, Value.SEVEN)
+        for value in Value:
+            assert self.policy.decide(seventeen, card.Card(Suit.CLUBS, value), True) == Move.STAND
+
+    def test_policy_needs_upcard(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            self.policy.decide(self.make_hand(Value.TEN, Value.TWO), None, True)
+
+    def test_policy_plays_headless_game(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Bot", 1000)
+        game = Game(player, deck=Shoe(rng=random.Random(4)), policy=self.policy)
+        for _ in range(50):
+            result, net_change = game.new_hand()
+            assert abs(net_change) <= 2
+        assert self.fake_input.call_count == 0
+
+    def test_player_policy_sees_upcard_in_console_game(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Bot", 1000)
+        player.policy = self.policy
+        game = Game(player, deck=Shoe(rng=random.Random(4)))
+        assert not game.headless
+        for _ in range(20):
+            game.new_hand()
+        assert self.fake_input.call_count == 0
@@ -0,0 +1,153 @@
+"""
+FILENAME: test_table.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for table.py seating, casino order dealing and settling every seat
+"""
+
+import collections
+import random
+
+import pytest
+
+from Blackjack.card import Card
+from Blackjack.dealer import Dealer
+from Blackjack.game import Game
+from Blackjack.hand_history import HandHistoryWriter, read_hand_history
+from Blackjack.move import Move
+from Blackjack.player import Player
+from Blackjack.policy import DealerMimicPolicy
+from Blackjack.result import Result
+from Blackjack.shoe import Shoe
+from Blackjack.suit import Suit
+from Blackjack.table import MAX_SEATS, Table
+from Blackjack.value import Value
+
+
+def make_player(name: str, bankroll: int = 1000) -> Player:
+    return Player(Player.from_name_bankroll(name, bankroll).stats, DealerMimicPolicy())
+
+
+def stacked_deck(*values: Value) -> collections.deque:
+    """
+    :param values: the values of the cards in the order they are dealt with pop()
+    :return: a deck that deals the cards in that order
+    """
+    return collections.deque(Card(Suit.SPADES, value) for value in reversed(values))
+
+
+class TestTable:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.tmp_path = tmp_path
+        self.players = [make_player(f"Seat {index}") for index in range(3)]
+        yield
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_seats_up_to_seven(self, class_setup, method_setup):
+        table = Table([make_player(f"Seat {index}") for index in range(MAX_SEATS)])
+        assert len(table.seats) == MAX_SEATS
+        with pytest.raises(ValueError):
+            table.sit(make_player("One Too Many"))
+
+    def test_player_needs_policy(self, class_setup, method_setup):
+        with pytest.raises(ValueError):
+            Table([Player.from_name_bankroll("Console", 100)])
+
+    def test_sit_twice_and_leave(self, class_setup, method_setup):
+        table = Table(self.players)
+        with pytest.raises(ValueError):
+            table.sit(self.players[0])
+        table.leave(self.players[1])
+        assert table.seats == [self.players[0], self.players[2]]
+        with pytest.raises(ValueError):
+            table.leave(self.players[1])
+
+    def test_deals_in_casino_order(self, class_setup, method_setup):
+        # Seat 0 gets 10 and 9, seat 1 gets 9 and 8, seat 2 gets 8 and 7 and the dealer gets 7 and 10
+        deck = stacked_deck(
+            Value.TEN, Value.NINE, Value.EIGHT, Value.SEVEN,
+            Value.NINE, Value.EIGHT, Value.SEVEN, Value.TEN,
+        )
+        table = Table(self.players, deck=deck)
+        table._deal(self.players)
+        assert [player.hand.get_total() for player in self.players] == [19, 17, 15]
+        assert table.dealer.hand.get_total() == 17
+        assert not deck
+
+    def test_settles_every_seat(self, class_setup, method_setup):
+        # Seat 2 hits its 15 to 17 and the dealer stands on 17, so 19 wins and both 17s push
+        deck = stacked_deck(
+            Value.TEN, Value.NINE, Value.EIGHT, Value.SEVEN,
+            Value.NINE, Value.EIGHT, Value.SEVEN, Value.TEN,
+            Value.TWO,
+        )
+        table = Table(self.players, deck=deck)
+        results = table.play_round()
+        assert [(player, result) for player, result, _ in results] == [
+            (self.players[0], Result.VICTORY),
+            (self.players[1], Result.PUSH),
+            (self.players[2], Result.PUSH),
+        ]
+        assert [net_change for _, _, net_change in results] == [1, 0, 0]
+        assert all(player.hand is None for player in self.players)
+        assert table.dealer.hand is None
+
+    def test_broke_seat_sits_out(self, class_setup, method_setup):
+        broke = make_player("Broke", 0)
+        table = Table([broke] + self.players, deck=Shoe(rng=random.Random(5)))
+        results = table.play_round()
+        assert [player for player, _, _ in results] == self.players
+        assert broke.hand is None
+
+    def test_empty_table_plays_nothing(self, class_setup, method_setup):
+        deck = Shoe(rng=random.Random(5))
+        remaining = len(deck)
+        assert Table(deck=deck).play_round() == []
+        assert len(deck) == remaining
+
+    def test_one_seat_matches_game(self, class_setup, method_setup):
+        game = Game(make_player("Game"), Dealer(), Shoe(rng=random.Random(9)), DealerMimicPolicy())
+        table = Table([make_player("Table")], deck=Shoe(rng=random.Random(9)))
+        for _ in range(500):
+            _, result, net_change = table.play_round()[0]
+            assert game.new_hand() == (result, net_change)
+
+    def test_seven_seats_share_one_shoe(self, class_setup, method_setup):
+        players = [make_player(f"Seat {index}") for index in range(MAX_SEATS)]
+        shoe = Shoe(decks=1, rng=random.Random(2))
+        table = Table(players, deck=shoe)
+        before = len(shoe)
+        results = table.play_round()
+        dealt = before - len(shoe)
+        assert len(results) == MAX_SEATS
+        assert dealt >= 2 * (MAX_SEATS + 1)
+
+    def test_full_table_plays_many_rounds(self, class_setup, method_setup):
+        players = [make_player(f"Seat {index}") for index in range(MAX_SEATS)]
+        table = Table(players)
+        assert isinstance(table.deck, Shoe)
+        for _ in range(200):
+            assert len(table.play_round()) == MAX_SEATS
+
+    def test_records_every_seat(self, class_setup, method_setup):
+        path = self.tmp_path / "table.bjhh"
+        with HandHistoryWriter(path) as writer:
+            table = Table(self.players, deck=Shoe(rng=random.Random(4)), history=writer)
+            outcomes = [outcome for _ in range(50) for outcome in table.play_round()]
+        records = read_hand_history(path)
+        assert len(records) == 150
+        assert list(records["result"]) == [result.value for _, result, _ in outcomes]
+        assert list(records["net_change"]) == [net_change for _, _, net_change in outcomes]
+        for record in records:
+            moves = [Move(move) for move in record["moves"][: record["move_count"]]]
+            assert record["player_cards"] == 2 + sum(move != Move.STAND for move in moves)
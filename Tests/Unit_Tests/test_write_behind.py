@@ -0,0 +1,119 @@
+"""
+FILENAME: test_write_behind.py
+
+AUTHOR: Channing
+CREATED ON: 10/18/2026
+
+Tests for write_behind.py
+"""
+
+import gc
+import weakref
+from unittest.mock import MagicMock
+
+import pytest
+
+from Blackjack.player import Player
+from Blackjack.player_store import SQLitePlayerStore
+from Blackjack.write_behind import WriteBehindStore
+
+
+class TestWriteBehindStore:
+    @pytest.fixture(scope="class")
+    def class_setup(self, request):
+        print(f"Setting up class: {request.cls.__name__}")
+        yield
+        print(f"Tearing down class: {request.cls.__name__}")
+
+    @pytest.fixture
+    def method_setup(self, request, tmp_path):
+        print(f"Setting up method: {request.function.__name__}")
+        self.now = 0.0
+        self.inner = SQLitePlayerStore(tmp_path / "players.db")
+        self.inner.save_many = MagicMock(wraps=self.inner.save_many)
+        self.store = WriteBehindStore(self.inner, max_dirty=3, max_delay=10.0, clock=lambda: self.now)
+        yield
+        self.store.close()
+        print(f"Tearing down method: {request.function.__name__}")
+
+    def test_save_is_buffered(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 500))
+        assert self.store.dirty == 1
+        assert "Alice" not in self.inner
+        self.inner.save_many.assert_not_called()
+
+    def test_load_sees_buffered_save(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 500)
+        self.store.save(player)
+        player.bankroll = 0
+        assert self.store.load("ALICE").bankroll == 500
+        assert "alice" in self.store
+        assert self.store.names() == ["Alice"]
+
+    def test_load_falls_through_to_store(self, class_setup, method_setup):
+        self.inner.save(Player.from_name_bankroll("Bob", 200))
+        assert self.store.load("Bob").bankroll == 200
+        assert self.store.names() == ["Bob"]
+        with pytest.raises(KeyError):
+            self.store.load("Nobody")
+
+    def test_resaves_share_one_slot(self, class_setup, method_setup):
+        player = Player.from_name_bankroll("Alice", 500)
+        for bankroll in (400, 300, 200):
+            player.bankroll = bankroll
+            self.store.save(player)
+        assert self.store.dirty == 1
+        self.inner.save_many.assert_not_called()
+
+    def test_flush_when_enough_are_dirty(self, class_setup, method_setup):
+        self.store.save_many(Player.from_name_bankroll(name, 100) for name in ("Alice", "Bob", "Carol"))
+        assert self.store.dirty == 0
+        self.inner.save_many.assert_called_once()
+        assert self.inner.names() == ["Alice", "Bob", "Carol"]
+
+    def test_flush_when_oldest_is_too_old(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 100))
+        self.now = 9.0
+        self.store.save(Player.from_name_bankroll("Bob", 100))
+        assert self.store.dirty == 2
+        self.now = 10.0
+        self.store.save(Player.from_name_bankroll("Alice", 150))
+        assert self.store.dirty == 0
+        assert self.inner.load("Alice").bankroll == 150
+
+    def test_read_flushes_when_oldest_is_too_old(self, class_setup, method_setup):
+        self.store.save(Player.from_name_bankroll("Alice", 100))
+        assert self.store.load("Alice").bankroll == 100
+        assert self.store.dirty == 1
+        self.now = 10.0
+        assert "Bob" not in self.store
+        assert self.store.dirty == 0
+        assert self.inner.load("Alice").bankroll == 100
+
+    def test_unclosed_store_flushes_when_collected(self, class_setup, method_setup):
+        store = WriteBehindStore(self.inner)
+        store.save(Player.from_name_bankroll("Alice", 250))
+        collected = weakref.ref(store)
+        del store
+        gc.collect()
+        # Nothing else keeps the store alive, and its dirty player is written as it goes
+        assert collected() is None
+        assert self.inner.load("Alice").bankroll == 250
+
+    def test_close_detaches_finalizer(self, class_setup, method_setup):
+        store = WriteBehindStore(SQLitePlayerStore(":memory:"))
+        assert store._finalizer.alive
+        store.close()
+        assert not store._finalizer.alive
+
+    def test_close_flushes(self, class_setup, method_setup, tmp_path):
+        self.store.save(Player.from_name_bankroll("Alice", 500))
+        self.store.close()
+        with SQLitePlayerStore(tmp_path / "players.db") as reopened:
+            assert reopened.load("Alice").bankroll == 500
+        self.store = WriteBehindStore(SQLitePlayerStore(":memory:"))
+
+    @pytest.mark.parametrize("max_dirty, max_delay", [(0, 1.0), (1, -1.0)])
+    def test_bad_thresholds(self, class_setup, method_setup, max_dirty, max_delay):
+        with pytest.raises(ValueError):
+            WriteBehindStore(self.inner, max_dirty=max_dirty, max_delay=max_delay)